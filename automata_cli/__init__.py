@@ -0,0 +1,10 @@
+"""
+🤖 Headless Entry Point for Automata Theory Toolkit
+===================================================
+Command-line access to the engines without the Streamlit app. Nothing
+in this package imports streamlit, graphviz or pandas, and engine
+modules are imported only by the commands that need them.
+
+Run with:
+    python -m automata_cli --help
+"""
@@ -0,0 +1,241 @@
+"""
+🤖 Command-line entry point: python -m automata_cli
+
+Commands:
+    simulate  Test strings against a DFA file or a regex
+    minimize  Minimize a DFA file
+    equiv     Check whether two DFA files accept the same language
+    compile   Turn a regex or a keyword list into a DFA file
+    groups    Print the capture-group spans of a regex on each string
+    serve     Run the local HTTP/JSON matching service
+    bench     Run the benchmark suite (same options as python -m benchmarks)
+"""
+
+import argparse
+import sys
+
+from automata_cli import files
+from engines.BUDGET import Budget, BudgetExceeded
+
+
+def _budget(args):
+    """Budget from --max-states / --max-seconds, or None if neither is given"""
+    if args.max_states is None and args.max_seconds is None:
+        return None
+    return Budget(max_states=args.max_states, max_seconds=args.max_seconds)
+
+
+def _automaton(args):
+    """DFA from a DFA file or, with --regex, from a regex"""
+    if args.regex is not None:
+        from engines.REGEX import regex_to_nfa
+
+        budget = _budget(args)
+        return regex_to_nfa(args.regex, budget=budget).to_dfa(budget=budget)
+    if args.dfa is None:
+        raise ValueError("Give a DFA file or --regex")
+    return files.load_dfa(args.dfa)
+
+
+def _read_lines(path):
+    """Input strings, one per line, from a file or standard input"""
+    if path == "-":
+        return sys.stdin.read().splitlines()
+    with open(path, encoding="utf-8") as handle:
+        return handle.read().splitlines()
+
+
+def cmd_simulate(args):
+    """Print accept/reject per string; exit 1 if any string is rejected"""
+    from engines.REGEX import REPETITION
+
+    strings = list(args.strings)
+    if args.regex is not None and args.dfa is not None:
+        # With --regex there is no DFA file: the first positional is a string too
+        strings.insert(0, args.dfa)
+        args.dfa = None
+    if args.input is not None:
+        strings.extend(_read_lines(args.input))
+    if args.regex is not None and REPETITION.search(args.regex):
+        # Unrolling {m,n} (and determinizing the copies) can blow up;
+        # the counting automaton stays the size of the regex
+        from engines.COUNTING import regex_to_counting_nfa
+
+        automaton = regex_to_counting_nfa(args.regex, budget=_budget(args))
+        results = [automaton.simulate(string) for string in strings]
+    else:
+        results = _automaton(args).compile().simulate_batch(strings)
+    for string, accepted in zip(strings, results):
+        if not args.quiet:
+            print(f"{'accept' if accepted else 'reject'}\t{string}")
+    return 0 if all(results) else 1
+
+
+def cmd_minimize(args):
+    """Write the minimized DFA as JSON"""
+    from engines import STATS
+
+    dfa = files.load_dfa(args.dfa)
+    stats = STATS.Stats() if args.stats else None
+    minimized = dfa.minimize(stats=stats, budget=_budget(args))
+    if args.canonical:
+        minimized = minimized.canonical("S")
+    files.save_dfa(minimized, args.output)
+    if stats is not None:
+        print(f"{len(dfa.states)} -> {len(minimized.states)} states, {stats.as_dict()}", file=sys.stderr)
+    return 0
+
+
+def cmd_equiv(args):
+    """Print whether two DFAs are equivalent (with a witness if not); exit 1 if not"""
+    first = files.load_dfa(args.first)
+    second = files.load_dfa(args.second)
+    if first.is_equivalent(second, budget=_budget(args)):
+        print("equivalent")
+        return 0
+    from engines.COVERAGE import CoverageCorpus
+
+    mismatches = CoverageCorpus.from_dfa(first).run(second) or CoverageCorpus.from_dfa(second).run(first)
+    if mismatches:
+        string, _, _ = mismatches[0]
+        print(f"not equivalent (first={first.simulate(string)}, second={second.simulate(string)} "
+              f"on {string!r})")
+    else:
+        print("not equivalent")
+    return 1
+
+
+def cmd_compile(args):
+    """Write the DFA for a regex or keyword list as JSON"""
+    budget = _budget(args)
+    if args.keywords is not None:
+        from engines.AHOCORASICK import AhoCorasick
+
+        dfa = AhoCorasick(line for line in _read_lines(args.keywords) if line).to_dfa()
+    elif args.regex is not None:
+        from engines.REGEX import regex_to_nfa
+
+        dfa = regex_to_nfa(args.regex, budget=budget).to_dfa(budget=budget)
+    else:
+        raise ValueError("Give a regex or --keywords")
+    if args.minimize:
+        dfa = dfa.minimize(budget=budget).canonical("S")
+    files.save_dfa(dfa, args.output)
+    return 0
+
+
+def cmd_groups(args):
+    """Print group spans per string (start-end, or - if unset); exit 1 if any string is rejected"""
+    from engines.CAPTURE import regex_to_program
+
+    program = regex_to_program(args.regex, budget=_budget(args))
+    strings = list(args.strings)
+    if args.input is not None:
+        strings.extend(_read_lines(args.input))
+    status = 0
+    for string in strings:
+        spans = program.match(string)
+        if spans is None:
+            status = 1
+            print(f"reject\t{string}")
+            continue
+        groups = " ".join(f"{number}:{span[0]}-{span[1]}" if span is not None else f"{number}:-"
+                          for number, span in enumerate(spans))
+        print(f"match\t{string}\t{groups}")
+    return status
+
+
+def cmd_serve(args):
+    """Run the HTTP service until interrupted"""
+    from automata_cli.server import serve
+
+    serve(args.host, args.port, args.workers, args.verbose)
+    return 0
+
+
+def build_parser():
+    """
+    🧰 Build the argument parser
+
+    Returns:
+        argparse.ArgumentParser: Parser with one subcommand per command
+    """
+    parser = argparse.ArgumentParser(prog="python -m automata_cli",
+                                     description="Automata toolkit without the web app.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def limits(sub):
+        sub.add_argument("--max-states", type=int, help="Abort if an automaton grows past this many states")
+        sub.add_argument("--max-seconds", type=float, help="Abort if the command runs longer than this")
+
+    sub = commands.add_parser("simulate", help="Test strings against a DFA or regex")
+    sub.add_argument("dfa", nargs="?", help="DFA JSON file ('-' for stdin)")
+    sub.add_argument("strings", nargs="*", help="Strings to test")
+    sub.add_argument("-r", "--regex", help="Use this regex instead of a DFA file")
+    sub.add_argument("-i", "--input", help="Read more strings, one per line, from this file ('-' for stdin)")
+    sub.add_argument("-q", "--quiet", action="store_true", help="Only set the exit status")
+    limits(sub)
+    sub.set_defaults(handler=cmd_simulate)
+
+    sub = commands.add_parser("minimize", help="Minimize a DFA")
+    sub.add_argument("dfa", help="DFA JSON file ('-' for stdin)")
+    sub.add_argument("-o", "--output", help="Output file (default: stdout)")
+    sub.add_argument("--canonical", action="store_true", help="Rename states S0, S1, ... in BFS order")
+    sub.add_argument("--stats", action="store_true", help="Print algorithm counters to stderr")
+    limits(sub)
+    sub.set_defaults(handler=cmd_minimize)
+
+    sub = commands.add_parser("equiv", help="Check two DFAs for equivalence")
+    sub.add_argument("first", help="First DFA JSON file")
+    sub.add_argument("second", help="Second DFA JSON file")
+    limits(sub)
+    sub.set_defaults(handler=cmd_equiv)
+
+    sub = commands.add_parser("compile", help="Compile a regex or keyword list into a DFA")
+    sub.add_argument("regex", nargs="?", help="Regex using symbols, |, * and ()")
+    sub.add_argument("-k", "--keywords", help="Keyword file, one per line ('-' for stdin)")
+    sub.add_argument("-m", "--minimize", action="store_true", help="Minimize the result")
+    sub.add_argument("-o", "--output", help="Output file (default: stdout)")
+    limits(sub)
+    sub.set_defaults(handler=cmd_compile)
+
+    sub = commands.add_parser("groups", help="Print capture-group spans of a regex")
+    sub.add_argument("regex", help="Regex; every (...) group captures, numbered as in Python's re")
+    sub.add_argument("strings", nargs="*", help="Strings to match in full")
+    sub.add_argument("-i", "--input", help="Read more strings, one per line, from this file ('-' for stdin)")
+    limits(sub)
+    sub.set_defaults(handler=cmd_groups)
+
+    sub = commands.add_parser("serve", help="Run the local HTTP/JSON matching service")
+    sub.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    sub.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    sub.add_argument("--workers", type=int, help="Processes for building automata (default: CPU count)")
+    sub.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    sub.set_defaults(handler=cmd_serve)
+
+    # Handled in main(): everything after "bench" goes to python -m benchmarks
+    commands.add_parser("bench", help="Run the benchmark suite (see python -m benchmarks --help)")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["bench"]:
+        # argparse would try to read the benchmark options itself
+        from benchmarks.__main__ import main as bench_main
+
+        return bench_main(argv[1:])
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BudgetExceeded as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 3
+    except (ValueError, TypeError, OSError) as e:
+        # Exit 1 means "rejected" / "not equivalent", so errors never use it
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
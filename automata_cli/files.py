@@ -0,0 +1,122 @@
+"""
+📄 DFA Files
+============
+DFAs are stored as JSON objects with the same keys as
+DFA.get_visual_representation(): states, alphabet, start_state,
+accept_states and transitions (state -> symbol -> state).
+"""
+
+import json
+import sys
+
+
+def load_dfa(path):
+    """
+    📥 Read a DFA from a JSON file
+
+    Args:
+        path: File path, or "-" for standard input
+
+    Returns:
+        DFA: The loaded DFA
+
+    Raises:
+        ValueError: If the file is not valid JSON or not a DFA object
+    """
+    if path == "-":
+        text = sys.stdin.read()
+    else:
+        with open(path, encoding="utf-8") as handle:
+            text = handle.read()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path}: not valid JSON ({e})")
+    try:
+        return dfa_from_dict(data)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}")
+
+
+def dfa_from_dict(data):
+    """
+    📥 Build a DFA from a decoded JSON object
+
+    Args:
+        data: dict with states, alphabet, start_state, accept_states and
+              transitions (state -> symbol -> state)
+
+    Returns:
+        DFA: The DFA
+
+    Raises:
+        ValueError: If a key is missing, or a field or any state, symbol
+                    or transition target has the wrong JSON type
+    """
+    from engines.DFA import DFA
+
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    try:
+        for key in ("states", "alphabet", "accept_states"):
+            if not isinstance(data[key], list):
+                raise ValueError(f"{key!r} must be a list")
+            for item in data[key]:
+                _check_scalar(f"every item of {key!r}", item)
+        _check_scalar("start_state", data["start_state"])
+        if data["start_state"] not in data["states"]:
+            raise ValueError(f"start_state {json.dumps(data['start_state'])} is not in 'states'")
+        transitions = data["transitions"]
+        if not isinstance(transitions, dict) or not all(isinstance(edges, dict) for edges in transitions.values()):
+            raise ValueError("'transitions' must map states to objects of symbol -> state")
+        for state, edges in transitions.items():
+            for symbol, target in edges.items():
+                _check_scalar(f"transitions[{state!r}][{symbol!r}]", target)
+    except KeyError as e:
+        raise ValueError(f"missing key {e}")
+    return DFA(data["states"], data["alphabet"], data["start_state"],
+               data["accept_states"], transitions)
+
+
+def _check_scalar(where, value):
+    """States and symbols must be JSON strings or numbers"""
+    if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+        raise ValueError(f"{where} must be a string or number, got {json.dumps(value)}")
+
+
+def dfa_to_dict(dfa):
+    """
+    📤 Convert a DFA to a JSON-ready dict with sorted lists
+
+    Args:
+        dfa: DFA instance
+
+    Returns:
+        dict: states, alphabet, start_state, accept_states, transitions
+    """
+    return {
+        "states": sorted(dfa.states, key=str),
+        "alphabet": sorted(dfa.alphabet, key=str),
+        "start_state": dfa.start_state,
+        "accept_states": sorted(dfa.accept_states, key=str),
+        "transitions": {
+            state: dict(sorted(dfa.transitions.get(state, {}).items()))
+            for state in sorted(dfa.transitions, key=str)
+        },
+    }
+
+
+def save_dfa(dfa, path=None):
+    """
+    💾 Write a DFA as JSON
+
+    Args:
+        dfa: DFA instance
+        path: File path, or None / "-" for standard output
+    """
+    text = json.dumps(dfa_to_dict(dfa), indent=2, ensure_ascii=False)
+    if path in (None, "-"):
+        print(text)
+        return
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text + "\n")
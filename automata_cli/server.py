@@ -0,0 +1,505 @@
+"""
+🌐 Local HTTP Matching Service
+==============================
+A small JSON-over-HTTP server (standard library only) that keeps
+compiled automata warm in a shared registry, so many clients can reuse
+one compiled DFA instead of rebuilding it in every process.
+
+Endpoints (all bodies are JSON):
+    GET  /health                     -> {"status": "ok", "automata": n}
+    GET  /automata                   -> {"automata": [info, ...]}
+    GET  /automata/<id>              -> info
+    POST /automata                   {"dfa": {...}} | {"regex": "..."} | {"keywords": [...]}
+                                     optional "minimize": true -> info (with "id")
+    POST /automata/<id>/simulate     {"input": "..."}    -> {"accepted": bool}
+    POST /automata/<id>/simulate_batch {"inputs": [...]} -> {"results": [bool, ...]}
+    POST /automata/<id>/search       {"text": "..."}     -> {"spans": [[start, end], ...]}
+                                     (earliest-end, non-overlapping matches)
+
+Automata are keyed by DFA.canonical_hash() of the built DFA, so the same
+automaton registered twice (even under other state names) shares one
+entry; with "minimize": true, equal languages do. Building automata from regexes or keyword lists runs in a process
+pool; concurrent single-string simulate requests for the same automaton
+are coalesced into one simulate_batch() call. Minimizing and building
+the search scanners (which reverses the DFA) also run in the pool, under
+the same limits.
+
+Run with:
+    python -m automata_cli serve --port 8765
+"""
+
+import hashlib
+import json
+import multiprocessing
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from engines.BUDGET import Budget, BudgetExceeded
+
+MAX_AUTOMATA = 256
+MAX_BODY_BYTES = 64 * 1024 * 1024
+BATCH_WINDOW = 0.002  # seconds a batch leader waits for more requests
+MAX_BATCH = 4096
+
+# Limits for automata built on behalf of a client
+MAX_STATES = 200_000
+MAX_SECONDS = 60
+
+
+# ===============================================================
+# ⚙️ WORKER SIDE
+# ===============================================================
+def build_dfa(kind, source, minimize=False):
+    """
+    🏗️ Build a DFA from a request body (runs in a pool worker)
+
+    Args:
+        kind: "dfa", "regex" or "keywords"
+        source: DFA dict, regex string or list of keywords
+        minimize: Minimize the result
+
+    Returns:
+        DFA: The built DFA
+
+    Raises:
+        ValueError: If the source is invalid
+        BudgetExceeded: If the build exceeds the service limits
+    """
+    budget = Budget(max_states=MAX_STATES, max_seconds=MAX_SECONDS)
+    if kind == "dfa":
+        from automata_cli.files import dfa_from_dict
+
+        try:
+            dfa = dfa_from_dict(source)
+        except ValueError as e:
+            raise ValueError(f"Invalid DFA: {e}")
+    elif kind == "regex":
+        from engines.REGEX import regex_to_nfa
+
+        dfa = regex_to_nfa(source, budget=budget).to_dfa(budget=budget)
+    elif kind == "keywords":
+        from engines.AHOCORASICK import AhoCorasick
+
+        dfa = AhoCorasick(source).to_dfa()
+    else:
+        raise ValueError(f"Unknown automaton kind: {kind}")
+    if minimize:
+        dfa = dfa.minimize(budget=budget)
+    return dfa
+
+
+def build_searcher(dfa):
+    """
+    🔎 Build the SEARCH.Searcher of a DFA (runs in a pool worker)
+
+    Args:
+        dfa: DFA of the pattern language
+
+    Returns:
+        Searcher: Forward and backward scanners
+
+    Raises:
+        BudgetExceeded: If reversing the DFA exceeds the service limits
+    """
+    from engines.SEARCH import Searcher
+
+    return Searcher(dfa, budget=Budget(max_states=MAX_STATES, max_seconds=MAX_SECONDS))
+
+
+# ===============================================================
+# 📚 REGISTRY
+# ===============================================================
+class Entry:
+    """
+    📚 One registered automaton
+
+    Attributes:
+        id: canonical_hash() of the DFA
+        dfa: The DFA
+        compiled: Its CompiledDFA
+    """
+
+    def __init__(self, dfa):
+        self.id = dfa.canonical_hash()
+        self.dfa = dfa
+        self.compiled = dfa.compile()
+        self._searcher = None
+        self._lock = threading.Lock()
+
+    def searcher(self, executor):
+        """
+        🔎 SEARCH.Searcher, built on first use
+
+        Args:
+            executor: Pool the build runs in
+
+        Raises:
+            BudgetExceeded: If the build exceeds the service limits
+        """
+        with self._lock:
+            if self._searcher is None:
+                self._searcher = executor.submit(build_searcher, self.dfa).result()
+            return self._searcher
+
+    def info(self):
+        """dict: Summary returned by the API"""
+        return {
+            "id": self.id,
+            "states": self.compiled.num_states,
+            "alphabet": list(self.compiled.symbols),
+            "accepting": sum(self.compiled.accepting),
+        }
+
+
+class Registry:
+    """
+    📚 Thread-safe LRU of compiled automata keyed by content hash
+
+    Sources (request bodies) are hashed too, so registering the same
+    regex twice skips the build entirely.
+    """
+
+    def __init__(self, max_workers=None, max_entries=MAX_AUTOMATA):
+        """
+        🔧 Initialize an empty registry (the process pool starts lazily)
+
+        Args:
+            max_workers: Pool size for builds (defaults to the number of CPUs)
+            max_entries: Number of automata kept before evicting the oldest
+        """
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._sources = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._batcher = Batcher()
+
+    def register(self, kind, source, minimize=False):
+        """
+        ➕ Build (or reuse) an automaton
+
+        Args:
+            kind: "dfa", "regex" or "keywords"
+            source: DFA dict, regex string or list of keywords
+            minimize: Minimize before registering
+
+        Returns:
+            Entry: The registered automaton
+
+        Raises:
+            ValueError: If the source is invalid
+            BudgetExceeded: If the build exceeds the service limits
+        """
+        text = json.dumps([kind, source, bool(minimize)], sort_keys=True, default=str)
+        source_key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            known = self._sources.get(source_key)
+            if known in self._entries:
+                self._entries.move_to_end(known)
+                return self._entries[known]
+
+        if kind == "dfa":
+            # Validated in this thread (dfa_from_dict), so a bad body gets a
+            # 400 before any pool job is started
+            dfa = build_dfa(kind, source)
+        if kind != "dfa" or minimize:
+            dfa = self._pool().submit(build_dfa, kind, source, minimize).result()
+        entry = Entry(dfa)
+
+        with self._lock:
+            entry = self._entries.setdefault(entry.id, entry)
+            self._entries.move_to_end(entry.id)
+            self._sources[source_key] = entry.id
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._sources = {k: v for k, v in self._sources.items() if v != evicted}
+        return entry
+
+    def _pool(self):
+        """ProcessPoolExecutor for builds, started on first use"""
+        with self._lock:
+            if self._executor is None:
+                # "spawn" avoids forking a multi-threaded server process
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            return self._executor
+
+    def get(self, automaton_id):
+        """
+        🔍 Look up a registered automaton
+
+        Args:
+            automaton_id: Id returned by register()
+
+        Returns:
+            Entry or None: None if the id is unknown or was evicted
+        """
+        with self._lock:
+            entry = self._entries.get(automaton_id)
+            if entry is not None:
+                self._entries.move_to_end(automaton_id)
+            return entry
+
+    def entries(self):
+        """list: All registered entries, oldest first"""
+        with self._lock:
+            return list(self._entries.values())
+
+    def simulate(self, entry, input_str):
+        """
+        🔄 Simulate one string, batched with concurrent calls
+
+        Args:
+            entry: Entry from get()
+            input_str: Input string
+
+        Returns:
+            bool: True if accepted
+        """
+        return self._batcher.simulate(entry, input_str)
+
+    def search(self, entry, text):
+        """
+        🔎 Find the matches of an automaton in a text
+
+        Earliest-end semantics (see SEARCH.Searcher): scanning left to
+        right, each match is reported as soon as it ends, extended to its
+        leftmost start; matches never overlap and empty ones are skipped.
+        So "ab*" on "abbb" reports (0, 1), not the longest match (0, 4).
+
+        Args:
+            entry: Entry from get()
+            text: Text to scan
+
+        Returns:
+            list: (start, end) spans
+
+        Raises:
+            BudgetExceeded: If building the scanners exceeds the limits
+        """
+        return list(entry.searcher(self._pool()).spans(text))
+
+    def shutdown(self):
+        """🛑 Stop the build workers"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+
+class Batcher:
+    """
+    📦 Coalesce concurrent single-string simulations per automaton
+
+    The first request for an automaton becomes the batch leader: it waits
+    BATCH_WINDOW seconds, takes every pending input for that automaton and
+    runs one simulate_batch(); the other requests just wait for their slot.
+    If simulate_batch() raises, every request of the batch raises the
+    same exception.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._condition = threading.Condition()
+
+    def simulate(self, entry, input_str):
+        slot = {"input": input_str, "done": False, "result": None, "error": None, "leader": False}
+        with self._condition:
+            queue = self._pending.setdefault(entry.id, [])
+            queue.append(slot)
+            slot["leader"] = len(queue) == 1
+            while not slot["done"] and not slot["leader"]:
+                self._condition.wait()
+            if slot["done"]:
+                if slot["error"] is not None:
+                    raise slot["error"]
+                return slot["result"]
+            self._condition.wait(BATCH_WINDOW)
+            batch = queue[:MAX_BATCH]
+            del queue[:MAX_BATCH]
+            if not queue:
+                del self._pending[entry.id]
+
+        error = None
+        try:
+            results = entry.compiled.simulate_batch([item["input"] for item in batch])
+        except Exception as e:
+            error, results = e, [None] * len(batch)
+        with self._condition:
+            for item, result in zip(batch, results):
+                item["result"] = result
+                item["error"] = error
+                item["done"] = True
+            if queue:
+                # Requests beyond MAX_BATCH (or that arrived meanwhile) get a new leader
+                queue[0]["leader"] = True
+            self._condition.notify_all()
+        if error is not None:
+            raise error
+        return slot["result"]
+
+
+# ===============================================================
+# 🌐 HTTP
+# ===============================================================
+class ApiError(Exception):
+    """❌ Error returned to the client with an HTTP status"""
+
+    def __init__(self, status, message):
+        self.status = status
+        super().__init__(message)
+
+
+ROUTE = re.compile(r"^/automata/([0-9a-f]{64})/(simulate|simulate_batch|search)$")
+
+
+class Handler(BaseHTTPRequestHandler):
+    """🌐 JSON request handler; the server holds the Registry"""
+
+    server_version = "AutomataService/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._dispatch(self._get)
+
+    def do_POST(self):
+        self._dispatch(self._post)
+
+    def _dispatch(self, handler):
+        try:
+            status, body = handler()
+        except ApiError as e:
+            status, body = e.status, {"error": str(e)}
+        except BudgetExceeded as e:
+            status, body = 422, {"error": str(e)}
+        except ValueError as e:
+            status, body = 400, {"error": str(e)}
+        except Exception as e:
+            self.log_error("Internal error on %s %s: %r", self.command, self.path, e)
+            status, body = 500, {"error": f"Internal error: {type(e).__name__}"}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ApiError(413, f"Request body larger than {MAX_BODY_BYTES} bytes")
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ApiError(400, f"Invalid JSON: {e}")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Request body must be a JSON object")
+        return body
+
+    def _entry(self, automaton_id):
+        entry = self.server.registry.get(automaton_id)
+        if entry is None:
+            raise ApiError(404, f"Unknown automaton: {automaton_id}")
+        return entry
+
+    def _get(self):
+        registry = self.server.registry
+        if self.path == "/health":
+            return 200, {"status": "ok", "automata": len(registry.entries())}
+        if self.path == "/automata":
+            return 200, {"automata": [entry.info() for entry in registry.entries()]}
+        if self.path.startswith("/automata/"):
+            return 200, self._entry(self.path[len("/automata/"):]).info()
+        raise ApiError(404, f"No such endpoint: {self.path}")
+
+    def _post(self):
+        registry = self.server.registry
+        body = self._body()
+        if self.path == "/automata":
+            kinds = [kind for kind in ("dfa", "regex", "keywords") if kind in body]
+            if len(kinds) != 1:
+                raise ApiError(400, "Give exactly one of dfa, regex or keywords")
+            kind = kinds[0]
+            source = _field(body, kind, {"dfa": dict, "regex": str, "keywords": list}[kind])
+            if kind == "keywords":
+                _items(source, "keywords")
+            minimize = body.get("minimize", False)
+            if not isinstance(minimize, bool):
+                raise ApiError(400, "Field 'minimize' must be a bool")
+            entry = registry.register(kind, source, minimize)
+            return 200, entry.info()
+
+        match = ROUTE.match(self.path)
+        if match is None:
+            raise ApiError(404, f"No such endpoint: {self.path}")
+        entry = self._entry(match.group(1))
+        action = match.group(2)
+        if action == "simulate":
+            return 200, {"accepted": registry.simulate(entry, _field(body, "input", str))}
+        if action == "simulate_batch":
+            inputs = _items(_field(body, "inputs", list), "inputs")
+            return 200, {"results": entry.compiled.simulate_batch(inputs)}
+        text = _field(body, "text", str)
+        return 200, {"spans": [list(span) for span in registry.search(entry, text)]}
+
+
+def _field(body, name, kind):
+    """Required field of a given JSON type"""
+    if not isinstance(body.get(name), kind):
+        raise ApiError(400, f"Field {name!r} must be a {kind.__name__}")
+    return body[name]
+
+
+def _items(values, name):
+    """List field whose items must all be strings"""
+    if not all(isinstance(value, str) for value in values):
+        raise ApiError(400, f"Field {name!r} must be a list of strings")
+    return values
+
+
+class AutomataServer(ThreadingHTTPServer):
+    """
+    🌐 Threaded HTTP server owning a Registry
+
+    Attributes:
+        registry: Shared Registry of compiled automata
+        verbose: Log every request to stderr
+    """
+
+    daemon_threads = True
+    # Many clients connect at once when they rely on request coalescing
+    request_queue_size = 128
+
+    def __init__(self, address, registry=None, verbose=False):
+        super().__init__(address, Handler)
+        self.registry = registry or Registry()
+        self.verbose = verbose
+
+    def server_close(self):
+        super().server_close()
+        self.registry.shutdown()
+
+
+def serve(host="127.0.0.1", port=8765, workers=None, verbose=False):
+    """
+    🚀 Run the service until interrupted
+
+    Args:
+        host: Interface to bind (localhost by default)
+        port: TCP port (0 picks a free one)
+        workers: Build pool size
+        verbose: Log every request
+    """
+    server = AutomataServer((host, port), Registry(max_workers=workers), verbose)
+    print(f"Serving automata on http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,9 @@
+"""
+⏱️ Benchmark Suite for Automata Theory Toolkit
+==============================================
+Reproducible workloads and a runner that records engine throughput
+and peak memory into a JSON history file.
+
+Run with:
+    python -m benchmarks
+"""
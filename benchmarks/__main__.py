@@ -0,0 +1,47 @@
+"""
+⏱️ Command-line entry point: python -m benchmarks
+"""
+
+import argparse
+import sys
+
+from benchmarks import runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the automata engines.")
+    parser.add_argument("-k", "--filter", help="Only run cases whose name matches this regex")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="Minimum seconds spent timing each case (default: 0.5)")
+    parser.add_argument("--history", default=runner.DEFAULT_HISTORY,
+                        help="JSON history file (default: benchmarks/history.json)")
+    parser.add_argument("--label", help="Label stored with this run")
+    parser.add_argument("--no-save", action="store_true", help="Do not append this run to the history")
+    parser.add_argument("--list", action="store_true", help="List case names and exit")
+    args = parser.parse_args(argv)
+
+    cases = runner.select(runner.default_cases(), args.filter)
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+    if not cases:
+        print("No benchmark cases match the filter.", file=sys.stderr)
+        return 1
+
+    history = runner.load_history(args.history)
+    results = runner.run(cases, min_time=args.min_time)
+    if args.no_save:
+        return 0
+
+    entry = runner.save_run(results, path=args.history, label=args.label)
+    if history:
+        print(f"\nCompared with previous run ({history[-1]['timestamp']}, {history[-1]['revision']}):")
+        for name, speedup, memory, verdict in runner.compare(history[-1], entry):
+            print(f"{name:<40} x{speedup:>6.2f} speed  x{memory:>6.2f} memory  {verdict}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
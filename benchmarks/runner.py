@@ -0,0 +1,328 @@
+"""
+🏃 Benchmark Runner
+===================
+Times every benchmark case, measures its peak memory with tracemalloc
+and appends the results to a JSON history file so runs can be
+compared against each other.
+"""
+
+import json
+import os
+import platform
+import re
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from engines.AHOCORASICK import AhoCorasick
+from engines.CAPTURE import regex_to_program
+from engines.COUNTING import regex_to_counting_nfa
+from engines.COVERAGE import CoverageCorpus
+from engines.LAZY import LazyDFA
+from engines.REGEX import regex_to_nfa
+from benchmarks import workloads
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), "history.json")
+
+
+# ===============================================================
+# 📋 BENCHMARK CASES
+# ===============================================================
+class Case:
+    """
+    📋 A single benchmark case
+
+    `setup` builds the workload once and returns a zero-argument
+    callable; only that callable is timed.
+    """
+
+    def __init__(self, name, setup, params):
+        self.name = name
+        self.setup = setup
+        self.params = params
+
+
+def _dfa_simulate(num_states, length):
+    dfa = workloads.random_dfa(num_states, 2, seed=1)
+    inputs = workloads.random_strings(100, length, seed=2)
+    return lambda: [dfa.simulate(s) for s in inputs]
+
+
+def _dfa_minimize(num_states, copies):
+    dfa = workloads.redundant_dfa(num_states, 2, copies=copies, seed=3)
+    return dfa.minimize
+
+
+def _dfa_minimize_chain(num_states):
+    dfa = workloads.chain_dfa(num_states)
+    return dfa.minimize
+
+
+def _coverage_run(num_states, copies):
+    dfa = workloads.redundant_dfa(num_states, 2, copies=copies, seed=3)
+    corpus = CoverageCorpus.from_dfa(dfa)
+    minimized = dfa.minimize().compile()
+    return lambda: corpus.run(minimized)
+
+
+def _dfa_equivalent(num_states, copies):
+    dfa = workloads.redundant_dfa(num_states, 2, copies=copies, seed=4)
+    minimized = dfa.minimize()
+    return lambda: dfa.is_equivalent(minimized)
+
+
+def _nfa_simulate(num_states, length):
+    nfa = workloads.random_nfa(num_states, 2, density=0.05, epsilon_ratio=0.02, seed=5)
+    inputs = workloads.random_strings(10, length, seed=6)
+    return lambda: [nfa.simulate(s) for s in inputs]
+
+
+def _nfa_simulate_pathological(depth, length):
+    nfa = regex_to_nfa(workloads.pathological_regex(depth))
+    text = "a" * length
+    return lambda: nfa.simulate(text)
+
+
+def _nfa_compiled_simulate(depth, length):
+    compiled = regex_to_nfa(workloads.pathological_regex(depth)).compile()
+    text = "a" * length
+    return lambda: compiled.simulate(text)
+
+
+def _nfa_reduced_simulate(depth, length):
+    nfa = regex_to_nfa(workloads.pathological_regex(depth)).reduce()
+    text = "a" * length
+    return lambda: nfa.simulate(text)
+
+
+def _nfa_reduce(size):
+    nfa = regex_to_nfa(workloads.random_regex(size, alphabet_size=3, seed=7))
+    return lambda: nfa.reduce()
+
+
+def _counting_simulate(bound, length):
+    counting = regex_to_counting_nfa(f"(a|b)*a(a|b){{{bound}}}")
+    text = workloads.random_strings(1, length, seed=13)[0]
+    return lambda: counting.simulate(text)
+
+
+def _capture_match(regex, length, pike):
+    program = regex_to_program(regex)
+    text = workloads.random_strings(1, length, seed=14)[0] + "c"
+    match = program.pike_match if pike else program.match
+    return lambda: match(text)
+
+
+def _lazy_simulate(regex, length):
+    lazy = LazyDFA(regex_to_nfa(regex))
+    text = workloads.random_strings(1, length, seed=15)[0]
+    return lambda: lazy.simulate(text)
+
+
+def _aho_corasick(keywords, length):
+    words = workloads.random_strings(keywords, 6, alphabet_size=4, seed=11)
+    text = workloads.random_strings(1, length, alphabet_size=4, seed=12)[0]
+    matcher = AhoCorasick(words)
+    return lambda: sum(1 for _ in matcher.matches(text))
+
+
+def _regex_compile(size):
+    regex = workloads.random_regex(size, alphabet_size=3, seed=7)
+    return lambda: regex_to_nfa(regex)
+
+
+def _regex_compile_pathological(depth):
+    regex = workloads.pathological_regex(depth)
+    return lambda: regex_to_nfa(regex)
+
+
+def default_cases():
+    """
+    📋 Build the default list of benchmark cases
+
+    Returns:
+        list: Case objects covering every engine entry point
+    """
+    cases = []
+
+    def add(name, setup, **params):
+        cases.append(Case(name, lambda: setup(**params), params))
+
+    add("dfa.simulate/n=100,len=100", _dfa_simulate, num_states=100, length=100)
+    add("dfa.simulate/n=1000,len=1000", _dfa_simulate, num_states=1000, length=1000)
+    add("dfa.minimize/n=50x4", _dfa_minimize, num_states=50, copies=4)
+    add("dfa.minimize/n=250x4", _dfa_minimize, num_states=250, copies=4)
+    add("dfa.minimize/chain=200", _dfa_minimize_chain, num_states=200)
+    add("dfa.is_equivalent/n=250x4", _dfa_equivalent, num_states=250, copies=4)
+    add("dfa.is_equivalent/n=1000x4", _dfa_equivalent, num_states=1000, copies=4)
+    add("coverage.run/n=250x4", _coverage_run, num_states=250, copies=4)
+    add("nfa.simulate/n=50,len=200", _nfa_simulate, num_states=50, length=200)
+    add("nfa.simulate/(a|aa)*x4,len=500", _nfa_simulate_pathological, depth=4, length=500)
+    add("nfa.compiled.simulate/(a|aa)*x4,len=500", _nfa_compiled_simulate, depth=4, length=500)
+    add("nfa.reduced.simulate/(a|aa)*x4,len=500", _nfa_reduced_simulate, depth=4, length=500)
+    add("nfa.reduce/regex size=200", _nfa_reduce, size=200)
+    add("counting.simulate/(a|b)*a(a|b){1000},len=2000", _counting_simulate, bound=1000, length=2000)
+    add("capture.match/((a|b)*)c,len=2000", _capture_match, regex="((a|b)*)c", length=2000, pike=False)
+    add("capture.pike/((a|b)*)c,len=2000", _capture_match, regex="((a|b)*)c", length=2000, pike=True)
+    add("lazy.simulate/(a|b)*abb(a|b)*,len=10000", _lazy_simulate, regex="(a|b)*abb(a|b)*", length=10000)
+    add("lazy.simulate/(a|b)*a(a|b){16},len=10000", _lazy_simulate, regex="(a|b)*a(a|b){16}", length=10000)
+    add("aho_corasick.matches/kw=100,len=10000", _aho_corasick, keywords=100, length=10000)
+    add("aho_corasick.matches/kw=10000,len=10000", _aho_corasick, keywords=10000, length=10000)
+    add("regex_to_nfa/size=50", _regex_compile, size=50)
+    add("regex_to_nfa/size=200", _regex_compile, size=200)
+    add("regex_to_nfa/(a|aa)*x20", _regex_compile_pathological, depth=20)
+    return cases
+
+
+# ===============================================================
+# ⏱️ MEASUREMENT
+# ===============================================================
+def measure(case, min_time=0.5, max_rounds=10000):
+    """
+    ⏱️ Measure throughput and peak memory of one case
+
+    Args:
+        case: Case to run
+        min_time: Minimum total seconds spent in timed calls
+        max_rounds: Upper bound on timed calls
+
+    Returns:
+        dict: ops_per_sec, mean/min seconds per call, rounds and peak_bytes
+    """
+    fn = case.setup()
+    fn()  # warm-up
+
+    timings = []
+    total = 0.0
+    while total < min_time and len(timings) < max_rounds:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        total += elapsed
+
+    # Peak memory is measured on a separate call: tracemalloc slows
+    # allocation down and would skew the timings above.
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": len(timings) / total if total else float("inf"),
+        "mean_seconds": total / len(timings),
+        "min_seconds": min(timings),
+        "rounds": len(timings),
+        "peak_bytes": peak,
+        "params": case.params,
+    }
+
+
+def run(cases, min_time=0.5, report=print):
+    """
+    🏃 Run a list of cases
+
+    Args:
+        cases: Case objects to run
+        min_time: Minimum seconds per case
+        report: Callable receiving one progress line per case
+
+    Returns:
+        dict: Results keyed by case name
+    """
+    results = {}
+    for case in cases:
+        result = measure(case, min_time=min_time)
+        results[case.name] = result
+        report(f"{case.name:<40} {result['ops_per_sec']:>12.2f} ops/s "
+               f"{result['peak_bytes'] / 1024:>10.1f} KiB peak")
+    return results
+
+
+def select(cases, pattern):
+    """🔍 Keep the cases whose name matches the regex `pattern`"""
+    if not pattern:
+        return cases
+    compiled = re.compile(pattern)
+    return [case for case in cases if compiled.search(case.name)]
+
+
+# ===============================================================
+# 📚 HISTORY
+# ===============================================================
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path=DEFAULT_HISTORY):
+    """📖 Load the run history, or an empty list if there is none yet"""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_run(results, path=DEFAULT_HISTORY, label=None):
+    """
+    💾 Append a run to the history file
+
+    Args:
+        results: Results from run()
+        path: History file path
+        label: Optional free-form label for the run
+
+    Returns:
+        dict: The stored run entry
+    """
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "label": label,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    history = load_history(path)
+    history.append(entry)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2)
+    return entry
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    ⚖️ Compare two runs case by case
+
+    Args:
+        baseline: Earlier run entry
+        current: Later run entry
+        threshold: Relative change treated as a regression/improvement
+
+    Returns:
+        list: (name, speedup, memory_ratio, verdict) for shared cases
+    """
+    rows = []
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        speedup = result["ops_per_sec"] / old["ops_per_sec"]
+        memory = result["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else 1.0
+        if speedup < 1 - threshold:
+            verdict = "slower"
+        elif speedup > 1 + threshold:
+            verdict = "faster"
+        else:
+            verdict = "same"
+        rows.append((name, speedup, memory, verdict))
+    return rows
@@ -0,0 +1,221 @@
+"""
+🎲 Workload Generators for Benchmarks
+=====================================
+Seeded generators for random and adversarial DFAs, NFAs and regexes.
+The same seed and size parameters always produce the same automaton.
+"""
+
+import random
+import string
+
+from engines.DFA import DFA
+from engines.NFA import NFA
+
+
+def make_alphabet(size):
+    """
+    🔤 Build an alphabet of `size` symbols: a, b, c, ...
+
+    Args:
+        size: Number of symbols (1 to 26)
+
+    Returns:
+        list: Alphabet symbols in sorted order
+    """
+    if not 1 <= size <= len(string.ascii_lowercase):
+        raise ValueError(f"Alphabet size must be between 1 and 26, got {size}")
+    return list(string.ascii_lowercase[:size])
+
+
+def random_dfa(num_states, alphabet_size, density=1.0, accept_ratio=0.5, seed=0):
+    """
+    🎲 Generate a random DFA
+
+    Args:
+        num_states: Number of states
+        alphabet_size: Number of input symbols
+        density: Fraction of (state, symbol) pairs that have a transition
+        accept_ratio: Fraction of states that are accepting
+        seed: Random seed
+
+    Returns:
+        DFA: Randomly generated DFA with states q0..q{n-1}
+    """
+    rng = random.Random(seed)
+    alphabet = make_alphabet(alphabet_size)
+    states = [f"q{i}" for i in range(num_states)]
+
+    transitions = {}
+    for state in states:
+        transitions[state] = {}
+        for symbol in alphabet:
+            if rng.random() < density:
+                transitions[state][symbol] = rng.choice(states)
+
+    accept_states = [s for s in states if rng.random() < accept_ratio]
+    return DFA(states, alphabet, states[0], accept_states, transitions)
+
+
+def redundant_dfa(num_states, alphabet_size, copies=4, seed=0):
+    """
+    ♻️ Generate a DFA made of several identical copies of a random DFA
+
+    Every copy jumps into the next one on its first transition, so the
+    minimized result is at most `num_states` states while the input
+    is `num_states * copies` states.
+
+    Args:
+        num_states: States per copy
+        alphabet_size: Number of input symbols
+        copies: Number of copies
+        seed: Random seed
+
+    Returns:
+        DFA: DFA with many equivalent states
+    """
+    base = random_dfa(num_states, alphabet_size, density=1.0, seed=seed)
+    alphabet = sorted(base.alphabet)
+
+    def name(copy, state):
+        return f"c{copy}_{state}"
+
+    states = []
+    accept_states = []
+    transitions = {}
+    for copy in range(copies):
+        nxt = (copy + 1) % copies
+        for state in sorted(base.states):
+            states.append(name(copy, state))
+            if state in base.accept_states:
+                accept_states.append(name(copy, state))
+            transitions[name(copy, state)] = {
+                symbol: name(nxt, dest)
+                for symbol, dest in base.transitions[state].items()
+            }
+    return DFA(states, alphabet, name(0, base.start_state), accept_states, transitions)
+
+
+def chain_dfa(num_states, alphabet_size=2):
+    """
+    ⛓️ Generate a chain DFA that counts input length modulo `num_states`
+
+    All states are distinguishable, so minimization has to run
+    refinement all the way down to singleton blocks.
+
+    Args:
+        num_states: Length of the cycle
+        alphabet_size: Number of input symbols
+
+    Returns:
+        DFA: Already-minimal DFA accepting lengths ≡ -1 (mod n)
+    """
+    alphabet = make_alphabet(alphabet_size)
+    states = [f"q{i}" for i in range(num_states)]
+    transitions = {
+        states[i]: {symbol: states[(i + 1) % num_states] for symbol in alphabet}
+        for i in range(num_states)
+    }
+    return DFA(states, alphabet, states[0], [states[-1]], transitions)
+
+
+def random_nfa(num_states, alphabet_size, density=0.2, epsilon_ratio=0.1, seed=0):
+    """
+    🎲 Generate a random NFA
+
+    Args:
+        num_states: Number of states
+        alphabet_size: Number of input symbols
+        density: Probability of an edge for each (src, symbol, dest) triple
+        epsilon_ratio: Probability of an epsilon edge for each (src, dest) pair
+        seed: Random seed
+
+    Returns:
+        NFA: Randomly generated NFA with states q0..q{n-1}
+    """
+    rng = random.Random(seed)
+    alphabet = make_alphabet(alphabet_size)
+    states = [f"q{i}" for i in range(num_states)]
+
+    nfa = NFA()
+    nfa.start_state = states[0]
+    nfa.states.update(states)
+    for src in states:
+        for dest in states:
+            for symbol in alphabet:
+                if rng.random() < density:
+                    nfa.add_transition(src, symbol, dest)
+            if src != dest and rng.random() < epsilon_ratio:
+                nfa.add_transition(src, "", dest)
+    nfa.accept_states = {s for s in states if rng.random() < 0.3} or {states[-1]}
+    return nfa
+
+
+def random_regex(size, alphabet_size=2, seed=0, max_repeat=0):
+    """
+    🎲 Generate a random regex over the syntax accepted by regex_to_nfa
+
+    Args:
+        size: Approximate number of symbols in the regex
+        alphabet_size: Number of input symbols
+        seed: Random seed
+        max_repeat: Largest bound in {m,n} repetitions (0 = no repetitions)
+
+    Returns:
+        str: Regex using symbols, |, *, () and {m,n} if max_repeat > 0
+    """
+    rng = random.Random(seed)
+    alphabet = make_alphabet(alphabet_size)
+
+    def expr(budget):
+        if budget <= 1:
+            return rng.choice(alphabet)
+        roll = rng.random()
+        if roll < 0.25:
+            left = rng.randint(1, budget - 1)
+            return expr(left) + "|" + expr(budget - left)
+        if roll < 0.4:
+            return "(" + expr(budget) + ")*"
+        if max_repeat and roll < 0.5:
+            low = rng.randint(0, max_repeat)
+            high = rng.choice([low, rng.randint(low, max_repeat), None])
+            bounds = str(low) if high == low else f"{low},{'' if high is None else high}"
+            return "(" + expr(budget) + "){" + bounds + "}"
+        left = rng.randint(1, budget - 1)
+        return group(expr(left)) + group(expr(budget - left))
+
+    def group(sub):
+        # Concatenated operands need parentheses if they contain a union
+        return "(" + sub + ")" if "|" in sub else sub
+
+    return expr(size)
+
+
+def pathological_regex(depth):
+    """
+    💣 Generate an `(a|aa)*`-style regex with heavily overlapping choices
+
+    Args:
+        depth: Number of repeated `(a|aa)*` factors
+
+    Returns:
+        str: Regex such as "(a|aa)*(a|aa)*b"
+    """
+    return "(a|aa)*" * depth + "b"
+
+
+def random_strings(count, length, alphabet_size=2, seed=0):
+    """
+    🧵 Generate random input strings
+
+    Args:
+        count: Number of strings
+        length: Length of every string
+        alphabet_size: Number of input symbols
+        seed: Random seed
+
+    Returns:
+        list: Input strings
+    """
+    rng = random.Random(seed)
+    alphabet = make_alphabet(alphabet_size)
+    return ["".join(rng.choice(alphabet) for _ in range(length)) for _ in range(count)]
@@ -0,0 +1,270 @@
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+# ===============================================================
+# 📖 AHO–CORASICK KEYWORD AUTOMATON
+# ===============================================================
+# States are trie nodes numbered in BFS order (root = 0), so the children
+# of a node get consecutive numbers and depth never decreases with the
+# number. After construction everything lives in flat arrays:
+# - first_child: children of s are states first_child[s]..first_child[s+1]-1
+# - column:      symbol index on the trie edge into each state, so a
+#                child is found by bisecting its parent's range
+# - delta:       goto completed with failure links (one table lookup per
+#                symbol), kept only for the first `dense_states` states
+# - fail:        longest proper suffix of a node that is also a trie node
+# - keyword:     index of the keyword ending exactly at a node, -1 if none
+# - output:      nearest node on the failure chain that ends a keyword
+#                (the "dictionary suffix link"), -1 if none
+#
+# Memory trade-off: a full delta table costs num_states * num_symbols
+# ints, hundreds of MB for 100k keywords over a wide alphabet. Only the
+# shallow states, where a scan spends most of its time, get dense rows,
+# capped at DENSE_CELLS entries in total. Deeper states store just their
+# trie edges and follow failure links down to a dense row, which costs
+# a few extra steps per symbol but keeps memory linear in num_states.
+DENSE_CELLS = 1 << 20  # dense delta entries (4 bytes each)
+
+
+class AhoCorasick:
+    """
+    📖 Multi-keyword matcher, a drop-in for huge "kw1|kw2|..." regexes
+
+    simulate() answers exact membership like the DFA/NFA engines; search(),
+    spans() and matches() scan a longer text in one pass.
+
+    Attributes:
+        keywords: Distinct keywords, index = keyword id
+        symbols: Sorted alphabet of the keywords
+        dense_states: Number of states (in BFS order) with a dense delta row
+    """
+
+    def __init__(self, keywords, dense_cells=DENSE_CELLS):
+        """
+        🏗️ Build the automaton
+
+        Args:
+            keywords: Iterable of non-empty strings
+            dense_cells: Most delta entries to store densely (the root row
+                         is always dense)
+
+        Raises:
+            ValueError: If there are no keywords or one is empty
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        if not self.keywords:
+            raise ValueError("Aho-Corasick needs at least one keyword")
+        if any(not keyword for keyword in self.keywords):
+            raise ValueError("Keywords must be non-empty")
+        self.symbols = sorted({symbol for keyword in self.keywords for symbol in keyword})
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        width = len(self.symbols)
+
+        # Trie with dict children first, then renumbered in BFS order
+        children = [{}]
+        ends = [-1]
+        for i, keyword in enumerate(self.keywords):
+            node = 0
+            for symbol in keyword:
+                column = self.symbol_index[symbol]
+                nxt = children[node].get(column)
+                if nxt is None:
+                    nxt = len(children)
+                    children[node][column] = nxt
+                    children.append({})
+                    ends.append(-1)
+                node = nxt
+            ends[node] = i
+
+        size = len(children)
+        self.first_child = array("i", [0]) * (size + 1)
+        self.column = array("i", [-1]) * size
+        self.keyword = array("i", [-1]) * size
+        self.depth = array("i", [0]) * size
+        order = [0]
+        for state, node in enumerate(order):
+            self.first_child[state] = len(order)
+            for column in sorted(children[node]):
+                child = len(order)
+                order.append(children[node][column])
+                self.column[child] = column
+                self.keyword[child] = ends[order[child]]
+                self.depth[child] = self.depth[state] + 1
+            children[node] = None
+        self.first_child[size] = size
+        del children, ends, order
+
+        self.dense_states = max(1, min(size, dense_cells // max(width, 1)))
+        self.fail = array("i", [0]) * size
+        self.output = array("i", [-1]) * size
+        self.delta = array("i", [0]) * (self.dense_states * width)
+        # BFS order: a state's failure link and (if dense) delta row are
+        # set before its children are visited
+        for state in range(size):
+            fallback = self.fail[state]
+            if state < self.dense_states:
+                base = state * width
+                if state:
+                    self.delta[base:base + width] = self.delta[fallback * width:(fallback + 1) * width]
+                for child in range(self.first_child[state], self.first_child[state + 1]):
+                    self.delta[base + self.column[child]] = child
+            for child in range(self.first_child[state], self.first_child[state + 1]):
+                target = self._next(fallback, self.column[child]) if state else 0
+                self.fail[child] = target
+                self.output[child] = target if self.keyword[target] >= 0 else self.output[target]
+
+    def _child(self, state, column):
+        """Trie edge from state on column, -1 if missing"""
+        lo, hi = self.first_child[state], self.first_child[state + 1]
+        child = bisect_left(self.column, column, lo, hi)
+        return child if child < hi and self.column[child] == column else -1
+
+    def _next(self, state, column):
+        """Completed transition (delta) from state on column"""
+        while state >= self.dense_states:
+            child = self._child(state, column)
+            if child >= 0:
+                return child
+            state = self.fail[state]
+        return self.delta[state * len(self.symbols) + column]
+
+    @property
+    def num_states(self):
+        """int: Number of trie nodes"""
+        return len(self.keyword)
+
+    def simulate(self, input_str):
+        """
+        🔄 Check whether the input is exactly one of the keywords
+
+        Args:
+            input_str: String to check
+
+        Returns:
+            bool: True if input_str is a keyword
+        """
+        state = 0
+        for symbol in input_str:
+            column = self.symbol_index.get(symbol)
+            if column is None:
+                return False
+            state = self._child(state, column)
+            if state < 0:
+                return False
+        return self.keyword[state] >= 0
+
+    def simulate_batch(self, strings):
+        """
+        📦 Check many strings for exact membership
+
+        Args:
+            strings: Iterable of input strings
+
+        Returns:
+            list: One bool per input string
+        """
+        return [self.simulate(s) for s in strings]
+
+    def matches(self, text):
+        """
+        🔍 Find every keyword occurrence, overlapping ones included
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            tuple: (keyword, start, end) in order of end position, longest
+                   keyword first for the same end
+        """
+        delta, keyword, output, depth = self.delta, self.keyword, self.output, self.depth
+        columns = self.symbol_index
+        width = len(self.symbols)
+        dense = self.dense_states
+        state = 0
+        for i, symbol in enumerate(text, 1):
+            column = columns.get(symbol)
+            if column is None:
+                state = 0
+                continue
+            if state < dense:
+                state = delta[state * width + column]
+            else:
+                state = self._next(state, column)
+            hit = state if keyword[state] >= 0 else output[state]
+            while hit >= 0:
+                yield self.keywords[keyword[hit]], i - depth[hit], i
+                hit = output[hit]
+
+    def spans(self, text):
+        """
+        📏 Find non-overlapping matches, earliest end first
+
+        Same semantics as SEARCH.Searcher.spans(): a match is reported as
+        soon as one ends, extended to its leftmost start (the longest
+        keyword ending there), and scanning restarts after it.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            tuple: (start, end) with text[start:end] a keyword
+        """
+        delta, keyword, output, depth = self.delta, self.keyword, self.output, self.depth
+        columns = self.symbol_index
+        width = len(self.symbols)
+        dense = self.dense_states
+        state = 0
+        for i, symbol in enumerate(text, 1):
+            column = columns.get(symbol)
+            if column is None:
+                state = 0
+                continue
+            if state < dense:
+                state = delta[state * width + column]
+            else:
+                state = self._next(state, column)
+            hit = state if keyword[state] >= 0 else output[state]
+            if hit >= 0:
+                yield i - depth[hit], i
+                state = 0
+
+    def search(self, text):
+        """
+        🔍 Find the first (earliest-ending) match
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            tuple or None: (start, end) of the first match, None if there is none
+        """
+        return next(self.spans(text), None)
+
+    def to_dfa(self, unanchored=False):
+        """
+        🔁 Convert to a DFA
+
+        Args:
+            unanchored: If False, the DFA accepts exactly the keywords (the
+                        trie); if True it accepts every string over the
+                        keyword alphabet that ends with a keyword (the
+                        completed delta table)
+
+        Returns:
+            DFA: DFA with states K0, K1, ... (K0 = root)
+        """
+        from engines.DFA import DFA
+
+        step = self._next if unanchored else self._child
+        names = [f"K{state}" for state in range(self.num_states)]
+        transitions = {}
+        for state, name in enumerate(names):
+            row = (step(state, column) for column in range(len(self.symbols)))
+            transitions[name] = {self.symbols[column]: names[dest] for column, dest in enumerate(row) if dest >= 0}
+        if unanchored:
+            accept_states = [names[state] for state in range(self.num_states)
+                             if self.keyword[state] >= 0 or self.output[state] >= 0]
+        else:
+            accept_states = [names[state] for state in range(self.num_states) if self.keyword[state] >= 0]
+        return DFA(names, self.symbols, names[0], accept_states, transitions)
@@ -0,0 +1,177 @@
+import os
+import threading
+import time
+import tracemalloc
+from engines import STATS
+
+# ===============================================================
+# 🛑 RESOURCE BUDGETS & CANCELLATION
+# ===============================================================
+# Engines check their budget at the same checkpoints where they report
+# instrumentation (once per refinement round, every few hundred new
+# states or product pairs), so a limit can be overshot by at most one
+# checkpoint interval.
+
+
+class BudgetExceeded(Exception):
+    """
+    🛑 Raised when an operation exceeds one of its budget limits
+
+    Attributes:
+        limit: Name of the limit that was hit ("max_states", "max_pairs",
+               "max_seconds", "max_memory" or "cancelled")
+        value: Observed value when the limit was hit
+        maximum: Configured limit
+        stats: STATS.Stats with the partial counters of the operation
+    """
+
+    def __init__(self, limit, value, maximum, stats=None):
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+        self.stats = stats
+        operation = stats.operation if stats is not None else "operation"
+        super().__init__(f"{operation} exceeded {limit}: {value} > {maximum}")
+
+    def __reduce__(self):
+        # Rebuild from the attributes so the error survives a process pool
+        return (type(self), (self.limit, self.value, self.maximum, self.stats))
+
+
+class Cancelled(BudgetExceeded):
+    """🚫 Raised when an operation is cancelled through its CancellationToken"""
+
+    def __init__(self, stats=None):
+        super().__init__("cancelled", True, None, stats)
+        operation = stats.operation if stats is not None else "operation"
+        self.args = (f"{operation} was cancelled",)
+
+    def __reduce__(self):
+        return (type(self), (self.stats,))
+
+
+class CancellationToken:
+    """
+    🚫 Cooperative cancellation flag
+
+    Safe to cancel from another thread; the running operation stops at
+    its next checkpoint by raising Cancelled.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """🚫 Request cancellation"""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """bool: True once cancel() has been called"""
+        return self._event.is_set()
+
+
+def memory_in_use():
+    """
+    💾 Current memory use of this process in bytes
+
+    Uses tracemalloc when it is tracing, the resident set size from
+    /proc when available, and the peak RSS from getrusage otherwise.
+    """
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class Budget:
+    """
+    🛑 Limits for an engine job
+
+    Any limit left as None is not enforced. One budget can be passed to
+    every step of a job (e.g. regex_to_nfa and then to_dfa): the size
+    limits apply to each operation, while the wall-clock limit is
+    measured from the first operation the budget is passed to, so it
+    covers the whole job. Use a fresh budget per job.
+    """
+
+    def __init__(self, max_states=None, max_pairs=None, max_seconds=None,
+                 max_memory=None, token=None):
+        """
+        🔧 Initialize a budget
+
+        Args:
+            max_states: Maximum number of states built or processed
+            max_pairs: Maximum number of product pairs explored
+            max_seconds: Maximum wall time in seconds
+            max_memory: Maximum process memory in bytes
+            token: Optional CancellationToken
+        """
+        self.max_states = max_states
+        self.max_pairs = max_pairs
+        self.max_seconds = max_seconds
+        self.max_memory = max_memory
+        self.token = token
+        self._started = None
+
+    def start(self, operation, stats, **counters):
+        """
+        ▶️ Start an operation and check its input size
+
+        The clock starts on the first call only; later operations share
+        the same deadline.
+
+        Args:
+            operation: Operation name
+            stats: Stats from STATS.begin(), or None
+            **counters: Initial counters, e.g. states=len(dfa.states)
+
+        Returns:
+            Stats: `stats`, or a fresh Stats object so that partial
+                   counters can be attached to BudgetExceeded
+        """
+        if stats is None:
+            stats = STATS.begin(operation, STATS.Stats(operation))
+        stats.counters.update(counters)
+        if self._started is None:
+            self._started = time.perf_counter()
+        self.check(stats)
+        return stats
+
+    def check(self, stats):
+        """
+        🔍 Raise BudgetExceeded if any limit is exceeded
+
+        Args:
+            stats: Stats of the running operation; its "states" and
+                   "pairs" counters are compared against the limits
+        """
+        error = None
+        counters = stats.counters
+        if self.token is not None and self.token.cancelled:
+            error = Cancelled(stats)
+        elif self.max_states is not None and counters.get("states", 0) > self.max_states:
+            error = BudgetExceeded("max_states", counters["states"], self.max_states, stats)
+        elif self.max_pairs is not None and counters.get("pairs", 0) > self.max_pairs:
+            error = BudgetExceeded("max_pairs", counters["pairs"], self.max_pairs, stats)
+        elif (self.max_seconds is not None
+              and time.perf_counter() - self._started > self.max_seconds):
+            elapsed = round(time.perf_counter() - self._started, 3)
+            error = BudgetExceeded("max_seconds", elapsed, self.max_seconds, stats)
+        elif self.max_memory is not None:
+            used = memory_in_use()
+            if used > self.max_memory:
+                error = BudgetExceeded("max_memory", used, self.max_memory, stats)
+        if error is not None:
+            stats.elapsed = time.perf_counter() - self._started
+            raise error
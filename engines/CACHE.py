@@ -0,0 +1,199 @@
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+# ===============================================================
+# 🗄️ CONTENT-ADDRESSED RESULT CACHE
+# ===============================================================
+# Results are keyed on DFA.canonical_hash(), so automata that differ only
+# in state names share cache entries. The first tier is an in-process
+# LRU; the optional second tier is a directory of pickle files that can
+# be shared between processes (e.g. the JobRunner workers). Only point
+# the disk tier at a directory you trust: entries are unpickled.
+
+# Subdirectory of the disk tier. Bump it whenever a cached object changes
+# its pickled layout (v2: DFA/NFA with __slots__), so files written by an
+# older layout are never loaded.
+FORMAT_VERSION = 2
+
+_MISSING = object()
+
+
+class ResultCache:
+    """
+    🗄️ Two-tier (memory LRU + optional disk) key/value cache
+
+    Attributes:
+        hits: Lookups answered from memory
+        disk_hits: Lookups answered from disk
+        misses: Lookups that had to be computed
+    """
+
+    def __init__(self, max_entries=256, directory=None):
+        """
+        🔧 Initialize the cache
+
+        Args:
+            max_entries: Number of entries kept in memory
+            directory: Directory for the disk tier, or None to disable it
+        """
+        self.max_entries = max_entries
+        self.directory = directory
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"v{FORMAT_VERSION}", key[:2], key + ".pickle")
+
+    def get(self, key, default=None):
+        """
+        🔍 Look up a key in memory, then on disk
+
+        Args:
+            key: Hex string key
+            default: Value returned on a miss
+
+        Returns:
+            The cached value, or `default`
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                self._remember(key, value)
+                self.disk_hits += 1
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """
+        💾 Store a value in memory and, if enabled, on disk
+
+        Args:
+            key: Hex string key
+            value: Picklable value
+        """
+        self._remember(key, value)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see partial data
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """🧹 Drop the in-memory tier (the disk tier is left untouched)"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared cache; set AUTOMATA_CACHE_DIR to enable the disk tier
+default_cache = ResultCache(directory=os.environ.get("AUTOMATA_CACHE_DIR"))
+
+
+def _cached(cache, key, compute):
+    cache = default_cache if cache is None else cache
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = compute()
+        cache.put(key, value)
+    return value
+
+
+def minimize(dfa, stats=None, budget=None, cache=None):
+    """
+    ⚡ Cached DFA.minimize()
+
+    The minimized DFA is renamed into canonical order (S0 is the start
+    state), so equal inputs give identical results across processes.
+
+    Args:
+        dfa: DFA to minimize
+        stats: Optional STATS.Stats (only filled in on a cache miss)
+        budget: Optional BUDGET.Budget (only applies on a cache miss)
+        cache: ResultCache to use (defaults to default_cache)
+
+    Returns:
+        DFA: Minimized DFA; a fresh copy on every call
+    """
+    key = "minimize-" + dfa.canonical_hash()
+    result = _cached(cache, key, lambda: dfa.minimize(stats=stats, budget=budget).canonical("S"))
+    return result.canonical("S")
+
+
+def is_equivalent(dfa1, dfa2, stats=None, budget=None, cache=None):
+    """
+    ⚖️ Cached DFA.is_equivalent()
+
+    Args:
+        dfa1: First DFA
+        dfa2: Second DFA
+        stats: Optional STATS.Stats (only filled in on a cache miss)
+        budget: Optional BUDGET.Budget (only applies on a cache miss)
+        cache: ResultCache to use (defaults to default_cache)
+
+    Returns:
+        bool: True if the DFAs accept the same language
+    """
+    # v2: results from before missing transitions were compared are stale
+    key = f"equivalent-v2-{dfa1.canonical_hash()}-{dfa2.canonical_hash()}"
+    return _cached(cache, key, lambda: dfa1.is_equivalent(dfa2, stats=stats, budget=budget))
+
+
+def visual_representation(dfa, cache=None):
+    """
+    🎨 Cached DFA.get_visual_representation()
+
+    The representation is cached for the canonical DFA and mapped back
+    to this DFA's own state names, so renamed copies share the entry.
+
+    Args:
+        dfa: DFA to describe
+        cache: ResultCache to use (defaults to default_cache)
+
+    Returns:
+        dict: Same structure as DFA.get_visual_representation()
+    """
+    order = dfa.canonical_order()
+    key = "visual-" + dfa.canonical_hash()
+    canonical = _cached(cache, key, lambda: dfa.canonical().get_visual_representation())
+    name = {f"C{i}": state for i, state in enumerate(order)}
+    return {
+        **canonical,
+        "states": [name[s] for s in canonical["states"]],
+        "alphabet": list(canonical["alphabet"]),
+        "start_state": name[canonical["start_state"]],
+        "accept_states": [name[s] for s in canonical["accept_states"]],
+        "transitions": {
+            name[src]: {c: name[dest] for c, dest in edges.items()}
+            for src, edges in canonical["transitions"].items()
+        },
+    }
@@ -0,0 +1,348 @@
+import time
+from engines import STATS
+from engines.BUDGET import BudgetExceeded
+from engines.REGEX import parse_regex
+
+# ===============================================================
+# 🎯 CAPTURE GROUPS: PIKE VM + ONE-PASS TAGGED DFA
+# ===============================================================
+# A regex compiles to a program of five instructions:
+#   CHAR c     consume symbol c
+#   SPLIT x y  continue at x and (with lower priority) at y
+#   JMP x      continue at x
+#   SAVE k     record the current position in capture slot k
+#   MATCH      the whole regex matched
+# Group i saves its start in slot 2i and its end in slot 2i + 1; group 0
+# is the whole match. SPLIT puts the greedy choice first, so priorities
+# follow re's backtracking order and the reported spans are the ones
+# re.fullmatch reports.
+#
+# Pike VM: all threads advance in lockstep, one symbol at a time, in
+# priority order. At most one thread per instruction survives each step
+# (the first to arrive), so a match takes O(len(program)) per symbol.
+# Thread captures live in two preallocated pools of len(program) rows,
+# one for the current and one for the next step, swapped every symbol.
+#
+# One-pass tagged DFA: if from every point of the program each symbol
+# leads to at most one CHAR instruction, only one thread can ever be
+# alive. The program then compiles to a DFA whose transitions carry the
+# slots to save, and matching is one dict lookup per symbol.
+
+CHAR, SPLIT, JMP, SAVE, MATCH = range(5)
+
+
+class CaptureProgram:
+    """
+    🎯 Compiled regex that reports capture-group spans
+
+    Attributes:
+        ops: Instruction codes (CHAR, SPLIT, JMP, SAVE or MATCH)
+        args: Symbol for CHAR, slot for SAVE, first target for SPLIT/JMP
+        alts: Second target for SPLIT (None otherwise)
+        num_groups: Number of capture groups, not counting group 0
+        one_pass: True if the one-pass tagged DFA is used for matching
+    """
+
+    def __init__(self, instructions, num_groups):
+        """
+        🔧 Build the program from absolute-target instructions
+
+        Args:
+            instructions: List of (op, arg, alt) tuples
+            num_groups: Number of capture groups
+        """
+        self.ops = [op for op, _, _ in instructions]
+        self.args = [arg for _, arg, _ in instructions]
+        self.alts = [alt for _, _, alt in instructions]
+        self.num_groups = num_groups
+        self._onepass = self._compile_onepass()
+        self.one_pass = self._onepass is not None
+
+    def __len__(self):
+        return len(self.ops)
+
+    def _closure(self, pc):
+        """Leaves (CHAR or MATCH pcs) reachable from pc, in priority order, with the slots saved on the way"""
+        ops, args, alts = self.ops, self.args, self.alts
+        leaves = []
+        seen = set()
+        stack = [(pc, ())]
+        while stack:
+            pc, saves = stack.pop()
+            if pc in seen:
+                continue
+            seen.add(pc)
+            op = ops[pc]
+            if op == JMP:
+                stack.append((args[pc], saves))
+            elif op == SPLIT:
+                stack.append((alts[pc], saves))
+                stack.append((args[pc], saves))
+            elif op == SAVE:
+                stack.append((pc + 1, saves + (args[pc],)))
+            else:
+                leaves.append((pc, saves))
+        return leaves
+
+    def _compile_onepass(self):
+        """Table of the one-pass tagged DFA, or None if the program is not one-pass"""
+        index = {0: 0}
+        entries = [0]
+        table = []
+        for entry in entries:
+            moves = {}
+            final = None
+            for pc, saves in self._closure(entry):
+                if self.ops[pc] == MATCH:
+                    final = saves
+                    continue
+                symbol = self.args[pc]
+                if symbol in moves:
+                    return None
+                following = index.get(pc + 1)
+                if following is None:
+                    following = index[pc + 1] = len(entries)
+                    entries.append(pc + 1)
+                moves[symbol] = (following, saves)
+            table.append((moves, final))
+        return table
+
+    def _spans(self, caps):
+        return tuple((caps[2 * i], caps[2 * i + 1]) if caps[2 * i] >= 0 and caps[2 * i + 1] >= 0 else None
+                     for i in range(self.num_groups + 1))
+
+    def match(self, string, stats=None):
+        """
+        🎯 Match the whole string and report group spans
+
+        Uses the one-pass tagged DFA when the program allows it, else the
+        Pike VM. Both run in time linear in the string. Spans equal
+        re.fullmatch's, except that a starred group able to match empty
+        does not report a final empty iteration (as in RE2).
+
+        Args:
+            string: Input string
+            stats: Optional STATS.Stats; "one_pass" is 1 if the DFA path
+                   ran, "max_threads" is the Pike VM's largest thread list
+
+        Returns:
+            tuple: (start, end) span per group, group 0 first, None for a
+                   group that did not take part; None if no match
+        """
+        stats = STATS.begin("capture.match", stats)
+        if stats is not None:
+            stats.counters["one_pass"] = int(self.one_pass)
+        if self._onepass is not None:
+            result = self.onepass_match(string)
+        else:
+            result = self.pike_match(string, stats)
+        if stats is not None:
+            STATS.finish(stats)
+        return result
+
+    def onepass_match(self, string):
+        """
+        ⚡ Match with the one-pass tagged DFA
+
+        Args:
+            string: Input string
+
+        Returns:
+            tuple: Group spans as in match(), or None if no match
+
+        Raises:
+            ValueError: If the program is not one-pass
+        """
+        table = self._onepass
+        if table is None:
+            raise ValueError("Program is not one-pass")
+        caps = [-1] * (2 * self.num_groups + 2)
+        state = 0
+        for position, symbol in enumerate(string):
+            step = table[state][0].get(symbol)
+            if step is None:
+                return None
+            state, saves = step
+            for slot in saves:
+                caps[slot] = position
+        final = table[state][1]
+        if final is None:
+            return None
+        for slot in final:
+            caps[slot] = len(string)
+        return self._spans(caps)
+
+    def pike_match(self, string, stats=None):
+        """
+        🧵 Match with the Pike VM
+
+        Args:
+            string: Input string
+            stats: Optional STATS.Stats collecting "max_threads"
+
+        Returns:
+            tuple: Group spans as in match(), or None if no match
+        """
+        ops, args, alts = self.ops, self.args, self.alts
+        width = 2 * self.num_groups + 2
+        size = len(ops)
+        # Row i of a pool holds the captures of thread i of that list
+        current_pool = [-1] * (size * width)
+        next_pool = [-1] * (size * width)
+        current, following = [], []
+        marks = [-1] * size
+        caps = [-1] * width
+
+        def add(threads, pool, pc, position):
+            """Follow epsilon instructions from pc, adding a thread per leaf"""
+            stack = [pc]
+            while stack:
+                pc = stack.pop()
+                if pc < 0:
+                    # Undo a SAVE once everything after it has been explored
+                    caps[~pc] = stack.pop()
+                    continue
+                if marks[pc] == position:
+                    continue
+                marks[pc] = position
+                op = ops[pc]
+                if op == JMP:
+                    stack.append(args[pc])
+                elif op == SPLIT:
+                    stack.append(alts[pc])
+                    stack.append(args[pc])
+                elif op == SAVE:
+                    slot = args[pc]
+                    stack.append(caps[slot])
+                    stack.append(~slot)
+                    caps[slot] = position
+                    stack.append(pc + 1)
+                else:
+                    base = len(threads) * width
+                    pool[base:base + width] = caps
+                    threads.append(pc)
+
+        add(current, current_pool, 0, 0)
+        for position, symbol in enumerate(string, 1):
+            following.clear()
+            for i, pc in enumerate(current):
+                if ops[pc] == CHAR and args[pc] == symbol:
+                    caps[:] = current_pool[i * width:(i + 1) * width]
+                    add(following, next_pool, pc + 1, position)
+            if stats is not None:
+                stats.peak("max_threads", len(following))
+            if not following:
+                return None
+            current, following = following, current
+            current_pool, next_pool = next_pool, current_pool
+        for i, pc in enumerate(current):
+            if ops[pc] == MATCH:
+                return self._spans(current_pool[i * width:(i + 1) * width])
+        return None
+
+
+def regex_to_program(regex, stats=None, budget=None):
+    """
+    🎯 Compile a regex with capture groups
+
+    Accepts the same syntax as regex_to_nfa; every parenthesized group
+    captures, numbered by its opening parenthesis. Repetitions {m,n} are
+    unrolled, and a group inside one reports its last iteration, as in re.
+
+    Args:
+        regex: Regular expression string
+        stats: Optional STATS.Stats collecting the program size
+        budget: Optional BUDGET.Budget; max_states bounds the program size
+
+    Returns:
+        CaptureProgram: Compiled program
+
+    Raises:
+        ValueError: If the regex cannot be parsed
+        BudgetExceeded: If the budget runs out or is cancelled
+    """
+    stats = STATS.begin("regex_to_program", stats)
+    if budget is not None:
+        stats = budget.start("regex_to_program", stats)
+    groups = 0
+    checked = 0
+
+    # Fragments are instruction lists with targets relative to the
+    # instruction itself, so they can be concatenated and copied freely.
+    # Every constructor reports its size to grow(), which checks the
+    # budget each time the largest fragment has grown by 256 instructions
+    def grow(size):
+        nonlocal checked
+        if stats is not None:
+            stats.peak("states", size)
+            if size >= checked + 256:
+                checked = size
+                stats.checkpoint()
+                if budget is not None:
+                    budget.check(stats)
+
+    def built(fragment):
+        grow(len(fragment))
+        return fragment
+
+    def union(first, second):
+        return built([(SPLIT, 1, len(first) + 2)] + first + [(JMP, len(second) + 1, None)] + second)
+
+    def star(body):
+        # The loop back is a SPLIT rather than a JMP: if the body matched
+        # empty, the loop head is already visited at this position and
+        # the thread leaves through the exit with the empty iteration's
+        # captures, which is what re reports
+        return built([(SPLIT, 1, len(body) + 2)] + body + [(SPLIT, -len(body) - 1, 1)])
+
+    def repeat(body, low, high):
+        # Checked before unrolling, so x{1000000} fails without copying
+        grow(len(body) * (low + 1 if high is None else high))
+        result = body * low
+        if high is None:
+            return built(result + star(body))
+        optional = []
+        for _ in range(high - low):
+            optional = body + optional
+            optional = [(SPLIT, 1, len(optional) + 1)] + optional
+        return built(result + optional)
+
+    def group(body, number):
+        nonlocal groups
+        groups = max(groups, number)
+        return built([(SAVE, 2 * number, None)] + body + [(SAVE, 2 * number + 1, None)])
+
+    builder = {
+        "empty": lambda: [],
+        "char": lambda c: built([(CHAR, c, None)]),
+        "union": union,
+        "concat": lambda first, second: built(first + second),
+        "star": star,
+        "repeat": repeat,
+        "group": group,
+    }
+    started = time.perf_counter()
+    try:
+        body = parse_regex(regex, builder)
+    except BudgetExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to parse regex: {str(e)}")
+
+    relative = [(SAVE, 0, None)] + body + [(SAVE, 1, None), (MATCH, None, None)]
+    instructions = []
+    for pc, (op, arg, alt) in enumerate(relative):
+        if op == JMP:
+            arg += pc
+        elif op == SPLIT:
+            arg, alt = arg + pc, alt + pc
+        instructions.append((op, arg, alt))
+    program = CaptureProgram(instructions, groups)
+
+    if stats is not None:
+        stats.counters["parse_seconds"] = time.perf_counter() - started
+        stats.counters["states"] = len(program)
+        stats.counters["groups"] = groups
+        stats.counters["one_pass"] = int(program.one_pass)
+        STATS.finish(stats)
+    return program
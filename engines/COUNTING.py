@@ -0,0 +1,329 @@
+import time
+from engines import STATS
+from engines.BUDGET import BudgetExceeded
+from engines.INTERN import members
+from engines.NFA import NFA
+from engines.REGEX import parse_regex
+
+# ===============================================================
+# 🔢 COUNTING AUTOMATA
+# ===============================================================
+# x{m,n} is built from ONE copy of x plus a counter c instead of n
+# copies. The epsilon edges around the body carry counter operations:
+#   enter --PUSH c-->   body start    (c = 1, first iteration)
+#   body end --INCR c-->  body start  (only while c < n)
+#   body end --EXIT c-->  exit        (only once c >= m; c is dropped)
+# A configuration is a state plus the values of the counters around it
+# (outermost first). Values past an unbounded repetition's minimum
+# behave alike, so they saturate at m and every counter stays finite.
+#
+# Bit-vector encoding: the active configurations of a state are stored
+# as {values of the outer counters: bitset of innermost values}, bit v
+# set meaning "innermost counter = v" (bit 0 = no counter, for states
+# outside every repetition). INCR on all values at once is one shift,
+# and EXIT tests every value with one mask, so (a|b)*a(a|b){4096} keeps
+# a single 4096-bit int per body state instead of thousands of copies.
+
+PUSH, INCR, EXIT = "push", "incr", "exit"
+
+
+class CountingNFA:
+    """
+    🔢 NFA with bounded-repetition counters
+
+    Attributes:
+        transitions: dict[state][symbol] = set of states (no epsilon)
+        epsilon: dict[state] = list of (dest, op, counter); op is None,
+                 PUSH, INCR or EXIT
+        counters: List of (low, high) bounds, high None when unbounded
+        start_state: Start state (outside every repetition)
+        accept_states: Set of accept states
+        states: Set of all states
+    """
+
+    __slots__ = ("transitions", "epsilon", "counters", "start_state", "accept_states", "states")
+
+    def __init__(self):
+        """🔧 Initialize empty counting NFA"""
+        self.transitions = {}
+        self.epsilon = {}
+        self.counters = []
+        self.start_state = None
+        self.accept_states = set()
+        self.states = set()
+
+    def add_transition(self, src, symbol, dest):
+        """
+        ➕ Add a symbol transition
+
+        Args:
+            src: Source state
+            symbol: Input symbol (not "")
+            dest: Destination state
+        """
+        self.transitions.setdefault(src, {}).setdefault(symbol, set()).add(dest)
+        self.states.add(src)
+        self.states.add(dest)
+
+    def add_epsilon(self, src, dest, op=None, counter=None):
+        """
+        ➕ Add an epsilon transition, optionally with a counter operation
+
+        Args:
+            src: Source state
+            dest: Destination state
+            op: None, PUSH, INCR or EXIT
+            counter: Index into counters (for PUSH, INCR and EXIT)
+        """
+        self.epsilon.setdefault(src, []).append((dest, op, counter))
+        self.states.add(src)
+        self.states.add(dest)
+
+    def _apply(self, op, counter, key, bits):
+        """(key, bits) pairs reached by one counter operation"""
+        if op is None:
+            return ((key, bits),)
+        low, high = self.counters[counter]
+        if op == PUSH:
+            # Every current innermost value moves to the outer key
+            return tuple((key + (value,) if value else key, 2) for value in members(bits))
+        if op == INCR:
+            if high is not None:
+                bits = (bits & ((1 << high) - 1)) << 1
+            else:
+                cap = max(low, 1)
+                bits <<= 1
+                if bits >> cap > 1:
+                    bits = (bits & ((1 << cap) - 1)) | (1 << cap)
+            return ((key, bits),) if bits else ()
+        # EXIT: allowed if any value reached the minimum
+        if not bits >> max(low, 1):
+            return ()
+        if key:
+            return ((key[:-1], 1 << key[-1]),)
+        return (((), 1),)
+
+    def _close(self, current):
+        """Extend {state: {key: bits}} in place with every epsilon move"""
+        stack = [(state, key, bits) for state, configs in current.items() for key, bits in configs.items()]
+        while stack:
+            state, key, bits = stack.pop()
+            for dest, op, counter in self.epsilon.get(state, ()):
+                for new_key, new_bits in self._apply(op, counter, key, bits):
+                    configs = current.get(dest)
+                    if configs is None:
+                        configs = current[dest] = {}
+                    old = configs.get(new_key, 0)
+                    added = new_bits & ~old
+                    if added:
+                        configs[new_key] = old | added
+                        stack.append((dest, new_key, added))
+        return current
+
+    def simulate(self, string, stats=None):
+        """
+        🔄 Simulate on a string, tracking counter values as bit-vectors
+
+        Args:
+            string: Input string to process
+            stats: Optional STATS.Stats collecting the active-state count
+                   and the number of (state, outer values) entries per step
+
+        Returns:
+            bool: True if string is accepted, False otherwise
+        """
+        stats = STATS.begin("counting.simulate", stats)
+        current = self._close({self.start_state: {(): 1}})
+        for symbol in string:
+            following = {}
+            for state, configs in current.items():
+                destinations = self.transitions.get(state, {}).get(symbol)
+                if not destinations:
+                    continue
+                for dest in destinations:
+                    target = following.get(dest)
+                    if target is None:
+                        following[dest] = dict(configs)
+                        continue
+                    for key, bits in configs.items():
+                        target[key] = target.get(key, 0) | bits
+            current = self._close(following)
+            if stats is not None:
+                stats.incr("steps")
+                stats.record("active_states", len(current))
+                stats.peak("max_configurations", sum(len(configs) for configs in current.values()))
+                if stats.counters["steps"] % 1024 == 0:
+                    stats.checkpoint()
+            if not current:
+                break
+        if stats is not None:
+            STATS.finish(stats)
+        return any(state in self.accept_states for state in current)
+
+    def to_nfa(self, stats=None, budget=None):
+        """
+        📤 Unroll the counters into a plain NFA
+
+        Each reachable (state, counter values) configuration becomes a
+        state named "state" or "state#v1.v2", so the size grows with the
+        repetition bounds; use a budget for large ones.
+
+        Args:
+            stats: Optional STATS.Stats collecting the number of states
+            budget: Optional BUDGET.Budget; max_states bounds the NFA size
+
+        Returns:
+            NFA: Equivalent NFA with epsilon transitions
+
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        stats = STATS.begin("counting.to_nfa", stats)
+        if budget is not None:
+            stats = budget.start("counting.to_nfa", stats)
+
+        def name(state, values):
+            return f"{state}#{'.'.join(map(str, values))}" if values else state
+
+        result = NFA()
+        start = (self.start_state, ())
+        result.start_state = name(*start)
+        result.states.add(result.start_state)
+        seen = {start}
+        order = [start]
+        for state, values in order:
+            src = name(state, values)
+            if state in self.accept_states and not values:
+                result.accept_states.add(src)
+            moves = [(symbol, dest, values) for symbol, destinations in self.transitions.get(state, {}).items()
+                     for dest in destinations]
+            for dest, op, counter in self.epsilon.get(state, ()):
+                if op is None:
+                    moves.append(("", dest, values))
+                    continue
+                low, high = self.counters[counter]
+                if op == PUSH:
+                    moves.append(("", dest, values + (1,)))
+                elif op == INCR:
+                    if high is None:
+                        moves.append(("", dest, values[:-1] + (min(values[-1] + 1, max(low, 1)),)))
+                    elif values[-1] < high:
+                        moves.append(("", dest, values[:-1] + (values[-1] + 1,)))
+                elif values[-1] >= max(low, 1):
+                    moves.append(("", dest, values[:-1]))
+            for symbol, dest, dest_values in moves:
+                target = (dest, dest_values)
+                if target not in seen:
+                    seen.add(target)
+                    order.append(target)
+                    if stats is not None and len(order) % 256 == 0:
+                        stats.counters["states"] = len(order)
+                        stats.checkpoint()
+                        if budget is not None:
+                            budget.check(stats)
+                result.add_transition(src, symbol, name(*target))
+        if stats is not None:
+            stats.counters["states"] = len(order)
+            STATS.finish(stats)
+        return result
+
+
+def regex_to_counting_nfa(regex, stats=None, budget=None):
+    """
+    🔢 Convert a regex to a counting NFA
+
+    Accepts the same syntax as regex_to_nfa. Every {m,n} repetition keeps
+    a single copy of its body and one counter, so the automaton's size is
+    proportional to the regex text whatever the bounds are.
+
+    Args:
+        regex: Regular expression string
+        stats: Optional STATS.Stats collecting states created and parse time
+        budget: Optional BUDGET.Budget; max_states bounds the automaton size
+
+    Returns:
+        CountingNFA: Equivalent counting automaton
+
+    Raises:
+        ValueError: If the regex cannot be parsed
+        BudgetExceeded: If the budget runs out or is cancelled
+    """
+    stats = STATS.begin("regex_to_counting_nfa", stats)
+    if budget is not None:
+        stats = budget.start("regex_to_counting_nfa", stats)
+    automaton = CountingNFA()
+    state_counter = 0
+
+    # Fragments are (start, end) pairs of states in `automaton`
+    def get_new_state():
+        nonlocal state_counter
+        state = f"c{state_counter}"
+        state_counter += 1
+        automaton.states.add(state)
+        if stats is not None and state_counter % 256 == 0:
+            stats.counters["states"] = state_counter
+            stats.checkpoint()
+            if budget is not None:
+                budget.check(stats)
+        return state
+
+    def empty():
+        state = get_new_state()
+        return state, state
+
+    def char(c):
+        start, end = get_new_state(), get_new_state()
+        automaton.add_transition(start, c, end)
+        return start, end
+
+    def union(first, second):
+        start, end = get_new_state(), get_new_state()
+        for fragment in (first, second):
+            automaton.add_epsilon(start, fragment[0])
+            automaton.add_epsilon(fragment[1], end)
+        return start, end
+
+    def concat(first, second):
+        automaton.add_epsilon(first[1], second[0])
+        return first[0], second[1]
+
+    def star(body):
+        start, end = get_new_state(), get_new_state()
+        automaton.add_epsilon(start, end)
+        automaton.add_epsilon(start, body[0])
+        automaton.add_epsilon(body[1], body[0])
+        automaton.add_epsilon(body[1], end)
+        return start, end
+
+    def repeat(body, low, high):
+        if high == 0:
+            return empty()
+        counter = len(automaton.counters)
+        automaton.counters.append((low, high))
+        start, end = get_new_state(), get_new_state()
+        automaton.add_epsilon(start, body[0], PUSH, counter)
+        if high != 1:
+            automaton.add_epsilon(body[1], body[0], INCR, counter)
+        automaton.add_epsilon(body[1], end, EXIT, counter)
+        if low == 0:
+            automaton.add_epsilon(start, end)
+        return start, end
+
+    builder = {"empty": empty, "char": char, "union": union, "concat": concat, "star": star, "repeat": repeat}
+    started = time.perf_counter()
+    try:
+        start, end = parse_regex(regex, builder)
+    except BudgetExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to parse regex: {str(e)}")
+    automaton.start_state = start
+    automaton.accept_states = {end}
+
+    if stats is not None:
+        stats.counters["parse_seconds"] = time.perf_counter() - started
+        stats.counters["states"] = len(automaton.states)
+        stats.counters["counters"] = len(automaton.counters)
+        stats.counters["regex_length"] = len(regex)
+        STATS.finish(stats)
+    return automaton
@@ -0,0 +1,144 @@
+from collections import deque
+
+# ===============================================================
+# 🧪 TRANSITION-COVERAGE TEST CORPORA
+# ===============================================================
+# A corpus is built from two BFS trees over the compiled table:
+# - forward from the start state: the shortest access string of each state
+# - backward from the accepting states: the shortest accepting suffix
+# For every transition (s, c) -> t it contains access(s) + c and, when t
+# can still reach acceptance, access(s) + c + suffix(t), so every state
+# and transition is exercised on both an accepted and a rejected path.
+# Missing transitions (the implicit dead state) and transitions into
+# states that can never accept give the rejection cases.
+
+
+class CoverageCorpus:
+    """
+    🧪 Small set of strings exercising every reachable transition of a DFA
+
+    Attributes:
+        strings: Test inputs in length-lexicographic order
+        expected: bytearray, 1 where the source DFA accepts strings[i]
+        rejections: Number of cases that hit the dead state
+        unreachable: States no input can reach (not covered)
+    """
+
+    def __init__(self, strings, expected, rejections=0, unreachable=()):
+        """
+        🔧 Initialize from prebuilt cases
+
+        Args:
+            strings: List of input strings
+            expected: bytearray with the expected result per string
+            rejections: Number of dead-state cases among the strings
+            unreachable: States not covered by the corpus
+        """
+        self.strings = strings
+        self.expected = expected
+        self.rejections = rejections
+        self.unreachable = list(unreachable)
+
+    @classmethod
+    def from_dfa(cls, dfa):
+        """
+        🏗️ Build the coverage corpus of a DFA
+
+        Args:
+            dfa: DFA instance
+
+        Returns:
+            CoverageCorpus: Cases covering all reachable states and transitions
+        """
+        compiled = dfa.compile()
+        width = len(compiled.symbols)
+        table = compiled.table
+        access = _access_strings(compiled)
+        suffix = _accepting_suffixes(compiled)
+
+        cases = {"": compiled.accepting[compiled.start] == 1}
+        rejections = set()
+        for state, prefix in enumerate(access):
+            if prefix is None:
+                continue
+            for column, symbol in enumerate(compiled.symbols):
+                word = prefix + symbol
+                dest = table[state * width + column]
+                if dest < 0:
+                    cases[word] = False
+                    rejections.add(word)
+                    continue
+                cases[word] = compiled.accepting[dest] == 1
+                if suffix[dest] is None:
+                    rejections.add(word)
+                elif suffix[dest]:
+                    cases[word + suffix[dest]] = True
+
+        strings = sorted(cases, key=lambda word: (len(word), word))
+        expected = bytearray(cases[word] for word in strings)
+        unreachable = [compiled.names[state] for state, prefix in enumerate(access) if prefix is None]
+        return cls(strings, expected, len(rejections), unreachable)
+
+    def __len__(self):
+        """Number of test cases"""
+        return len(self.strings)
+
+    def run(self, other):
+        """
+        🏃 Run the corpus against another DFA
+
+        Args:
+            other: DFA (or CompiledDFA) that should accept the same language
+
+        Returns:
+            list: (string, expected, actual) for every case where `other`
+                  disagrees with the source DFA; empty if all cases pass
+        """
+        compiled = other.compile() if hasattr(other, "compile") else other
+        results = compiled.simulate_batch(self.strings)
+        return [
+            (word, bool(expected), actual)
+            for word, expected, actual in zip(self.strings, self.expected, results)
+            if bool(expected) != actual
+        ]
+
+
+def _access_strings(compiled):
+    """Shortest (then alphabetically first) input reaching each state id, None if unreachable"""
+    width = len(compiled.symbols)
+    access = [None] * compiled.num_states
+    access[compiled.start] = ""
+    queue = deque([compiled.start])
+    while queue:
+        state = queue.popleft()
+        for column in range(width):
+            dest = compiled.table[state * width + column]
+            if dest >= 0 and access[dest] is None:
+                access[dest] = access[state] + compiled.symbols[column]
+                queue.append(dest)
+    return access
+
+
+def _accepting_suffixes(compiled):
+    """Shortest input leading from each state id to acceptance, None if there is none"""
+    width = len(compiled.symbols)
+    predecessors = [[] for _ in range(compiled.num_states)]
+    for state in range(compiled.num_states):
+        for column in range(width):
+            dest = compiled.table[state * width + column]
+            if dest >= 0:
+                predecessors[dest].append((state, column))
+
+    suffix = [None] * compiled.num_states
+    queue = deque()
+    for state in range(compiled.num_states):
+        if compiled.accepting[state]:
+            suffix[state] = ""
+            queue.append(state)
+    while queue:
+        state = queue.popleft()
+        for source, column in predecessors[state]:
+            if suffix[source] is None:
+                suffix[source] = compiled.symbols[column] + suffix[state]
+                queue.append(source)
+    return suffix
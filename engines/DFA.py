@@ -1,4 +1,9 @@
+import hashlib
+import json
 from collections import deque
+from engines import LANGUAGE, STATS
+from engines.COMPILED import CompiledDFA
+from engines.TRACE import DFATrace
 
 # ===============================================================
 # 🎲 DETERMINISTIC FINITE AUTOMATA (DFA) CLASS  
@@ -15,6 +20,8 @@ class DFA:
     - F: set of accept states
     """
     
+    __slots__ = ("states", "alphabet", "start_state", "accept_states", "transitions")
+    
     def __init__(self, states, alphabet, start_state, accept_states, transitions):
         """
         🔧 Initialize DFA with given parameters
@@ -32,16 +39,103 @@ class DFA:
         self.accept_states = set(accept_states)
         self.transitions = transitions  # dict[state][symbol] = state
 
-    def simulate(self, input_str):
+    def add_state(self, state, accepting=False):
+        """
+        ➕ Add a state without outgoing transitions
+
+        Args:
+            state: New state name
+            accepting: Whether the new state is an accept state
+
+        Raises:
+            ValueError: If the state already exists
+        """
+        if state in self.states:
+            raise ValueError(f"State {state!r} already exists")
+        self.states.add(state)
+        self.transitions[state] = {}
+        if accepting:
+            self.accept_states.add(state)
+
+    def set_transition(self, src, symbol, dest):
+        """
+        ✏️ Add or replace the transition src --symbol--> dest
+
+        A symbol outside the alphabet is added to it.
+
+        Args:
+            src: Source state
+            symbol: Input symbol
+            dest: Destination state
+
+        Returns:
+            Previous destination, or None if there was no transition
+
+        Raises:
+            ValueError: If src or dest is not a state
+        """
+        for state in (src, dest):
+            if state not in self.states:
+                raise ValueError(f"Unknown state {state!r}")
+        self.alphabet.add(symbol)
+        edges = self.transitions.setdefault(src, {})
+        previous = edges.get(symbol)
+        edges[symbol] = dest
+        return previous
+
+    def remove_transition(self, src, symbol):
+        """
+        ✂️ Remove the transition of src on symbol
+
+        Args:
+            src: Source state
+            symbol: Input symbol
+
+        Returns:
+            The removed destination
+
+        Raises:
+            ValueError: If there is no such transition
+        """
+        edges = self.transitions.get(src, {})
+        if symbol not in edges:
+            raise ValueError(f"No transition from {src!r} on {symbol!r}")
+        return edges.pop(symbol)
+
+    def set_accepting(self, state, accepting=True):
+        """
+        🏁 Make a state accepting or non-accepting
+
+        Args:
+            state: State name
+            accepting: New flag
+
+        Raises:
+            ValueError: If the state does not exist
+        """
+        if state not in self.states:
+            raise ValueError(f"Unknown state {state!r}")
+        if accepting:
+            self.accept_states.add(state)
+        else:
+            self.accept_states.discard(state)
+
+    def simulate(self, input_str, trace=False, trace_every=1):
         """
         🔄 Simulate DFA execution on input string
         
         Args:
             input_str: String to process
+            trace: If True, also record the state sequence
+            trace_every: Record every `trace_every` positions (with trace)
             
         Returns:
             bool: True if string is accepted, False otherwise
+            (bool, DFATrace) when trace is True
         """
+        if trace:
+            recorded = DFATrace(self.compile(), input_str, trace_every)
+            return recorded.accepted, recorded
         current = self.start_state
         for symbol in input_str:
             if symbol not in self.alphabet:
@@ -51,13 +145,25 @@ class DFA:
                 return False
         return current in self.accept_states
 
-    def minimize(self):
+    def minimize(self, stats=None, budget=None):
         """
         ⚡ Minimize DFA using Hopcroft's Algorithm
         
+        Args:
+            stats: Optional STATS.Stats collecting refinement rounds,
+                   splits and final partition sizes
+            budget: Optional BUDGET.Budget; max_states applies to the input
+        
         Returns:
             DFA: Minimized equivalent DFA
+            
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
         """
+        stats = STATS.begin("dfa.minimize", stats)
+        if budget is not None:
+            stats = budget.start("dfa.minimize", stats, states=len(self.states))
+
         # Hopcroft's Algorithm - O(n log n) complexity
         partition = [self.accept_states, self.states - self.accept_states]
         waiting = deque(partition)
@@ -77,6 +183,14 @@ class DFA:
                             waiting.extend([inter, diff])
                         else:
                             waiting.append(inter if len(inter) <= len(diff) else diff)
+                        if stats is not None:
+                            stats.incr("splits")
+            if stats is not None:
+                stats.incr("rounds")
+                stats.peak("max_waiting", len(waiting))
+                stats.checkpoint()
+                if budget is not None:
+                    budget.check(stats)
 
         new_states = ["S" + str(i) for i in range(len(partition))]
         state_map = {}
@@ -95,10 +209,15 @@ class DFA:
                     new_transitions[new_state][c] = state_map[dest]
         new_start = state_map[self.start_state]
         new_accept = {state_map[s] for s in self.accept_states}
+
+        if stats is not None:
+            stats.counters["blocks"] = len(partition)
+            stats.series["partition_sizes"] = sorted((len(group) for group in partition), reverse=True)
+            STATS.finish(stats)
         
         return DFA(new_states, self.alphabet, new_start, new_accept, new_transitions)
 
-    def is_equivalent(self, other):
+    def is_equivalent(self, other, stats=None, budget=None):
         """
         ⚖️ Check if this DFA is equivalent to another DFA
         
@@ -107,10 +226,19 @@ class DFA:
         
         Args:
             other: Another DFA to compare with
+            stats: Optional STATS.Stats collecting explored product pairs
+            budget: Optional BUDGET.Budget; max_pairs bounds the product size
             
         Returns:
             bool: True if DFAs are equivalent, False otherwise
+            
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
         """
+        stats = STATS.begin("dfa.is_equivalent", stats)
+        if budget is not None:
+            stats = budget.start("dfa.is_equivalent", stats)
+
         # Check if symmetric difference is empty using BFS
         visited = set()
         queue = deque([(self.start_state, other.start_state)])
@@ -118,18 +246,70 @@ class DFA:
         while queue:
             s1, s2 = queue.popleft()
             if (s1 in self.accept_states) != (s2 in other.accept_states):
+                if stats is not None:
+                    stats.counters["pairs"] = len(visited)
+                    STATS.finish(stats)
                 return False
             if (s1, s2) in visited:
                 continue
             visited.add((s1, s2))
+            if stats is not None and len(visited) % 1024 == 0:
+                stats.counters["pairs"] = len(visited)
+                stats.peak("max_queue", len(queue))
+                stats.checkpoint()
+                if budget is not None:
+                    budget.check(stats)
 
-            for c in self.alphabet:
-                t1 = self.transitions.get(s1, {}).get(c)
-                t2 = other.transitions.get(s2, {}).get(c)
-                if t1 is not None and t2 is not None:
+            # A missing transition leads to an implicit dead state (None),
+            # which must still be compared against the other side
+            for c in self.alphabet | other.alphabet:
+                t1 = self.transitions.get(s1, {}).get(c) if s1 is not None else None
+                t2 = other.transitions.get(s2, {}).get(c) if s2 is not None else None
+                if t1 is not None or t2 is not None:
                     queue.append((t1, t2))
+
+        if stats is not None:
+            stats.counters["pairs"] = len(visited)
+            STATS.finish(stats)
         return True
 
+    def reverse(self, stats=None, budget=None):
+        """
+        🔙 Build a DFA for the reversed language
+        
+        The transitions are flipped into an NFA, which is determinized
+        again; only subsets reachable from the old accept states are built.
+        The result can be exponentially larger than this DFA, so pass a
+        budget for untrusted input.
+        
+        Args:
+            stats: Optional STATS.Stats for the determinization
+            budget: Optional BUDGET.Budget; max_states bounds the result
+        
+        Returns:
+            DFA: DFA accepting w exactly when this DFA accepts reversed(w)
+        
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        from engines.NFA import NFA
+
+        nfa = NFA()
+        start = "rev_start"
+        while start in self.states:
+            start += "'"
+        nfa.start_state = start
+        nfa.states.update(self.states | {start})
+        nfa.accept_states = {self.start_state}
+        for state in self.accept_states:
+            nfa.add_transition(start, "", state)
+        for src, edges in self.transitions.items():
+            for symbol, dest in edges.items():
+                nfa.add_transition(dest, symbol, src)
+        reversed_dfa = nfa.to_dfa(stats, budget)
+        reversed_dfa.alphabet = set(self.alphabet)
+        return reversed_dfa
+
     def get_visual_representation(self):
         """
         🎨 Get visual representation of the DFA for display
@@ -154,4 +334,121 @@ class DFA:
             )
         }
         
-        return dfa_visualization
\ No newline at end of file
+        return dfa_visualization
+
+    def compile(self):
+        """
+        🧮 Compile the DFA into a flat integer transition table
+        
+        The compiled table is a snapshot: later changes to this DFA's
+        attributes are not reflected in it.
+        
+        Returns:
+            CompiledDFA: Integer-indexed DFA in canonical state order
+        """
+        return CompiledDFA.from_dfa(self)
+
+    def shortest_accepted(self):
+        """
+        🔍 Find the shortest accepted string
+
+        Ties are broken alphabetically, so the result is deterministic.
+
+        Returns:
+            str or None: Shortest accepted string, or None if the language is empty
+        """
+        return LANGUAGE.shortest_accepted(self.compile())
+
+    def enumerate(self, max_len, limit=None):
+        """
+        📜 Generate accepted strings in length-lexicographic order
+
+        Args:
+            max_len: Longest string length to generate
+            limit: Maximum number of strings (None for no limit)
+
+        Yields:
+            str: Accepted strings, shortest first, alphabetical within a length
+        """
+        return LANGUAGE.enumerate_accepted(self.compile(), max_len, limit)
+
+    def count_accepted(self, n, modulus=None):
+        """
+        🔢 Count accepted strings of length exactly n
+
+        Exact for any n; pass a modulus to keep the numbers small when n
+        is very large.
+
+        Args:
+            n: String length (>= 0)
+            modulus: Optional modulus for the result
+
+        Returns:
+            int: Number of accepted strings of length n (mod `modulus` if given)
+        """
+        return LANGUAGE.count_accepted(self.compile(), n, modulus)
+
+    def canonical_order(self):
+        """
+        🧭 List states in canonical order
+        
+        Reachable states come first, numbered by BFS from the start state
+        over the sorted alphabet; unreachable states follow, sorted by name.
+        Two DFAs that differ only in the names of reachable states get the
+        same order position for corresponding states.
+        
+        Returns:
+            list: State names, index = canonical number
+        """
+        alphabet = sorted(self.alphabet, key=str)
+        order = [self.start_state]
+        seen = {self.start_state}
+        i = 0
+        while i < len(order):
+            edges = self.transitions.get(order[i], {})
+            for c in alphabet:
+                dest = edges.get(c)
+                if dest is not None and dest not in seen:
+                    seen.add(dest)
+                    order.append(dest)
+            i += 1
+        order.extend(sorted((s for s in self.states if s not in seen), key=str))
+        return order
+
+    def canonical(self, prefix="C"):
+        """
+        🧭 Get a copy of this DFA with states renamed in canonical order
+        
+        Args:
+            prefix: Prefix for the new state names (prefix + number)
+            
+        Returns:
+            DFA: Renamed DFA whose start state is prefix + "0"
+        """
+        order = self.canonical_order()
+        names = {state: f"{prefix}{i}" for i, state in enumerate(order)}
+        transitions = {
+            names[state]: {c: names[dest] for c, dest in self.transitions.get(state, {}).items()
+                           if dest in names}
+            for state in order
+        }
+        return DFA(names.values(), self.alphabet, names[self.start_state],
+                   [names[s] for s in self.accept_states if s in names], transitions)
+
+    def canonical_hash(self):
+        """
+        🔑 Get a stable content hash that ignores state names
+        
+        Returns:
+            str: SHA-256 hex digest of the canonical form
+        """
+        order = self.canonical_order()
+        index = {state: i for i, state in enumerate(order)}
+        alphabet = sorted(self.alphabet, key=str)
+        rows = [
+            [index.get(self.transitions.get(state, {}).get(c), -1) for c in alphabet]
+            for state in order
+        ]
+        accepting = sorted(index[s] for s in self.accept_states if s in index)
+        text = json.dumps([alphabet, accepting, rows], separators=(",", ":"), default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,356 @@
+from array import array
+from engines import STATS
+from engines.DFA import DFA
+
+# ===============================================================
+# ✏️ INCREMENTAL MINIMIZATION
+# ===============================================================
+# The minimizer keeps the Myhill–Nerode partition of the edited DFA:
+# block[state] is the same for two states exactly when they accept the
+# same suffixes. Missing transitions go to an implicit dead state, which
+# has a block of its own (shared with every state that accepts nothing).
+#
+# An edit only changes the language of the edited state and of the
+# states that can reach it (its ancestors). Every other state keeps its
+# language, so its block is still right and two such blocks can never
+# become equal. Re-minimizing therefore runs Hopcroft's algorithm on a
+# reduced automaton: one node per block that still has an unaffected
+# member (using that member's transitions) plus one node per affected
+# state. Its size is the number of blocks plus the number of affected
+# states instead of the number of states.
+
+
+class IncrementalMinimizer:
+    """
+    ✏️ Edit a DFA and keep its minimal form up to date
+
+    All edits must go through this object (it wraps the DFA's mutation
+    methods and records which states changed); editing the DFA directly
+    leaves the partition stale.
+
+    Attributes:
+        dfa: The DFA being edited, changed in place
+    """
+
+    def __init__(self, dfa, stats=None, budget=None):
+        """
+        🔧 Compute the initial partition (a full minimization)
+
+        Args:
+            dfa: DFA to edit
+            stats: Optional STATS.Stats for the initial minimization
+            budget: Optional BUDGET.Budget for the initial minimization
+
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        self.dfa = dfa
+        self._predecessors = {}  # dest -> {src: number of edges src -> dest}
+        for src, edges in dfa.transitions.items():
+            for dest in edges.values():
+                self._link(src, dest)
+        self._block = {}
+        self._members = {}
+        self._dead = None
+        self._next_block = 0
+        self._dirty = set(dfa.states)
+        self.update(stats, budget)
+
+    # ---------------------------------------------------------------
+    # Edits
+    # ---------------------------------------------------------------
+    def _link(self, src, dest):
+        sources = self._predecessors.setdefault(dest, {})
+        sources[src] = sources.get(src, 0) + 1
+
+    def _unlink(self, src, dest):
+        sources = self._predecessors[dest]
+        if sources[src] == 1:
+            del sources[src]
+        else:
+            sources[src] -= 1
+
+    def add_state(self, state, accepting=False):
+        """
+        ➕ Add a state without outgoing transitions (see DFA.add_state)
+        """
+        self.dfa.add_state(state, accepting)
+        self._dirty.add(state)
+
+    def set_transition(self, src, symbol, dest):
+        """
+        ✏️ Add or replace a transition (see DFA.set_transition)
+
+        Returns:
+            Previous destination, or None if there was no transition
+        """
+        previous = self.dfa.set_transition(src, symbol, dest)
+        if previous != dest:
+            if previous is not None:
+                self._unlink(src, previous)
+            self._link(src, dest)
+            self._dirty.add(src)
+        return previous
+
+    def remove_transition(self, src, symbol):
+        """
+        ✂️ Remove a transition (see DFA.remove_transition)
+
+        Returns:
+            The removed destination
+        """
+        dest = self.dfa.remove_transition(src, symbol)
+        self._unlink(src, dest)
+        self._dirty.add(src)
+        return dest
+
+    def set_accepting(self, state, accepting=True):
+        """
+        🏁 Make a state accepting or non-accepting (see DFA.set_accepting)
+        """
+        if (state in self.dfa.accept_states) != accepting:
+            self.dfa.set_accepting(state, accepting)
+            self._dirty.add(state)
+
+    # ---------------------------------------------------------------
+    # Re-minimization
+    # ---------------------------------------------------------------
+    def _affected(self):
+        """Edited states plus every state that can reach one"""
+        affected = set(self._dirty)
+        stack = list(affected)
+        while stack:
+            state = stack.pop()
+            for src in self._predecessors.get(state, ()):
+                if src not in affected:
+                    affected.add(src)
+                    stack.append(src)
+        return affected
+
+    def _new_block(self):
+        block = self._next_block
+        self._next_block += 1
+        self._members[block] = set()
+        return block
+
+    def update(self, stats=None, budget=None):
+        """
+        🔁 Bring the partition up to date with the edits made so far
+
+        Does nothing if there were no edits since the last update.
+
+        Args:
+            stats: Optional STATS.Stats collecting affected states,
+                   reduced automaton size, splits and block count
+            budget: Optional BUDGET.Budget; max_states bounds the reduced
+                    automaton
+
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        if not self._dirty:
+            return
+        stats = STATS.begin("dfa.reminimize", stats)
+        affected = self._affected()
+        transitions = self.dfa.transitions
+        accept_states = self.dfa.accept_states
+        block = self._block
+
+        # Node 0 is the dead state (standing in for its whole block), then
+        # one node per block with an unaffected member, then affected states
+        representatives = [None]
+        node_of_block = {} if self._dead is None else {self._dead: 0}
+        for block_id, members in self._members.items():
+            if block_id == self._dead:
+                continue
+            for state in members:
+                if state not in affected:
+                    node_of_block[block_id] = len(representatives)
+                    representatives.append(state)
+                    break
+        first_affected = len(representatives)
+        node_of_state = {}
+        for state in affected:
+            node_of_state[state] = len(representatives)
+            representatives.append(state)
+
+        size = len(representatives)
+        if budget is not None:
+            stats = budget.start("dfa.reminimize", stats, states=size)
+        if stats is not None:
+            stats.counters["affected"] = len(affected)
+            stats.counters["states"] = size
+
+        alphabet = sorted(self.dfa.alphabet, key=str)
+        width = len(alphabet)
+        delta = array("i", [0]) * (size * width)
+        accepting = bytearray(size)
+        for node in range(1, size):
+            state = representatives[node]
+            accepting[node] = state in accept_states
+            edges = transitions.get(state)
+            if not edges:
+                continue
+            base = node * width
+            for column, symbol in enumerate(alphabet):
+                dest = edges.get(symbol)
+                if dest is None:
+                    continue
+                target = node_of_state.get(dest)
+                if target is None:
+                    # Unaffected (or unknown, which counts as dead) destination
+                    target = node_of_block.get(block.get(dest), 0)
+                delta[base + column] = target
+
+        classes = _refine(size, width, delta, accepting, stats, budget)
+
+        block_of_class = {}
+        for node in range(first_affected):
+            if node == 0 and self._dead is None:
+                self._dead = self._new_block()
+            block_of_class[classes[node]] = self._dead if node == 0 else block[representatives[node]]
+        for state in affected:
+            old = block.get(state)
+            if old is not None:
+                members = self._members[old]
+                members.discard(state)
+                if not members and old != self._dead:
+                    del self._members[old]
+            cls = classes[node_of_state[state]]
+            new = block_of_class.get(cls)
+            if new is None:
+                new = block_of_class[cls] = self._new_block()
+            block[state] = new
+            self._members[new].add(state)
+        self._dirty.clear()
+
+        if stats is not None:
+            stats.counters["blocks"] = len(self._members)
+            STATS.finish(stats)
+
+    def equivalent(self, first, second):
+        """
+        ⚖️ Check whether two states accept the same suffixes
+
+        Args:
+            first: State name
+            second: State name
+
+        Returns:
+            bool: True if both states are in the same block
+        """
+        self.update()
+        return self._block[first] == self._block[second]
+
+    def minimized(self, stats=None, budget=None):
+        """
+        ⚡ Get the minimal DFA for the current language
+
+        Only blocks reachable from the start state are kept and the dead
+        block is left out (its transitions become missing ones), so the
+        result is the minimal partial DFA.
+
+        Args:
+            stats: Optional STATS.Stats for the update, if one is needed
+            budget: Optional BUDGET.Budget for the update
+
+        Returns:
+            DFA: Minimal DFA with states S0, S1, ... in canonical order
+
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        self.update(stats, budget)
+        dfa = self.dfa
+        block = self._block
+        start = block[dfa.start_state]
+        names = {start: f"B{start}"}
+        order = [start]
+        transitions = {}
+        accept_states = []
+        for current in order:
+            state = next(iter(self._members[current]))
+            name = names[current]
+            transitions[name] = {}
+            if state in dfa.accept_states:
+                accept_states.append(name)
+            for symbol, dest in dfa.transitions.get(state, {}).items():
+                target = block.get(dest, self._dead)
+                if target == self._dead:
+                    continue
+                if target not in names:
+                    names[target] = f"B{target}"
+                    order.append(target)
+                transitions[name][symbol] = names[target]
+        if start == self._dead:
+            transitions = {names[start]: {}}
+        result = DFA(names.values(), dfa.alphabet, names[start], accept_states, transitions)
+        return result.canonical("S")
+
+
+def _refine(size, width, delta, accepting, stats=None, budget=None):
+    """
+    Hopcroft's algorithm on a complete integer DFA (delta[node * width +
+    column] = next node); returns the block number of every node
+    """
+    # Inverse transitions per symbol in CSR form (sources grouped by target)
+    inverse = []
+    for column in range(width):
+        counts = array("i", [0]) * (size + 1)
+        for node in range(size):
+            counts[delta[node * width + column] + 1] += 1
+        for node in range(size):
+            counts[node + 1] += counts[node]
+        sources = array("i", [0]) * size
+        fill = array("i", counts)
+        for node in range(size):
+            target = delta[node * width + column]
+            sources[fill[target]] = node
+            fill[target] += 1
+        inverse.append((counts, sources))
+
+    block_of = array("i", [0]) * size
+    initial = [set(), set()]
+    for node in range(size):
+        initial[accepting[node]].add(node)
+    blocks = [members for members in initial if members]
+    for number, members in enumerate(blocks):
+        for node in members:
+            block_of[node] = number
+    # With two blocks, splitting by the smaller one is enough
+    waiting = {min(range(2), key=lambda number: len(blocks[number]))} if len(blocks) == 2 else set()
+
+    rounds = 0
+    while waiting:
+        splitter = list(blocks[waiting.pop()])
+        for counts, sources in inverse:
+            touched = {}
+            for node in splitter:
+                for src in sources[counts[node]:counts[node + 1]]:
+                    members = touched.get(block_of[src])
+                    if members is None:
+                        members = touched[block_of[src]] = set()
+                    members.add(src)
+            for split, members in touched.items():
+                rest = blocks[split]
+                if len(members) == len(rest):
+                    continue
+                rest -= members
+                new = len(blocks)
+                blocks.append(members)
+                for src in members:
+                    block_of[src] = new
+                # Keep both halves pending if the block was; otherwise the
+                # smaller half is enough (Hopcroft's "process the smaller half")
+                if split in waiting or len(members) <= len(rest):
+                    waiting.add(new)
+                else:
+                    waiting.add(split)
+                if stats is not None:
+                    stats.incr("splits")
+        rounds += 1
+        if stats is not None and rounds % 64 == 0:
+            stats.checkpoint()
+            if budget is not None:
+                budget.check(stats)
+    return block_of
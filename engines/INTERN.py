@@ -0,0 +1,213 @@
+from bisect import bisect_left, bisect_right
+
+# ===============================================================
+# 🧩 STATE-SET INTERNING
+# ===============================================================
+# Subset constructions discover states that are sets of integer state
+# ids, and need a dense id for each distinct one. Sets are keyed as
+# Python int bitsets (bit i set = state i present): union is a single
+# C-level |, and hashing or comparing a 5k-state set touches about 80
+# machine words instead of thousands of frozenset entries holding string
+# names. An Interner stores each key once in an arena list indexed by
+# id, so the construction itself only passes small ints around.
+
+
+class Interner:
+    """
+    🧩 Dense ids for hashable keys, with every key stored once
+
+    Attributes:
+        keys: Arena of interned keys, index = id
+    """
+
+    __slots__ = ("keys", "_ids")
+
+    def __init__(self):
+        self.keys = []
+        self._ids = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def intern(self, key):
+        """
+        📌 Get the id of a key, assigning the next id if it is new
+
+        Args:
+            key: Hashable key (usually an int bitset)
+
+        Returns:
+            tuple: (id, True if the key was new)
+        """
+        number = self._ids.get(key)
+        if number is not None:
+            return number, False
+        number = self._ids[key] = len(self.keys)
+        self.keys.append(key)
+        return number, True
+
+    def get(self, key, default=None):
+        """
+        🔍 Get the id of a key without interning it
+
+        Args:
+            key: Hashable key
+            default: Returned if the key was never interned
+
+        Returns:
+            int: Id of the key, or `default`
+        """
+        return self._ids.get(key, default)
+
+
+def to_bits(states):
+    """
+    🔢 Pack state ids into an int bitset
+
+    Args:
+        states: Iterable of non-negative ints
+
+    Returns:
+        int: Bitset with bit i set for every id i
+    """
+    bits = 0
+    for state in states:
+        bits |= 1 << state
+    return bits
+
+
+def members(bits):
+    """
+    🔢 Unpack an int bitset
+
+    Args:
+        bits: Bitset from to_bits()
+
+    Returns:
+        list: State ids in increasing order
+    """
+    # bin() and str.find run in C, so only the set bits cost Python steps
+    text = bin(bits)[:1:-1]
+    result = []
+    position = text.find("1")
+    while position >= 0:
+        result.append(position)
+        position = text.find("1", position + 1)
+    return result
+
+
+class SubsetBuilder:
+    """
+    🧩 Epsilon closures and moves on bitsets over a CompiledNFA
+
+    The epsilon closure of every single state is computed once, on first
+    use, and reused in every subset that contains it.
+
+    Attributes:
+        nfa: CompiledNFA the subsets are built from
+        accepting: Bitset of accepting NFA states
+    """
+
+    def __init__(self, nfa):
+        """
+        🔧 Prepare the builder
+
+        Args:
+            nfa: CompiledNFA instance
+        """
+        self.nfa = nfa
+        self.accepting = to_bits(state for state in range(nfa.num_states) if nfa.accepting[state])
+        self._closures = [None] * nfa.num_states
+
+    def closure(self, state):
+        """
+        🔄 Epsilon closure of one state
+
+        Args:
+            state: State id
+
+        Returns:
+            int: Bitset of the states reachable through epsilon moves
+        """
+        cached = self._closures[state]
+        if cached is not None:
+            return cached
+        eps_offsets, eps_targets = self.nfa.eps_offsets, self.nfa.eps_targets
+        closures = self._closures
+        bits = 1 << state
+        seen = {state}
+        stack = [state]
+        while stack:
+            current = stack.pop()
+            for dest in eps_targets[eps_offsets[current]:eps_offsets[current + 1]]:
+                if dest in seen:
+                    continue
+                seen.add(dest)
+                known = closures[dest]
+                if known is not None:
+                    # Everything dest reaches is already known
+                    bits |= known
+                else:
+                    bits |= 1 << dest
+                    stack.append(dest)
+        closures[state] = bits
+        return bits
+
+    def closure_of(self, states):
+        """
+        🔄 Epsilon closure of several states
+
+        Args:
+            states: Iterable of state ids
+
+        Returns:
+            int: Bitset of the states reachable through epsilon moves
+        """
+        bits = 0
+        for state in states:
+            bits |= self.closure(state)
+        return bits
+
+    def moves(self, bits):
+        """
+        ➡️ Closed successor sets of a subset, for every symbol at once
+
+        Args:
+            bits: Bitset of an epsilon-closed subset
+
+        Returns:
+            dict: Symbol column -> bitset of the closed successor subset
+                  (columns without successors are left out)
+        """
+        nfa = self.nfa
+        offsets, labels, targets = nfa.offsets, nfa.labels, nfa.targets
+        result = {}
+        for state in members(bits):
+            for i in range(offsets[state], offsets[state + 1]):
+                column = labels[i]
+                result[column] = result.get(column, 0) | self.closure(targets[i])
+        return result
+
+    def move(self, bits, column):
+        """
+        ➡️ Closed successor set of a subset on one symbol
+
+        Args:
+            bits: Bitset of an epsilon-closed subset
+            column: Symbol column in nfa.symbols
+
+        Returns:
+            int: Bitset of the closed successor subset (0 if empty)
+        """
+        nfa = self.nfa
+        offsets, labels, targets = nfa.offsets, nfa.labels, nfa.targets
+        result = 0
+        for state in members(bits):
+            start, end = offsets[state], offsets[state + 1]
+            if start == end:
+                continue
+            start = bisect_left(labels, column, start, end)
+            end = bisect_right(labels, column, start, end)
+            for dest in targets[start:end]:
+                result |= self.closure(dest)
+        return result
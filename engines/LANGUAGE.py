@@ -0,0 +1,181 @@
+from collections import deque
+
+# ===============================================================
+# 📚 LANGUAGE QUERIES ON COMPILED DFAs
+# ===============================================================
+# Everything here works on a CompiledDFA (engines/COMPILED.py); the DFA
+# class exposes them as shortest_accepted(), enumerate() and
+# count_accepted().
+
+
+def shortest_accepted(compiled):
+    """
+    🔍 Find the shortest accepted string (lexicographically smallest on ties)
+
+    Args:
+        compiled: CompiledDFA
+
+    Returns:
+        str or None: Shortest accepted string, or None if the language is empty
+    """
+    width = len(compiled.symbols)
+    parent = {compiled.start: None}
+    queue = deque([compiled.start])
+    while queue:
+        state = queue.popleft()
+        if compiled.accepting[state]:
+            symbols = []
+            while parent[state] is not None:
+                state, column = parent[state]
+                symbols.append(compiled.symbols[column])
+            return "".join(reversed(symbols))
+        for column in range(width):
+            dest = compiled.table[state * width + column]
+            if dest >= 0 and dest not in parent:
+                parent[dest] = (state, column)
+                queue.append(dest)
+    return None
+
+
+def _live_states(compiled, max_len):
+    """
+    Bitsets live[r] of states from which some string of length exactly r
+    is accepted, for r = 0..max_len
+    """
+    width = len(compiled.symbols)
+    predecessors = [[] for _ in range(compiled.num_states)]
+    for state in range(compiled.num_states):
+        for column in range(width):
+            dest = compiled.table[state * width + column]
+            if dest >= 0:
+                predecessors[dest].append(state)
+
+    live = [sum(1 << state for state in range(compiled.num_states) if compiled.accepting[state])]
+    for _ in range(max_len):
+        bits = live[-1]
+        previous = 0
+        state = 0
+        while bits:
+            if bits & 1:
+                for source in predecessors[state]:
+                    previous |= 1 << source
+            bits >>= 1
+            state += 1
+        live.append(previous)
+    return live
+
+
+def enumerate_accepted(compiled, max_len, limit=None):
+    """
+    📜 Generate accepted strings in length-lexicographic order
+
+    Each string is produced in O(length * |alphabet|) time: prefixes that
+    cannot be completed to an accepted string of the current length are
+    never explored.
+
+    Args:
+        compiled: CompiledDFA
+        max_len: Longest string length to generate
+        limit: Maximum number of strings (None for no limit)
+
+    Yields:
+        str: Accepted strings, shortest first, alphabetical within a length
+    """
+    if limit is not None and limit <= 0:
+        return
+    width = len(compiled.symbols)
+    table = compiled.table
+    live = _live_states(compiled, max_len)
+    produced = 0
+
+    for length in range(max_len + 1):
+        if not live[length] >> compiled.start & 1:
+            continue
+        # Depth-first search in alphabetical order, one frame per prefix symbol
+        prefix = []
+        stack = [(compiled.start, 0)]
+        while stack:
+            state, column = stack.pop()
+            remaining = length - len(prefix)
+            if remaining == 0:
+                yield "".join(prefix)
+                produced += 1
+                if limit is not None and produced >= limit:
+                    return
+                if prefix:
+                    prefix.pop()
+                continue
+            while column < width:
+                dest = table[state * width + column]
+                if dest >= 0 and live[remaining - 1] >> dest & 1:
+                    break
+                column += 1
+            if column == width:
+                if prefix:
+                    prefix.pop()
+                continue
+            stack.append((state, column + 1))
+            prefix.append(compiled.symbols[column])
+            stack.append((dest, 0))
+
+
+def count_accepted(compiled, n, modulus=None):
+    """
+    🔢 Count accepted strings of length exactly n
+
+    Uses the transition-count matrix M (M[i][j] = number of symbols from
+    state i to state j): the count is row `start` of M^n times the
+    accepting vector. Small n use sparse matrix–vector products; large n
+    use repeated squaring, whichever costs fewer operations. Without a
+    modulus the arithmetic is exact (Python big ints in object arrays).
+
+    Args:
+        compiled: CompiledDFA
+        n: String length (>= 0)
+        modulus: Optional modulus for the result
+
+    Returns:
+        int: Number of accepted strings of length n (mod `modulus` if given)
+    """
+    import numpy as np
+
+    if n < 0:
+        raise ValueError(f"Length must be non-negative, got {n}")
+    size = compiled.num_states
+    width = len(compiled.symbols)
+    table = np.frombuffer(compiled.table, dtype=np.intc).reshape(size, width)
+    sources, columns = np.nonzero(table >= 0)
+    targets = table[sources, columns]
+
+    # int64 is exact as long as no intermediate sum can overflow
+    if modulus is None:
+        dtype = object
+    elif (modulus - 1) ** 2 * max(size, width) < 2 ** 63:
+        dtype = np.int64
+    else:
+        dtype = object
+
+    def reduce(values):
+        return values if modulus is None else values % modulus
+
+    vector = np.array([int(a) for a in compiled.accepting], dtype=dtype)
+    vector = reduce(vector)
+
+    edges = len(sources)
+    squaring_cost = size ** 3 * max(1, n.bit_length())
+    if n * max(edges, 1) <= squaring_cost:
+        # v_{t+1}[i] = sum of v_t[j] over transitions i -> j
+        for _ in range(n):
+            following = np.zeros(size, dtype=dtype)
+            np.add.at(following, sources, vector[targets])
+            vector = reduce(following)
+    else:
+        power = np.zeros((size, size), dtype=dtype)
+        np.add.at(power, (sources, targets), 1)
+        while n:
+            if n & 1:
+                vector = reduce(power.dot(vector))
+            n >>= 1
+            if n:
+                power = reduce(power.dot(power))
+    return int(vector[compiled.start])
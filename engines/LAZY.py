@@ -0,0 +1,165 @@
+from engines import STATS
+from engines.COMPILED import CompiledNFA
+from engines.INTERN import SubsetBuilder
+
+# ===============================================================
+# 💤 LAZY DFA WITH NFA FALLBACK
+# ===============================================================
+# The DFA is built on demand while matching: a DFA state is an
+# epsilon-closed NFA state set (an int bitset), and each transition is
+# computed the first time some input takes it and then cached. Typical
+# patterns only ever visit a handful of subsets, so after warm-up the
+# matcher runs one dict lookup per symbol, like a full DFA, without
+# paying for the subsets no input reaches.
+#
+# Memory is bounded: the cache holds at most max_states subsets and is
+# flushed when it fills up. Adversarial patterns such as
+# (a|b)*a(a|b){20} can need a new subset on almost every symbol; then
+# the cache keeps flushing and building states costs more than it
+# saves. Once a match has flushed more than max_flushes times while
+# consuming fewer than min_symbols_per_state symbols per state built,
+# it finishes with plain set simulation on the bitset (no caching),
+# which costs O(NFA size) per symbol whatever the pattern.
+
+DFA_MODE, NFA_MODE = "dfa", "nfa"
+
+
+class LazyDFA:
+    """
+    💤 Regex matcher that builds DFA states lazily into a bounded cache
+
+    The cache is kept between calls, so later matches reuse the states
+    earlier ones built.
+
+    Attributes:
+        nfa: CompiledNFA being matched
+        max_states: Cache size, in DFA states
+        max_flushes: Flushes allowed per match before the fallback check
+        min_symbols_per_state: Fall back when fewer symbols than this
+                               were consumed per DFA state built
+        mode: Mode the last match finished in (DFA_MODE or NFA_MODE)
+    """
+
+    def __init__(self, nfa, max_states=1024, max_flushes=2, min_symbols_per_state=10):
+        """
+        🔧 Prepare the matcher (no DFA state is built beyond the start)
+
+        Args:
+            nfa: NFA (e.g. from regex_to_nfa) or CompiledNFA
+            max_states: Cache size, in DFA states (at least 2)
+            max_flushes: Flushes allowed per match before falling back
+            min_symbols_per_state: Fallback threshold, see the class doc
+        """
+        if max_states < 2:
+            raise ValueError("The lazy DFA cache needs room for at least 2 states")
+        self.nfa = nfa if isinstance(nfa, CompiledNFA) else nfa.compile()
+        self.max_states = max_states
+        self.max_flushes = max_flushes
+        self.min_symbols_per_state = min_symbols_per_state
+        self.mode = None
+        self._builder = SubsetBuilder(self.nfa)
+        self._start_bits = self._builder.closure(self.nfa.start)
+        self._flush()
+
+    def _flush(self):
+        """Empty the cache, keeping only the start state (id 0)"""
+        self._ids = {}
+        self._sets = []
+        self._accepting = []
+        self._edges = []
+        self._add(self._start_bits)
+
+    def _add(self, bits):
+        number = self._ids[bits] = len(self._sets)
+        self._sets.append(bits)
+        self._accepting.append(bool(bits & self._builder.accepting))
+        self._edges.append({})
+        return number
+
+    def __len__(self):
+        """Number of DFA states currently cached"""
+        return len(self._sets)
+
+    def simulate(self, string, stats=None):
+        """
+        🔄 Check whether the regex matches the whole string
+
+        Args:
+            string: Input string
+            stats: Optional STATS.Stats collecting "states_built",
+                   "flushes", "cache_hits" and, after a fallback,
+                   "fallback_position"; "nfa_mode" is 1 if it fell back
+
+        Returns:
+            bool: True if string is accepted, False otherwise
+        """
+        stats = STATS.begin("lazy.simulate", stats)
+        builder = self._builder
+        symbol_index = self.nfa.symbol_index
+        state = 0
+        built = 0
+        flushes = 0
+        self.mode = DFA_MODE
+        accepted = None
+        for position, symbol in enumerate(string):
+            edges = self._edges[state]
+            following = edges.get(symbol)
+            if following is not None:
+                if stats is not None:
+                    stats.incr("cache_hits")
+            else:
+                column = symbol_index.get(symbol)
+                bits = builder.move(self._sets[state], column) if column is not None else 0
+                following = self._ids.get(bits)
+                if following is None:
+                    if len(self._sets) >= self.max_states:
+                        flushes += 1
+                        if (flushes > self.max_flushes
+                                and position < self.min_symbols_per_state * built):
+                            self.mode = NFA_MODE
+                            if stats is not None:
+                                stats.counters["fallback_position"] = position
+                            accepted = self._finish(bits, string, position + 1)
+                            break
+                        self._flush()
+                        edges = None
+                    following = self._add(bits)
+                    built += 1
+                if edges is not None:
+                    edges[symbol] = following
+            state = following
+            if not self._sets[state]:
+                # Dead state: no NFA state is left
+                accepted = False
+                break
+        if accepted is None:
+            accepted = self._accepting[state]
+        if stats is not None:
+            stats.counters["states_built"] = stats.counters.get("states_built", 0) + built
+            stats.counters["flushes"] = stats.counters.get("flushes", 0) + flushes
+            stats.counters["nfa_mode"] = int(self.mode == NFA_MODE)
+            STATS.finish(stats)
+        return accepted
+
+    def _finish(self, bits, string, start):
+        """Set simulation from `bits` over string[start:], without caching"""
+        builder = self._builder
+        symbol_index = self.nfa.symbol_index
+        for symbol in string[start:]:
+            column = symbol_index.get(symbol)
+            if column is None or not bits:
+                return False
+            bits = builder.move(bits, column)
+        return bool(bits & builder.accepting)
+
+    def simulate_batch(self, strings):
+        """
+        📦 Simulate many strings
+
+        Args:
+            strings: Iterable of input strings
+
+        Returns:
+            list: One bool per input string
+        """
+        return [self.simulate(s) for s in strings]
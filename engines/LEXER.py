@@ -0,0 +1,173 @@
+from array import array
+from engines import STATS
+from engines.DFA import DFA
+from engines.INTERN import Interner, SubsetBuilder
+from engines.NFA import NFA
+from engines.REGEX import regex_to_nfa
+
+# ===============================================================
+# 🔤 LEXER (LONGEST-MATCH TOKENIZER)
+# ===============================================================
+# All rules are joined under one start state and determinized together,
+# so every DFA state knows which rules could still match. Accepting DFA
+# states are labelled with the first rule (in list order) that accepts
+# there; tokenizing then walks the DFA once per token, remembering the
+# last accepting position, and emits the longest match.
+
+
+class LexError(ValueError):
+    """❌ No rule matches the input at `position`"""
+
+    def __init__(self, position, text):
+        self.position = position
+        snippet = text[position:position + 10]
+        super().__init__(f"No token rule matches at position {position}: {snippet!r}")
+
+
+class Lexer:
+    """
+    🔤 Maximal-munch tokenizer built from ordered (name, regex) rules
+
+    Attributes:
+        names: Token names, index = rule number
+        dfa: Combined DFA (accept states match at least one rule)
+        skip: Token names that are matched but not reported
+    """
+
+    def __init__(self, rules, skip=(), stats=None, budget=None):
+        """
+        🏗️ Compile the rules into one DFA
+
+        Args:
+            rules: List of (token name, regex); earlier rules win ties
+            skip: Token names to drop from the output (e.g. whitespace)
+            stats: Optional STATS.Stats collecting the states created by
+                   each rule's NFA and by the combined DFA
+            budget: Optional BUDGET.Budget; max_states bounds each rule's
+                    NFA and the DFA size
+
+        Raises:
+            ValueError: If there are no rules or a regex cannot be parsed
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        if not rules:
+            raise ValueError("A lexer needs at least one rule")
+        self.names = [name for name, _ in rules]
+        self.skip = set(skip)
+
+        # Name the whole compile, so the per-rule steps report under it
+        stats = STATS.begin("lexer.compile", stats)
+        nfa = NFA()
+        nfa.start_state = "start"
+        nfa.states.add("start")
+        owner = {}
+        for i, (_, regex) in enumerate(rules):
+            rule = regex_to_nfa(regex, stats=stats, budget=budget)
+            rename = {state: f"{i}.{state}" for state in rule.states | {rule.start_state}}
+            for src, edges in rule.transitions.items():
+                for symbol, destinations in edges.items():
+                    for dest in destinations:
+                        nfa.add_transition(rename[src], symbol, rename[dest])
+            nfa.add_transition("start", "", rename[rule.start_state])
+            for state in rule.accept_states:
+                owner[rename[state]] = i
+        nfa.accept_states = set(owner)
+
+        self.dfa, labels = _determinize(nfa, owner, stats, budget)
+        self.compiled = self.dfa.compile()
+        # Rule number accepted in each compiled state, -1 if none
+        self.rule_of = array("i", (labels.get(name, -1) for name in self.compiled.names))
+
+    def tokenize(self, text):
+        """
+        ✂️ Split text into the longest possible tokens
+
+        Empty matches are never emitted, so rules that accept the empty
+        string cannot stall the tokenizer.
+
+        Args:
+            text: Input string
+
+        Yields:
+            tuple: (token name, start, end) with text[start:end] the lexeme
+
+        Raises:
+            LexError: If no rule matches a non-empty prefix at some position
+        """
+        table = self.compiled.table
+        width = len(self.compiled.symbols)
+        columns = self.compiled.symbol_index
+        rule_of = self.rule_of
+        start_state = self.compiled.start
+        length = len(text)
+
+        position = 0
+        while position < length:
+            state = start_state
+            last_end = -1
+            last_rule = -1
+            i = position
+            while i < length:
+                column = columns.get(text[i])
+                if column is None:
+                    break
+                state = table[state * width + column]
+                if state < 0:
+                    break
+                i += 1
+                if rule_of[state] >= 0:
+                    last_end = i
+                    last_rule = rule_of[state]
+            if last_end < 0:
+                raise LexError(position, text)
+            name = self.names[last_rule]
+            if name not in self.skip:
+                yield name, position, last_end
+            position = last_end
+
+
+def _determinize(nfa, owner, stats, budget):
+    """
+    Subset construction that also labels each accepting subset with the
+    lowest rule number among its accepting NFA states
+    """
+    stats = STATS.begin("lexer.compile", stats)
+    if budget is not None:
+        stats = budget.start("lexer.compile", stats)
+
+    compiled = nfa.compile()
+    alphabet = compiled.symbols
+    builder = SubsetBuilder(compiled)
+    index = {state: i for i, state in enumerate(compiled.names)}
+    # Bitset of each rule's accepting NFA states, lowest rule number first
+    rule_bits = {}
+    for state, rule in owner.items():
+        rule_bits[rule] = rule_bits.get(rule, 0) | (1 << index[state])
+    rule_bits = sorted(rule_bits.items())
+    subsets = Interner()
+    subsets.intern(builder.closure(compiled.start))
+    labels = {}
+    transitions = {}
+
+    number = 0
+    while number < len(subsets):
+        subset = subsets.keys[number]
+        name = f"L{number}"
+        number += 1
+        edges = transitions[name] = {}
+        if subset & builder.accepting:
+            labels[name] = next(rule for rule, bits in rule_bits if subset & bits)
+        moves = builder.moves(subset)
+        for column in sorted(moves):
+            target, new = subsets.intern(moves[column])
+            if new and stats is not None:
+                stats.counters["states"] = len(subsets)
+                stats.checkpoint()
+                if budget is not None:
+                    budget.check(stats)
+            edges[alphabet[column]] = f"L{target}"
+
+    if stats is not None:
+        stats.counters["states"] = len(subsets)
+        STATS.finish(stats)
+    return DFA(list(transitions), alphabet, "L0", list(labels), transitions), labels
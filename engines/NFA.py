@@ -1,4 +1,12 @@
-from collections import defaultdict
+import sys
+from engines import STATS
+from engines.COMPILED import CompiledNFA
+from engines.DFA import DFA
+from engines.INTERN import Interner, SubsetBuilder
+from engines.TRACE import NFATrace
+
+# Shared empty mapping for states without outgoing edges (never mutated)
+_NO_EDGES = {}
 
 # ===============================================================
 # 🎲 NON-DETERMINISTIC FINITE AUTOMATA (NFA) CLASS  
@@ -11,11 +19,17 @@ class NFA:
     - Multiple transitions for the same input symbol
     - Epsilon (empty string) transitions
     - Non-deterministic choices during computation
+    
+    Transitions are plain dicts (dict[state][symbol] = set of states), so
+    looking up a state without edges never creates an entry. For large
+    NFAs use compile(), which packs the graph into integer arrays.
     """
     
+    __slots__ = ("transitions", "start_state", "accept_states", "states")
+    
     def __init__(self):
         """🔧 Initialize empty NFA"""
-        self.transitions = defaultdict(lambda: defaultdict(set))
+        self.transitions = {}
         self.start_state = None
         self.accept_states = set()
         self.states = set()
@@ -29,40 +43,227 @@ class NFA:
             symbol: Input symbol (or "" for epsilon)
             dest: Destination state
         """
-        self.transitions[src][symbol].add(dest)
-        self.states.update({src, dest})
+        if type(symbol) is str:
+            # One shared string object per symbol across all edges
+            symbol = sys.intern(symbol)
+        edges = self.transitions.get(src)
+        if edges is None:
+            edges = self.transitions[src] = {}
+        destinations = edges.get(symbol)
+        if destinations is None:
+            destinations = edges[symbol] = set()
+        destinations.add(dest)
+        self.states.add(src)
+        self.states.add(dest)
+
+    def compile(self):
+        """
+        🧮 Pack the NFA into integer CSR arrays
+        
+        The compiled NFA is a snapshot: later changes to this NFA are not
+        reflected in it.
+        
+        Returns:
+            CompiledNFA: Integer-indexed NFA with the start state as 0
+        """
+        return CompiledNFA.from_nfa(self)
 
-    def simulate(self, string):
+    def epsilon_closure(self, states, stats=None):
+        """
+        🔄 Compute epsilon closure of given states
+        
+        Args:
+            states: Iterable of states
+            stats: Optional STATS.Stats; "closure_work" counts visited states
+            
+        Returns:
+            set: All states reachable from `states` through epsilon moves
+        """
+        stack = list(states)
+        closure = set(states)
+        while stack:
+            state = stack.pop()
+            for next_state in self.transitions.get(state, _NO_EDGES).get("", ()):
+                if next_state not in closure:
+                    closure.add(next_state)
+                    stack.append(next_state)
+        if stats is not None:
+            stats.incr("closure_work", len(closure))
+        return closure
+
+    def step(self, states, symbol, stats=None):
+        """
+        ➡️ Advance a set of active states by one input symbol
+        
+        Args:
+            states: Set of active states (already epsilon-closed)
+            symbol: Input symbol
+            stats: Optional STATS.Stats, passed on to epsilon_closure
+            
+        Returns:
+            set: Epsilon closure of the states reached on `symbol`
+        """
+        next_states = set()
+        for state in states:
+            next_states.update(self.transitions.get(state, _NO_EDGES).get(symbol, ()))
+        return self.epsilon_closure(next_states, stats)
+
+    def simulate(self, string, stats=None, trace=False, trace_every=1):
         """
         🔄 Simulate NFA execution using epsilon closure
         
         Args:
             string: Input string to process
+            stats: Optional STATS.Stats collecting the active-set size per
+                   step and the number of states visited by closures
+            trace: If True, also record the sequence of active sets
+            trace_every: Record every `trace_every` positions (with trace)
             
         Returns:
             bool: True if string is accepted, False otherwise
+            (bool, NFATrace) when trace is True
+        """
+        stats = STATS.begin("nfa.simulate", stats)
+        recorder = NFATrace(self, string, trace_every) if trace else None
+
+        current_states = self.epsilon_closure({self.start_state}, stats)
+        if recorder is not None:
+            recorder.record(0, current_states)
+        for position, symbol in enumerate(string, 1):
+            current_states = self.step(current_states, symbol, stats)
+            if stats is not None:
+                stats.incr("steps")
+                stats.record("active_states", len(current_states))
+                stats.peak("max_active_states", len(current_states))
+                if stats.counters["steps"] % 1024 == 0:
+                    stats.checkpoint()
+            if recorder is not None:
+                recorder.record(position, current_states)
+
+        if stats is not None:
+            STATS.finish(stats)
+        accepted = bool(self.accept_states & current_states)
+        if recorder is not None:
+            recorder.accepted = accepted
+            return accepted, recorder
+        return accepted
+        
+    def to_dfa(self, stats=None, budget=None):
         """
+        🔁 Convert NFA to an equivalent DFA using subset construction
         
-        def epsilon_closure(states):
-            """🔄 Compute epsilon closure of given states"""
-            stack = list(states)
-            closure = set(states)
-            while stack:
-                state = stack.pop()
-                for next_state in self.transitions[state].get("", []):
-                    if next_state not in closure:
-                        closure.add(next_state)
-                        stack.append(next_state)
-            return closure
-
-        current_states = epsilon_closure({self.start_state})
-        for symbol in string:
-            next_states = set()
-            for state in current_states:
-                next_states.update(self.transitions[state].get(symbol, []))
-            current_states = epsilon_closure(next_states)
-        return bool(self.accept_states & current_states)
+        Only reachable subsets are built; a missing transition in the
+        result means the input is rejected.
         
+        Args:
+            stats: Optional STATS.Stats collecting DFA states created
+            budget: Optional BUDGET.Budget; max_states bounds the DFA size
+            
+        Returns:
+            DFA: Equivalent DFA with states D0, D1, ...
+            
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        stats = STATS.begin("nfa.to_dfa", stats)
+        if budget is not None:
+            stats = budget.start("nfa.to_dfa", stats)
+
+        # Subsets are int bitsets over the compiled NFA's state ids; their
+        # interned id is also their DFA state number
+        compiled = self.compile()
+        alphabet = compiled.symbols
+        builder = SubsetBuilder(compiled)
+        subsets = Interner()
+        subsets.intern(builder.closure(compiled.start))
+        transitions = {}
+        accept_states = []
+
+        number = 0
+        while number < len(subsets):
+            subset = subsets.keys[number]
+            name = f"D{number}"
+            number += 1
+            edges = transitions[name] = {}
+            if subset & builder.accepting:
+                accept_states.append(name)
+            moves = builder.moves(subset)
+            for column in sorted(moves):
+                target, new = subsets.intern(moves[column])
+                if new and stats is not None:
+                    stats.counters["states"] = len(subsets)
+                    stats.checkpoint()
+                    if budget is not None:
+                        budget.check(stats)
+                edges[alphabet[column]] = f"D{target}"
+
+        if stats is not None:
+            stats.counters["states"] = len(subsets)
+            STATS.finish(stats)
+        return DFA(list(transitions), alphabet, "D0", accept_states, transitions)
+
+    def reverse(self, stats=None, budget=None):
+        """
+        🔙 Build an NFA for the reversed language
+        
+        Every transition is flipped, the old start state becomes the only
+        accept state and a fresh start state has epsilon moves to the old
+        accept states.
+        
+        Args:
+            stats: Optional STATS.Stats collecting the number of states
+            budget: Optional BUDGET.Budget; max_states bounds the input size
+        
+        Returns:
+            NFA: NFA accepting w exactly when this NFA accepts reversed(w)
+        
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        stats = STATS.begin("nfa.reverse", stats)
+        if budget is not None:
+            stats = budget.start("nfa.reverse", stats, states=len(self.states) + 1)
+        result = NFA()
+        start = "rev_start"
+        while start in self.states:
+            start += "'"
+        result.start_state = start
+        result.states.update(self.states | {start, self.start_state})
+        result.accept_states = {self.start_state}
+        for state in self.accept_states:
+            result.add_transition(start, "", state)
+        for src, edges in self.transitions.items():
+            for symbol, destinations in edges.items():
+                for dest in destinations:
+                    result.add_transition(dest, symbol, src)
+        if stats is not None:
+            stats.counters["states"] = len(result.states)
+            STATS.finish(stats)
+        return result
+
+    def reduce(self, simulation=True, stats=None, budget=None):
+        """
+        🪚 Build a smaller equivalent NFA without epsilon transitions
+
+        Runs epsilon removal, trimming, bisimulation merging and simulation
+        reduction (see engines/REDUCE.py). Simulating the result costs
+        about as much per symbol as it has states and edges, so regex NFAs
+        usually match several times faster after reduction.
+
+        Args:
+            simulation: Also run the simulation-preorder pass
+            stats: Optional STATS.Stats collecting sizes after each pass
+            budget: Optional BUDGET.Budget
+
+        Returns:
+            NFA: Reduced NFA for the same language
+
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        from engines.REDUCE import reduce_nfa
+        return reduce_nfa(self, simulation, stats, budget)
+
     def get_visual_representation(self):
         """
         🎨 Get visual representation of the NFA for display
@@ -70,7 +271,7 @@ class NFA:
         Returns:
             dict: Dictionary containing NFA structure for visualization
         """
-        # Convert the defaultdict to a regular dict for JSON serialization
+        # Copy into plain dicts of lists for JSON serialization
         transitions_dict = {}
         for src in self.transitions:
             transitions_dict[src] = {}
@@ -0,0 +1,210 @@
+from engines.NFA import NFA
+
+# ===============================================================
+# 🧲 LITERAL ANALYSIS FOR PREFILTERING
+# ===============================================================
+# The analysis runs on the compiled DFA, restricted to live states
+# (reachable from the start and able to reach acceptance):
+# - first symbols: live transitions out of the start state
+# - required prefix: the forced chain from the start state, i.e. the
+#   symbols read while the current state is not accepting and has a
+#   single live outgoing transition
+# - required substring: the longest forced chain through any state that
+#   dominates acceptance (every accepting path passes through it). The
+#   chain runs forward while it is forced, and backward while every live
+#   edge into the current set of states carries the same symbol. The
+#   start state dominates acceptance, so the prefix is a candidate too.
+
+
+class Literals:
+    """
+    🧲 Literal facts that hold for every accepted string
+
+    Attributes:
+        prefix: Every accepted string starts with this ("" if none)
+        required: Every accepted string contains this ("" if none)
+        first: Set of possible first symbols of non-empty accepted strings
+        accepts_empty: Whether the empty string is accepted
+    """
+
+    def __init__(self, prefix, required, first, accepts_empty):
+        self.prefix = prefix
+        self.required = required
+        self.first = first
+        self.accepts_empty = accepts_empty
+
+    def __repr__(self):
+        return (f"Literals(prefix={self.prefix!r}, required={self.required!r}, "
+                f"first={sorted(self.first)!r}, accepts_empty={self.accepts_empty})")
+
+
+def analyze(automaton):
+    """
+    🔬 Extract required literals from an automaton
+
+    Args:
+        automaton: DFA, NFA or CompiledDFA
+
+    Returns:
+        Literals: Prefix, required substring and first-symbol set
+    """
+    if isinstance(automaton, NFA):
+        automaton = automaton.to_dfa()
+    compiled = automaton.compile() if hasattr(automaton, "compile") else automaton
+    width = len(compiled.symbols)
+    table = compiled.table
+    live = live_states(compiled)
+    start = compiled.start
+    if not live[start]:
+        return Literals("", "", set(), False)
+
+    def live_edges(state):
+        for column in range(width):
+            dest = table[state * width + column]
+            if dest >= 0 and live[dest]:
+                yield column, dest
+
+    def forced_chain(state):
+        symbols = []
+        for _ in range(compiled.num_states):
+            if compiled.accepting[state]:
+                break
+            edges = list(live_edges(state))
+            if len(edges) != 1:
+                break
+            column, state = edges[0]
+            symbols.append(compiled.symbols[column])
+        return "".join(symbols)
+
+    incoming = [[] for _ in range(compiled.num_states)]
+    for state in range(compiled.num_states):
+        if live[state]:
+            for column, dest in live_edges(state):
+                incoming[dest].append((state, column))
+
+    def forced_lead_in(state):
+        symbols = []
+        current = {state}
+        for _ in range(compiled.num_states):
+            if start in current:
+                break
+            edges = [edge for target in current for edge in incoming[target]]
+            columns = {column for _, column in edges}
+            if len(columns) != 1:
+                break
+            symbols.append(compiled.symbols[columns.pop()])
+            current = {source for source, _ in edges}
+        return "".join(reversed(symbols))
+
+    prefix = forced_chain(start)
+    required = prefix
+    for state in _dominators_of_acceptance(compiled, live, live_edges):
+        chain = forced_lead_in(state) + forced_chain(state)
+        if len(chain) > len(required):
+            required = chain
+
+    first = {compiled.symbols[column] for column, _ in live_edges(start)}
+    return Literals(prefix, required, first, compiled.accepting[start] == 1)
+
+
+def live_states(compiled):
+    """bytearray marking states that are reachable and can reach acceptance"""
+    width = len(compiled.symbols)
+    table = compiled.table
+    reachable = bytearray(compiled.num_states)
+    reachable[compiled.start] = 1
+    stack = [compiled.start]
+    predecessors = [[] for _ in range(compiled.num_states)]
+    while stack:
+        state = stack.pop()
+        for column in range(width):
+            dest = table[state * width + column]
+            if dest < 0:
+                continue
+            predecessors[dest].append(state)
+            if not reachable[dest]:
+                reachable[dest] = 1
+                stack.append(dest)
+
+    live = bytearray(compiled.num_states)
+    stack = [state for state in range(compiled.num_states) if compiled.accepting[state] and reachable[state]]
+    for state in stack:
+        live[state] = 1
+    while stack:
+        state = stack.pop()
+        for source in predecessors[state]:
+            if not live[source]:
+                live[source] = 1
+                stack.append(source)
+    return live
+
+
+def _dominators_of_acceptance(compiled, live, live_edges):
+    """
+    States on every path from the start to acceptance, using the
+    Cooper–Harvey–Kennedy iterative dominator algorithm on the live
+    graph plus a virtual sink fed by every accepting state
+    """
+    sink = compiled.num_states
+    successors = {}
+    order = []
+    seen = {compiled.start}
+    stack = [(compiled.start, None)]
+    # Iterative DFS for a postorder of the live graph
+    while stack:
+        state, edges = stack.pop()
+        if edges is None:
+            targets = [dest for _, dest in live_edges(state)]
+            if compiled.accepting[state]:
+                targets.append(sink)
+            successors[state] = targets
+            edges = iter(targets)
+        for dest in edges:
+            if dest == sink or dest in seen:
+                continue
+            seen.add(dest)
+            stack.append((state, edges))
+            stack.append((dest, None))
+            break
+        else:
+            order.append(state)
+    order.insert(0, sink)
+    rpo = list(reversed(order))
+    index = {state: i for i, state in enumerate(rpo)}
+
+    predecessors = {state: [] for state in rpo}
+    for state, targets in successors.items():
+        for dest in targets:
+            predecessors[dest].append(state)
+
+    idom = {compiled.start: compiled.start}
+
+    def intersect(a, b):
+        while a != b:
+            while index[a] > index[b]:
+                a = idom[a]
+            while index[b] > index[a]:
+                b = idom[b]
+        return a
+
+    changed = True
+    while changed:
+        changed = False
+        for state in rpo[1:]:
+            processed = [p for p in predecessors[state] if p in idom]
+            if not processed:
+                continue
+            new = processed[0]
+            for p in processed[1:]:
+                new = intersect(p, new)
+            if idom.get(state) != new:
+                idom[state] = new
+                changed = True
+
+    dominators = []
+    state = idom[sink]
+    while True:
+        dominators.append(state)
+        if state == compiled.start:
+            return dominators
+        state = idom[state]
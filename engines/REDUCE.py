@@ -0,0 +1,262 @@
+from engines import STATS
+from engines.INTERN import SubsetBuilder, members, to_bits
+from engines.NFA import NFA
+
+# Skip the simulation pass above this many states (it keeps one bitset
+# of simulating states per state, so its cost grows quadratically)
+MAX_SIMULATION_STATES = 4000
+
+# ===============================================================
+# 🪚 NFA REDUCTION PIPELINE
+# ===============================================================
+# Every pass returns an NFA for the same language with at most as many
+# states; they run on integer state ids and edges[p] = {column: set of
+# targets}:
+# 1. Epsilon removal: p gets every symbol edge of its epsilon closure and
+#    accepts if its closure does. Only the start state and targets of
+#    symbol edges are kept.
+# 2. Trim: drop states that are unreachable or cannot reach acceptance.
+# 3. Forward bisimulation: merge states with the same acceptance and the
+#    same outgoing (symbol, block) pairs: they have the same future.
+# 4. Backward bisimulation: merge states with the same incoming (block,
+#    symbol) pairs (and equally start or not): they have the same past.
+# 5. Simulation: q ⪯ p when p can match every move of q (so p accepts
+#    everything q does). Mutually similar states are merged, and of two
+#    edges p -a-> q1, p -a-> q2 with q1 ⪯ q2 only the one to q2 is kept.
+
+
+def reduce_nfa(nfa, simulation=True, stats=None, budget=None):
+    """
+    🪚 Build a smaller epsilon-free NFA for the same language
+
+    Args:
+        nfa: NFA to reduce
+        simulation: Also run the simulation-preorder pass (skipped anyway
+                    above MAX_SIMULATION_STATES states)
+        stats: Optional STATS.Stats collecting the state and edge count
+               after each pass
+        budget: Optional BUDGET.Budget; max_states applies to the input
+
+    Returns:
+        NFA: Equivalent NFA without epsilon transitions; states keep the
+             name of one of the original states they stand for
+
+    Raises:
+        BudgetExceeded: If the budget runs out or is cancelled
+    """
+    stats = STATS.begin("nfa.reduce", stats)
+    if budget is not None:
+        stats = budget.start("nfa.reduce", stats, states=len(nfa.states))
+    compiled = nfa.compile()
+
+    def record(step, edges):
+        if stats is not None:
+            stats.counters[f"{step}_states"] = len(edges)
+            stats.counters[f"{step}_edges"] = sum(len(targets) for row in edges.values() for targets in row.values())
+            stats.checkpoint()
+            if budget is not None:
+                budget.check(stats)
+
+    edges, accepting = _remove_epsilon(compiled)
+    record("epsilon", edges)
+    edges, accepting = _trim(edges, accepting, compiled.start)
+    record("trim", edges)
+    edges, accepting = _quotient(edges, accepting, compiled.start, _forward_blocks(edges, accepting))
+    edges, accepting = _quotient(edges, accepting, compiled.start,
+                                 _backward_blocks(edges, compiled.start))
+    record("bisimulation", edges)
+    if simulation and len(edges) <= MAX_SIMULATION_STATES:
+        edges, accepting = _simulation_reduce(edges, accepting, compiled.start)
+        edges, accepting = _trim(edges, accepting, compiled.start)
+        record("simulation", edges)
+
+    result = NFA()
+    names = compiled.names
+    result.start_state = names[compiled.start]
+    result.states.add(result.start_state)
+    result.states.update(names[state] for state in edges)
+    result.accept_states = {names[state] for state in accepting}
+    for src, row in edges.items():
+        for column, targets in row.items():
+            for dest in targets:
+                result.add_transition(names[src], compiled.symbols[column], names[dest])
+    if stats is not None:
+        STATS.finish(stats)
+    return result
+
+
+def _remove_epsilon(compiled):
+    """Epsilon-free edges and accept set over the states that stay reachable"""
+    builder = SubsetBuilder(compiled)
+    offsets, labels, targets = compiled.offsets, compiled.labels, compiled.targets
+    edges = {}
+    accepting = set()
+    order = [compiled.start]
+    seen = {compiled.start}
+    for state in order:
+        closure = builder.closure(state)
+        if closure & builder.accepting:
+            accepting.add(state)
+        row = edges[state] = {}
+        for member in members(closure):
+            for i in range(offsets[member], offsets[member + 1]):
+                dest = targets[i]
+                row.setdefault(labels[i], set()).add(dest)
+                if dest not in seen:
+                    seen.add(dest)
+                    order.append(dest)
+    return edges, accepting
+
+
+def _trim(edges, accepting, start):
+    """Keep the states on some path from the start to acceptance (and the start)"""
+    reachable = {start}
+    stack = [start]
+    predecessors = {}
+    while stack:
+        state = stack.pop()
+        for targets in edges.get(state, {}).values():
+            for dest in targets:
+                predecessors.setdefault(dest, set()).add(state)
+                if dest not in reachable:
+                    reachable.add(dest)
+                    stack.append(dest)
+    useful = accepting & reachable
+    stack = list(useful)
+    while stack:
+        state = stack.pop()
+        for src in predecessors.get(state, ()):
+            if src not in useful:
+                useful.add(src)
+                stack.append(src)
+    useful.add(start)
+    trimmed = {}
+    for state in useful:
+        row = {}
+        for column, targets in edges.get(state, {}).items():
+            kept = targets & useful
+            if kept:
+                row[column] = kept
+        trimmed[state] = row
+    return trimmed, accepting & useful
+
+
+def _refine(states, initial, signature):
+    """Split `initial` blocks by signature(state, block) until nothing changes"""
+    block = dict(initial)
+    count = len(set(block.values()))
+    while True:
+        numbering = {}
+        new = {}
+        for state in states:
+            new[state] = numbering.setdefault((block[state], signature(state, block)), len(numbering))
+        block = new
+        if len(numbering) == count:
+            return block
+        count = len(numbering)
+
+
+def _forward_blocks(edges, accepting):
+    """Coarsest forward bisimulation: same acceptance, same (symbol, block) successors"""
+    def signature(state, block):
+        return frozenset((column, block[dest]) for column, targets in edges[state].items() for dest in targets)
+
+    return _refine(list(edges), {state: state in accepting for state in edges}, signature)
+
+
+def _backward_blocks(edges, start):
+    """Coarsest backward bisimulation: same start flag, same (block, symbol) predecessors"""
+    incoming = {state: [] for state in edges}
+    for src, row in edges.items():
+        for column, targets in row.items():
+            for dest in targets:
+                incoming[dest].append((src, column))
+
+    def signature(state, block):
+        return frozenset((block[src], column) for src, column in incoming[state])
+
+    return _refine(list(edges), {state: state == start for state in edges}, signature)
+
+
+def _quotient(edges, accepting, start, block):
+    """
+    Merge each block into one representative (the start state for its
+    block, otherwise the smallest id); a merged state accepts if any of
+    its members does
+    """
+    representative = {}
+    for state in sorted(edges):
+        representative.setdefault(block[state], state)
+    representative[block[start]] = start
+    merged = {}
+    for src, row in edges.items():
+        new_row = merged.setdefault(representative[block[src]], {})
+        for column, targets in row.items():
+            new_row.setdefault(column, set()).update(representative[block[dest]] for dest in targets)
+    return merged, {representative[block[state]] for state in accepting}
+
+
+def _simulation_reduce(edges, accepting, start):
+    """Quotient by simulation equivalence, then prune little-brother edges"""
+    states = sorted(edges)
+    index = {state: i for i, state in enumerate(states)}
+    size = len(states)
+    succ = [{} for _ in range(size)]   # column -> list of target ids
+    pred = {}                          # (column, target id) -> bitset of sources
+    for src, row in edges.items():
+        i = index[src]
+        for column, targets in row.items():
+            succ[i][column] = [index[dest] for dest in targets]
+            for dest in targets:
+                key = (column, index[dest])
+                pred[key] = pred.get(key, 0) | (1 << i)
+
+    # similar[q] = bitset of states p with q ⪯ p; start from the acceptance condition
+    all_bits = (1 << size) - 1
+    accept_bits = to_bits(index[state] for state in accepting)
+    similar = [accept_bits if states[i] in accepting else all_bits for i in range(size)]
+
+    def can_follow(column, target):
+        """Bitset of states with a `column` edge into a state simulating target"""
+        bits = 0
+        for p in members(similar[target]):
+            bits |= pred.get((column, p), 0)
+        return bits
+
+    # Every edge q -a-> t requires similar[q] ⊆ can_follow(a, t); check all
+    # edges once, then recheck the edges into t whenever similar[t] shrinks
+    incoming = [[] for _ in range(size)]
+    for q in range(size):
+        for column, targets in succ[q].items():
+            for target in targets:
+                incoming[target].append((q, column))
+    pending = set(range(size))
+    while pending:
+        target = pending.pop()
+        for q, column in incoming[target]:
+            narrowed = similar[q] & can_follow(column, target)
+            if narrowed != similar[q]:
+                similar[q] = narrowed
+                pending.add(q)
+
+    # Mutually similar states form one block
+    block = {}
+    for q in range(size):
+        for p in members(similar[q]):
+            if (similar[p] >> q) & 1 and p in block:
+                block[q] = block[p]
+                break
+        else:
+            block[q] = q
+    merged, merged_accepting = _quotient(edges, accepting, start, {states[q]: block[q] for q in range(size)})
+
+    # Keep only the maximal targets of each (state, symbol)
+    pruned = {}
+    for src, row in merged.items():
+        new_row = pruned[src] = {}
+        for column, targets in row.items():
+            ids = [index[dest] for dest in targets]
+            kept = {states[q] for q in ids
+                    if not any(p != q and (similar[q] >> p) & 1 and not (similar[p] >> q) & 1 for p in ids)}
+            new_row[column] = kept
+    return pruned, merged_accepting
@@ -1,6 +1,10 @@
+import re
+import time
 from engines.NFA import NFA
+from engines import STATS
+from engines.BUDGET import BudgetExceeded
 
-def regex_to_nfa(regex):
+def regex_to_nfa(regex, stats=None, budget=None):
     """
     🔤 Convert Regular Expression to NFA using Thompson's Construction
     
@@ -8,22 +12,53 @@ def regex_to_nfa(regex):
     - Basic symbols: a, b, c, ...
     - Union: |
     - Kleene star: *
+    - Bounded repetition: {m}, {m,}, {,n}, {m,n} (unrolled into copies)
     - Grouping: ()
     
     Args:
         regex: Regular expression string
+        stats: Optional STATS.Stats collecting states created and parse time
+        budget: Optional BUDGET.Budget; max_states bounds the NFA size
         
     Returns:
         NFA: Equivalent non-deterministic finite automaton
+        
+    Raises:
+        ValueError: If the regex cannot be parsed
+        BudgetExceeded: If the budget runs out or is cancelled
     """
+    stats = STATS.begin("regex_to_nfa", stats)
+    if budget is not None:
+        stats = budget.start("regex_to_nfa", stats)
     state_counter = 0
     
     def get_new_state():
         nonlocal state_counter
         state = f"q{state_counter}"
         state_counter += 1
+        if stats is not None and state_counter % 256 == 0:
+            stats.counters["states"] = state_counter
+            stats.checkpoint()
+            if budget is not None:
+                budget.check(stats)
         return state
     
+    def absorb(result, *parts):
+        """
+        Move the states and transitions of finished fragments into an
+        empty `result`. Fragments never share states and are not used
+        again, so the largest one's dicts are reused as they are and the
+        others are merged into them: no edge is copied more than once per
+        merge into a larger fragment, instead of once per enclosing
+        operator.
+        """
+        parts = sorted(parts, key=lambda part: len(part.states), reverse=True)
+        result.transitions = parts[0].transitions
+        result.states = parts[0].states
+        for part in parts[1:]:
+            result.transitions.update(part.transitions)
+            result.states |= part.states
+    
     def char_nfa(c):
         """Create NFA for a single character"""
         nfa = NFA()
@@ -45,6 +80,9 @@ def regex_to_nfa(regex):
         result.start_state = start
         result.accept_states = {end}
         
+        # Take over all transitions
+        absorb(result, nfa1, nfa2)
+        
         # Connect start to both NFAs
         result.add_transition(start, "", nfa1.start_state)
         result.add_transition(start, "", nfa2.start_state)
@@ -54,17 +92,6 @@ def regex_to_nfa(regex):
             result.add_transition(state, "", end)
         for state in nfa2.accept_states:
             result.add_transition(state, "", end)
-            
-        # Copy all transitions
-        for src in nfa1.transitions:
-            for symbol, destinations in nfa1.transitions[src].items():
-                for dest in destinations:
-                    result.add_transition(src, symbol, dest)
-                    
-        for src in nfa2.transitions:
-            for symbol, destinations in nfa2.transitions[src].items():
-                for dest in destinations:
-                    result.add_transition(src, symbol, dest)
         
         return result
     
@@ -74,17 +101,8 @@ def regex_to_nfa(regex):
         result.start_state = nfa1.start_state
         result.accept_states = nfa2.accept_states
         
-        # Copy all transitions from nfa1
-        for src in nfa1.transitions:
-            for symbol, destinations in nfa1.transitions[src].items():
-                for dest in destinations:
-                    result.add_transition(src, symbol, dest)
-        
-        # Copy all transitions from nfa2
-        for src in nfa2.transitions:
-            for symbol, destinations in nfa2.transitions[src].items():
-                for dest in destinations:
-                    result.add_transition(src, symbol, dest)
+        # Take over all transitions from nfa1 and nfa2
+        absorb(result, nfa1, nfa2)
         
         # Connect accept states of nfa1 to start state of nfa2
         for state in nfa1.accept_states:
@@ -101,18 +119,15 @@ def regex_to_nfa(regex):
         result.start_state = start
         result.accept_states = {end}
         
+        # Take over all transitions from original NFA
+        absorb(result, nfa)
+        
         # Connect start to end (empty string case)
         result.add_transition(start, "", end)
         
         # Connect start to original NFA
         result.add_transition(start, "", nfa.start_state)
         
-        # Copy all transitions from original NFA
-        for src in nfa.transitions:
-            for symbol, destinations in nfa.transitions[src].items():
-                for dest in destinations:
-                    result.add_transition(src, symbol, dest)
-        
         # Connect accept states back to start state of original NFA
         for state in nfa.accept_states:
             result.add_transition(state, "", nfa.start_state)
@@ -121,15 +136,138 @@ def regex_to_nfa(regex):
         
         return result
     
-    def parse(regex_str):
-        """Parse regex recursively using Thompson's construction"""
+    def empty_nfa():
+        """Create NFA for the empty string"""
+        nfa = NFA()
+        start = get_new_state()
+        nfa.start_state = start
+        nfa.accept_states = {start}
+        return nfa
+    
+    def copy_nfa(nfa):
+        """Create a copy of an NFA fragment with fresh state names"""
+        states = nfa.states | {nfa.start_state} | nfa.accept_states
+        names = {state: get_new_state() for state in sorted(states)}
+        result = NFA()
+        result.states = set(names.values())
+        result.start_state = names[nfa.start_state]
+        result.accept_states = {names[state] for state in nfa.accept_states}
+        for src, edges in nfa.transitions.items():
+            for symbol, destinations in edges.items():
+                for dest in destinations:
+                    result.add_transition(names[src], symbol, names[dest])
+        return result
+    
+    def repeat_nfa(nfa, low, high):
+        """
+        Create NFA for nfa{low,high} (high None = unbounded) by unrolling:
+        low copies, then either a starred copy or high - low nested
+        optional copies. The NFA grows with the bounds; engines/COUNTING.py
+        keeps one copy and a counter instead.
+        """
+        if high == 0:
+            return empty_nfa()
+        pieces = low + 1 if high is None else high
+        if stats is not None:
+            # Check the unrolled size up front, so that x{1000000} fails
+            # before any copy is made
+            stats.counters["states"] = state_counter + (pieces - 1) * (len(nfa.states) + 1) + 2 * pieces
+            stats.checkpoint()
+            if budget is not None:
+                budget.check(stats)
+        copies = [nfa] + [copy_nfa(nfa) for _ in range(pieces - 1)]
+        if high is None:
+            result = star_nfa(copies.pop())
+        else:
+            result = None
+            while len(copies) > low:
+                piece = copies.pop()
+                if result is not None:
+                    piece = concat_nfa(piece, result)
+                result = union_nfa(piece, empty_nfa())
+        while copies:
+            piece = copies.pop()
+            result = piece if result is None else concat_nfa(piece, result)
+        return result
+    
+    builder = {
+        "empty": empty_nfa,
+        "char": char_nfa,
+        "union": union_nfa,
+        "concat": concat_nfa,
+        "star": star_nfa,
+        "repeat": repeat_nfa,
+    }
+    
+    started = time.perf_counter()
+    try:
+        nfa = parse_regex(regex, builder)
+    except BudgetExceeded:
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to parse regex: {str(e)}")
+
+    if stats is not None:
+        stats.counters["parse_seconds"] = time.perf_counter() - started
+        stats.counters["states_created"] = state_counter
+        stats.counters["states"] = len(nfa.states)
+        stats.counters["regex_length"] = len(regex)
+        STATS.finish(stats)
+    return nfa
+
+
+
+# {m}, {m,}, {,n}, {m,n}; anything else starting with { is a literal
+REPETITION = re.compile(r"\{(\d*),(\d*)\}|\{(\d+)\}")
+
+
+def parse_regex(regex, builder):
+    """
+    🌳 Parse a regex and build its automaton bottom-up
+
+    The builder decides what an automaton fragment is, so the same parser
+    serves Thompson NFAs (regex_to_nfa) and counting automata
+    (COUNTING.regex_to_counting_nfa).
+
+    Args:
+        regex: Regular expression string
+        builder: Dict of fragment constructors: "empty"(), "char"(c),
+                 "union"(a, b), "concat"(a, b), "star"(a) and
+                 "repeat"(a, low, high) with high None when unbounded;
+                 optionally "group"(a, number) to wrap each parenthesized
+                 group, numbered 1, 2, ... by opening parenthesis as in re
+
+    Returns:
+        Fragment for the whole regex, as returned by the builder
+
+    Raises:
+        ValueError: If the regex cannot be parsed
+    """
+    def repetition(regex_str, i):
+        """(low, high, end) for a repetition at regex_str[i], or None"""
+        match = REPETITION.match(regex_str, i)
+        if match is None:
+            return None
+        if match.group(3) is not None:
+            low = high = int(match.group(3))
+        else:
+            low = int(match.group(1) or 0)
+            high = int(match.group(2)) if match.group(2) else None
+            if high is not None and high < low:
+                raise ValueError(f"Repetition {match.group(0)} has min > max")
+        return low, high, match.end()
+
+    # opened[i] = number of "(" before regex[i], for group numbering
+    opened = [0]
+    for c in regex:
+        opened.append(opened[-1] + (c == '('))
+    group = builder.get("group")
+
+    def parse(regex_str, offset):
+        """Parse regex recursively (regex_str starts at regex[offset])"""
         if not regex_str:
             # Empty regex
-            nfa = NFA()
-            start = get_new_state()
-            nfa.start_state = start
-            nfa.accept_states = {start}
-            return nfa
+            return builder["empty"]()
             
         # Try to find a union operation at the top level
         parenthesis_depth = 0
@@ -140,67 +278,51 @@ def regex_to_nfa(regex):
                 parenthesis_depth -= 1
             elif regex_str[i] == '|' and parenthesis_depth == 0:
                 # Found a top-level union
-                left = parse(regex_str[:i])
-                right = parse(regex_str[i+1:])
-                return union_nfa(left, right)
-        
-        # No top-level union, try to parse as concatenation
-        if len(regex_str) > 1:
-            # Check the first character and if it's followed by a star
-            if len(regex_str) > 1 and regex_str[1] == '*' and regex_str[0] != '(':
-                # Single char followed by star
-                char_nfa_obj = char_nfa(regex_str[0])
-                star_nfa_obj = star_nfa(char_nfa_obj)
-                
-                if len(regex_str) > 2:
-                    # More to parse after the star
-                    rest = parse(regex_str[2:])
-                    return concat_nfa(star_nfa_obj, rest)
-                else:
-                    return star_nfa_obj
+                left = parse(regex_str[:i], offset)
+                right = parse(regex_str[i+1:], offset + i + 1)
+                return builder["union"](left, right)
+        
+        # Single character
+        if len(regex_str) == 1:
+            return builder["char"](regex_str[0])
+        
+        # No top-level union, parse as concatenation: first a group or a
+        # single character, then at most one * or {m,n}, then the rest
+        if regex_str[0] == '(':
+            # Find the matching closing parenthesis
+            depth = 1
+            end = 1
+            while depth > 0 and end < len(regex_str):
+                if regex_str[end] == '(':
+                    depth += 1
+                elif regex_str[end] == ')':
+                    depth -= 1
+                end += 1
             
-            # Check if it starts with a group
-            elif regex_str[0] == '(':
-                # Find the matching closing parenthesis
-                depth = 1
-                closing_index = 1
-                while depth > 0 and closing_index < len(regex_str):
-                    if regex_str[closing_index] == '(':
-                        depth += 1
-                    elif regex_str[closing_index] == ')':
-                        depth -= 1
-                    closing_index += 1
-                
-                if depth != 0:
-                    raise ValueError(f"Unmatched parenthesis in regex: {regex_str}")
-                
-                # Parse the group
-                group_content = regex_str[1:closing_index-1]
-                group_nfa = parse(group_content)
-                
-                # Check if group is followed by star
-                if closing_index < len(regex_str) and regex_str[closing_index] == '*':
-                    group_nfa = star_nfa(group_nfa)
-                    closing_index += 1
-                
-                # If there's more after the group, concatenate
-                if closing_index < len(regex_str):
-                    rest = parse(regex_str[closing_index:])
-                    return concat_nfa(group_nfa, rest)
-                else:
-                    return group_nfa
+            if depth != 0:
+                raise ValueError(f"Unmatched parenthesis in regex: {regex_str}")
             
-            else:
-                # Simple concatenation of first char and the rest
-                first = char_nfa(regex_str[0])
-                rest = parse(regex_str[1:])
-                return concat_nfa(first, rest)
+            # Parse the group
+            atom = parse(regex_str[1:end-1], offset + 1)
+            if group is not None:
+                atom = group(atom, opened[offset] + 1)
+        else:
+            atom = builder["char"](regex_str[0])
+            end = 1
         
-        # Single character
-        return char_nfa(regex_str[0])
+        if end < len(regex_str) and regex_str[end] == '*':
+            atom = builder["star"](atom)
+            end += 1
+        else:
+            repeat = repetition(regex_str, end)
+            if repeat is not None:
+                low, high, end = repeat
+                atom = builder["repeat"](atom, low, high)
+        
+        # If there's more after the atom, concatenate
+        if end < len(regex_str):
+            rest = parse(regex_str[end:], offset + end)
+            return builder["concat"](atom, rest)
+        return atom
     
-    try:
-        return parse(regex)
-    except Exception as e:
-        raise ValueError(f"Failed to parse regex: {str(e)}")
-
+    return parse(regex, 0)
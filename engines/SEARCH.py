@@ -0,0 +1,211 @@
+from engines.NFA import NFA
+from engines.PREFILTER import analyze, live_states
+
+# Use one str.find per possible first symbol when there are at most this many
+MAX_FIND_SYMBOLS = 3
+
+# ===============================================================
+# 🔎 TWO-WAY SEARCH
+# ===============================================================
+# Searching for matches inside a longer text runs two compiled DFAs:
+# - forward: the unanchored DFA for Σ*L (without the empty match), which
+#   enters an accepting state exactly where some non-empty match ends
+# - backward: the DFA for reversed(L), run right-to-left from a match end
+#   to find the leftmost position where that match can start
+# No start positions are tracked during the forward scan; the backward
+# pass only reads the text between the previous match and the new end.
+# Whenever the forward scan is back in its start state (no match in
+# progress) it jumps ahead with str.find to the next occurrence of the
+# required prefix or of a possible first symbol, and stops early once the
+# required substring no longer occurs in the rest of the text.
+
+
+class Searcher:
+    """
+    🔎 Find matches of a DFA's language inside longer texts
+
+    Matches are reported with earliest-end semantics: scanning left to
+    right, a match is reported as soon as one ends, extended to its
+    leftmost start, and the scan restarts after it (matches never overlap).
+    Empty matches are not reported.
+
+    Attributes:
+        dfa: DFA for the language being searched
+        forward: CompiledDFA for Σ*L without the empty match
+        backward: CompiledDFA for reversed(L)
+        literals: PREFILTER.Literals used to skip input (None if disabled)
+    """
+
+    def __init__(self, automaton, prefilter=True, stats=None, budget=None):
+        """
+        🏗️ Build the forward and backward scanners
+
+        Both scanners come from subset constructions (the backward one
+        from reversing the DFA), which can blow up exponentially, so pass a
+        budget for untrusted patterns.
+
+        Args:
+            automaton: DFA or NFA for the pattern language
+            prefilter: Skip ahead with str.find using required literals
+            stats: Optional STATS.Stats passed to every construction
+            budget: Optional BUDGET.Budget; max_states bounds each DFA built
+
+        Raises:
+            BudgetExceeded: If the budget runs out or is cancelled
+        """
+        dfa = automaton.to_dfa(stats, budget) if isinstance(automaton, NFA) else automaton
+        self.dfa = dfa
+        self.forward = _unanchored(dfa, stats, budget).compile()
+        self.backward = dfa.reverse(stats, budget).compile()
+        self.literals = analyze(dfa) if prefilter else None
+
+    def ends(self, text):
+        """
+        🏁 Find every position where some match ends (overlapping)
+
+        Args:
+            text: Text to search
+
+        Yields:
+            int: End positions e such that text[s:e] matches for some s < e
+        """
+        yield from self._ends(text, 0, restart=False)
+
+    def spans(self, text):
+        """
+        📏 Find non-overlapping matches
+
+        Args:
+            text: Text to search
+
+        Yields:
+            tuple: (start, end) with text[start:end] in the language
+        """
+        bound = 0
+        for end in self._ends(text, 0, restart=True):
+            if end < bound:
+                continue
+            start = self._leftmost_start(text, end, bound)
+            if start is None:
+                continue
+            yield start, end
+            bound = end
+
+    def search(self, text):
+        """
+        🔍 Find the first (earliest-ending) match
+
+        Args:
+            text: Text to search
+
+        Returns:
+            tuple or None: (start, end) of the first match, None if there is none
+        """
+        return next(self.spans(text), None)
+
+    def _ends(self, text, position, restart):
+        """Forward scan from `position`; with `restart`, each reported end starts a fresh scan"""
+        compiled = self.forward
+        table = compiled.table
+        width = len(compiled.symbols)
+        columns = compiled.symbol_index
+        accepting = compiled.accepting
+        start = compiled.start
+        skip = self._skipper(text)
+        state = start
+        i = position
+        length = len(text)
+        while i < length:
+            if state == start and skip is not None:
+                i = skip(i)
+                if i < 0:
+                    return
+            column = columns.get(text[i])
+            # A symbol outside the alphabet cannot be part of any match
+            state = table[state * width + column] if column is not None else start
+            i += 1
+            if accepting[state]:
+                yield i
+                if restart:
+                    state = start
+
+    def _skipper(self, text):
+        """
+        Build skip(i) -> first position >= i where a match can start, or
+        -1 if no match can start at or after i; None when nothing helps
+        """
+        literals = self.literals
+        if literals is None:
+            return None
+        prefix, required = literals.prefix, literals.required
+        symbols = sorted(literals.first)
+        if not prefix and not required and (not symbols or len(symbols) > MAX_FIND_SYMBOLS):
+            return None
+        # Position of the next occurrence of the required substring, reused
+        # until the scan passes it
+        found = [-1]
+
+        def skip(i):
+            if required and found[0] < i:
+                found[0] = text.find(required, i)
+                if found[0] < 0:
+                    return -1
+            if prefix:
+                return text.find(prefix, i)
+            if len(symbols) > MAX_FIND_SYMBOLS:
+                return i
+            positions = [p for p in (text.find(symbol, i) for symbol in symbols) if p >= 0]
+            return min(positions) if positions else -1
+
+        return skip
+
+    def _leftmost_start(self, text, end, bound):
+        """Run the reversed DFA backwards from `end`; leftmost accepting position >= bound, excluding end"""
+        compiled = self.backward
+        table = compiled.table
+        width = len(compiled.symbols)
+        columns = compiled.symbol_index
+        accepting = compiled.accepting
+        state = compiled.start
+        best = None
+        for i in range(end - 1, bound - 1, -1):
+            column = columns.get(text[i])
+            if column is None:
+                break
+            state = table[state * width + column]
+            if state < 0:
+                break
+            if accepting[state]:
+                best = i
+        return best
+
+
+def _unanchored(dfa, stats=None, budget=None):
+    """
+    DFA for Σ*(L - {ε}): a fresh start state loops on every symbol and
+    then moves like the DFA's start state, but is never accepting itself
+    (stats and budget are passed to the subset construction)
+    """
+    nfa = NFA()
+    start = "any_start"
+    while start in dfa.states:
+        start += "'"
+    nfa.start_state = start
+    nfa.states.update(dfa.states | {start})
+    nfa.accept_states = set(dfa.accept_states)
+    for symbol in dfa.alphabet:
+        nfa.add_transition(start, symbol, start)
+    # Dead states are dropped so the scan returns to its start state (and
+    # can skip ahead) as soon as no match is in progress
+    compiled = dfa.compile()
+    alive = {compiled.names[state] for state, flag in enumerate(live_states(compiled)) if flag}
+    for src, edges in dfa.transitions.items():
+        if src not in alive:
+            continue
+        for symbol, dest in edges.items():
+            if dest not in alive:
+                continue
+            nfa.add_transition(src, symbol, dest)
+            if src == dfa.start_state:
+                nfa.add_transition(start, symbol, dest)
+    return nfa.to_dfa(stats, budget)
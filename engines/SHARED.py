@@ -0,0 +1,358 @@
+import getpass
+import hashlib
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import threading
+from collections.abc import Sequence
+
+from engines.COMPILED import CompiledDFA
+
+# ===============================================================
+# 🧷 SHARED-MEMORY TABLE REGISTRY
+# ===============================================================
+# Compiled transition tables are written once to a file in a shared
+# directory (/dev/shm when it exists, so the pages live in RAM) and
+# memory-mapped read-only by every process that needs them. All
+# processes on the machine then share one physical copy per automaton
+# instead of each holding its own dict-of-dicts DFA.
+#
+# File layout (little-endian, one file per key):
+#   header:    MAGIC, num_states, num_symbols, length of the names
+#              section, length of the symbols JSON (all uint32)
+#   table:     num_states * num_symbols int32 entries (-1 = no transition)
+#   accepting: num_states bytes
+#   names:     num_states + 1 uint32 offsets, then the UTF-8 names
+#              back to back (name i is bytes offsets[i]:offsets[i + 1])
+#   symbols:   UTF-8 JSON list
+#
+# Names are decoded one at a time when looked up, so attaching a large
+# table costs no per-state work; matching never needs them.
+#
+# Files are named after the automaton's canonical hash. publish() always
+# writes a fresh temporary file and renames it over the path, so a file
+# planted or left behind at that (predictable) path is never trusted,
+# and concurrent publishers of the same automaton are harmless. The
+# directory is created private to the user (mode 0700) and refused if
+# someone else owns it or can write to it. A file lives until the publishing
+# registry releases its last reference; processes that still have it
+# mapped keep working after that (the kernel frees the pages when the
+# last mapping goes away).
+
+MAGIC = b"ADF2"
+HEADER = struct.Struct("<4s4I")
+SUFFIX = ".dfa"
+
+
+def default_directory():
+    """
+    📁 Directory used when none is given
+
+    AUTOMATA_SHARED_DIR if set, else a per-user folder in /dev/shm (or the
+    temp directory where /dev/shm does not exist). Spawned workers inherit
+    the environment, so they resolve the same directory as their parent.
+    """
+    directory = os.environ.get("AUTOMATA_SHARED_DIR")
+    if directory:
+        return directory
+    root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(root, f"automata-{getpass.getuser()}")
+
+
+def _secure_directory(directory):
+    """Create the directory private to this user, or check an existing one"""
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.stat(directory)
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & 0o022):
+        raise PermissionError(f"{directory} must be owned by this user and not writable by others")
+
+
+def _encode_names(names):
+    """Offset-indexed names section"""
+    encoded = [str(name).encode("utf-8") for name in names]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+def _encode(compiled):
+    """Serialize a CompiledDFA to the shared file layout"""
+    names = _encode_names(compiled.names)
+    symbols = json.dumps([str(symbol) for symbol in compiled.symbols]).encode("utf-8")
+    table = compiled.table
+    if not isinstance(table, memoryview):
+        table = memoryview(table)
+    header = HEADER.pack(MAGIC, compiled.num_states, len(compiled.symbols), len(names), len(symbols))
+    return b"".join((header, table.cast("B"), bytes(compiled.accepting), names, symbols))
+
+
+class SharedRegistry:
+    """
+    🧷 Publish compiled tables to shared memory and map them read-only
+
+    The publishing process calls publish() / release(); worker processes
+    call attach() / detach() with the key. Both sides are reference
+    counted per registry instance, never across processes: a key
+    published twice needs two releases before its file is removed, and a
+    key attached twice is mapped once and unmapped after the second
+    detach. The publisher's last release() removes the file even while
+    other processes have it attached; their mappings keep working, but
+    later attach() calls raise KeyError, so keep a table published for
+    as long as workers may still need it.
+
+    Instances pickle to just their directory, so a registry can be passed
+    to pool workers; the worker's copy starts with no references.
+
+    Attributes:
+        directory: Folder holding the shared table files
+    """
+
+    def __init__(self, directory=None):
+        """
+        🔧 Initialize the registry
+
+        Args:
+            directory: Folder for the table files (default_directory() if None)
+        """
+        self.directory = directory or default_directory()
+        self._published = {}
+        self._attached = {}
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        return SharedRegistry, (self.directory,)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def publish(self, automaton):
+        """
+        📤 Write an automaton's compiled table to shared memory
+
+        Args:
+            automaton: DFA or CompiledDFA
+
+        Returns:
+            str: Key to pass to attach() in other processes
+
+        Raises:
+            PermissionError: If the directory belongs to another user or
+                             is writable by others
+        """
+        if isinstance(automaton, CompiledDFA):
+            data = _encode(automaton)
+            key = hashlib.sha256(data).hexdigest()
+        else:
+            key = automaton.canonical_hash()
+            data = None
+        with self._lock:
+            if key in self._published:
+                self._published[key] += 1
+                return key
+            if data is None:
+                data = _encode(automaton.compile())
+            _secure_directory(self.directory)
+            handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as f:
+                    f.write(data)
+                os.replace(temporary, self._path(key))
+            except BaseException:
+                os.unlink(temporary)
+                raise
+            self._published[key] = 1
+        return key
+
+    def release(self, key):
+        """
+        🗑️ Drop one publish() reference; the file is removed at zero
+
+        Args:
+            key: Key returned by publish()
+
+        Raises:
+            KeyError: If this registry holds no reference to the key
+        """
+        with self._lock:
+            count = self._published[key] - 1
+            if count:
+                self._published[key] = count
+                return
+            del self._published[key]
+            try:
+                os.unlink(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def attach(self, key):
+        """
+        📎 Map a published table read-only
+
+        Args:
+            key: Key returned by publish() in any process
+
+        Returns:
+            CompiledDFA: View whose table and accepting flags are read-only
+                         memoryviews over the shared mapping; do not use it
+                         after the matching detach()
+
+        Raises:
+            KeyError: If no table is published under the key
+            ValueError: If the file is not a shared table (bad header or
+                        size, a symlink, or owned by another user)
+        """
+        with self._lock:
+            mapped = self._attached.get(key)
+            if mapped is not None:
+                mapped[2] += 1
+                return mapped[0]
+            flags = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0)
+            try:
+                handle = os.open(self._path(key), flags)
+            except FileNotFoundError:
+                raise KeyError(f"No shared automaton: {key}") from None
+            except OSError as e:
+                # ELOOP: the path is a symlink
+                raise ValueError(f"Not a shared automaton table: {e}") from None
+            with os.fdopen(handle, "rb") as f:
+                info = os.fstat(f.fileno())
+                if not stat.S_ISREG(info.st_mode) or (hasattr(os, "getuid") and info.st_uid != os.getuid()):
+                    raise ValueError("Shared table file is not a regular file owned by this user")
+                if info.st_size < HEADER.size:
+                    raise ValueError("Shared table file is truncated")
+                memory = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                compiled, views = _view(memory)
+            except ValueError:
+                memory.close()
+                raise
+            self._attached[key] = [compiled, (memory, views), 1]
+            return compiled
+
+    def detach(self, key):
+        """
+        📎 Drop one attach() reference; the mapping is closed at zero
+
+        Args:
+            key: Key passed to attach()
+
+        Raises:
+            KeyError: If this registry has not attached the key
+        """
+        with self._lock:
+            mapped = self._attached[key]
+            mapped[2] -= 1
+            if mapped[2]:
+                return
+            del self._attached[key]
+        memory, views = mapped[1]
+        for view in views:
+            view.release()
+        memory.close()
+
+    def keys(self):
+        """
+        🔑 Keys of every table currently in the shared directory
+
+        Returns:
+            list: Sorted keys
+        """
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(name[:-len(SUFFIX)] for name in names if name.endswith(SUFFIX))
+
+    def close(self):
+        """🛑 Detach every mapping and release every published table"""
+        for key in list(self._attached):
+            self._attached[key][2] = 1
+            self.detach(key)
+        for key in list(self._published):
+            self._published[key] = 1
+            self.release(key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Names(Sequence):
+    """State names read from the offset-indexed names section on demand"""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("state id out of range")
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+
+def _view(memory):
+    """CompiledDFA over a mapped table file, plus the memoryviews to release"""
+    if len(memory) < HEADER.size:
+        raise ValueError("Shared table file is truncated")
+    magic, num_states, width, names_len, symbols_len = HEADER.unpack_from(memory, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a shared automaton table")
+    table_end = HEADER.size + 4 * num_states * width
+    accepting_end = table_end + num_states
+    if len(memory) != accepting_end + names_len + symbols_len:
+        raise ValueError("Shared table file is truncated")
+    names_start = accepting_end + 4 * (num_states + 1)
+    names_end = accepting_end + names_len
+    if names_start > names_end:
+        raise ValueError("Shared table file is truncated")
+    first, = struct.unpack_from("<I", memory, accepting_end)
+    last, = struct.unpack_from("<I", memory, names_start - 4)
+    if first != 0 or last != names_end - names_start:
+        raise ValueError("Shared table file has a corrupt names section")
+    whole = memoryview(memory)
+    raw = whole[HEADER.size:table_end]
+    table = raw.cast("i")
+    accepting = whole[table_end:accepting_end]
+    raw_offsets = whole[accepting_end:names_start]
+    offsets = raw_offsets.cast("I")
+    blob = whole[names_start:names_end]
+    symbols = json.loads(memory[names_end:].decode("utf-8"))
+    compiled = CompiledDFA(_Names(offsets, blob), symbols, table, accepting)
+    return compiled, (table, raw, accepting, offsets, raw_offsets, blob, whole)
+
+
+_default = None
+
+
+def attach(key):
+    """
+    📎 Attach through a per-process registry on default_directory()
+
+    Convenient in pool workers: the mapping is made once per process and
+    reused by every later task for the same key (it stays mapped until
+    the worker exits).
+
+    Args:
+        key: Key returned by SharedRegistry.publish()
+
+    Returns:
+        CompiledDFA: Read-only view of the shared table
+    """
+    global _default
+    if _default is None:
+        _default = SharedRegistry()
+    mapped = _default._attached.get(key)
+    return mapped[0] if mapped is not None else _default.attach(key)
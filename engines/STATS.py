@@ -0,0 +1,146 @@
+import time
+
+# ===============================================================
+# 📊 ENGINE INSTRUMENTATION
+# ===============================================================
+# Registered sinks receive every finished Stats object. When no sink is
+# registered and the caller passes no Stats object, engines skip all
+# bookkeeping: begin() returns None and every hook is a single
+# `if stats is not None` test.
+_sinks = []
+
+
+class Stats:
+    """
+    📊 Counters collected while an engine operation runs
+
+    Attributes:
+        operation: Name of the instrumented operation, e.g. "dfa.minimize"
+        counters: Dict of named integer counters
+        series: Dict of named lists (one value per step/round)
+        elapsed: Wall time spent in the operation, in seconds
+    """
+
+    def __init__(self, operation=None, on_update=None):
+        """
+        🔧 Initialize an empty Stats object
+
+        Args:
+            operation: Operation name (filled in by the engine if omitted)
+            on_update: Optional callable(stats) invoked at engine checkpoints,
+                       e.g. once per refinement round, for live progress
+        """
+        self.operation = operation
+        self.counters = {}
+        self.series = {}
+        self.elapsed = 0.0
+        self.on_update = on_update
+        self._started = None
+
+    def incr(self, name, amount=1):
+        """➕ Increase counter `name` by `amount`"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def peak(self, name, value):
+        """📈 Keep the largest value seen for counter `name`"""
+        if value > self.counters.get(name, 0):
+            self.counters[name] = value
+
+    def record(self, name, value):
+        """📝 Append `value` to series `name`"""
+        self.series.setdefault(name, []).append(value)
+
+    def checkpoint(self):
+        """🔔 Notify the on_update callback, if any"""
+        if self.on_update is not None:
+            self.on_update(self)
+
+    def __getstate__(self):
+        # on_update is usually a closure; it is not sent across processes
+        state = self.__dict__.copy()
+        state["on_update"] = None
+        return state
+
+    def as_dict(self):
+        """📦 Plain-dict snapshot, suitable for JSON or metrics export"""
+        return {
+            "operation": self.operation,
+            "elapsed": self.elapsed,
+            "counters": dict(self.counters),
+            "series": {name: list(values) for name, values in self.series.items()},
+        }
+
+    def __repr__(self):
+        return f"Stats({self.operation!r}, elapsed={self.elapsed:.6f}, counters={self.counters})"
+
+
+def add_sink(sink):
+    """
+    🔌 Register a metrics sink
+
+    Args:
+        sink: Callable(stats) called after every instrumented operation
+    """
+    _sinks.append(sink)
+
+
+def remove_sink(sink):
+    """🔌 Unregister a sink added with add_sink()"""
+    _sinks.remove(sink)
+
+
+class capture:
+    """
+    🎣 Collect every Stats object produced inside a with-block
+
+    Example:
+        with capture() as collected:
+            dfa.minimize()
+        print(collected[0].counters)
+    """
+
+    def __init__(self):
+        self.collected = []
+
+    def __enter__(self):
+        add_sink(self.collected.append)
+        return self.collected
+
+    def __exit__(self, *exc):
+        remove_sink(self.collected.append)
+        return False
+
+
+def begin(operation, stats=None):
+    """
+    ▶️ Start instrumenting an operation
+
+    Args:
+        operation: Operation name
+        stats: Stats object supplied by the caller, or None
+
+    Returns:
+        Stats or None: The object to update, or None if instrumentation is off
+    """
+    if stats is None:
+        if not _sinks:
+            return None
+        stats = Stats(operation)
+    elif stats.operation is None:
+        stats.operation = operation
+    stats._started = time.perf_counter()
+    return stats
+
+
+def finish(stats):
+    """
+    ⏹️ Finish instrumenting an operation and publish it to the sinks
+
+    Args:
+        stats: Object returned by begin() (None is ignored)
+    """
+    if stats is None:
+        return
+    stats.elapsed += time.perf_counter() - stats._started
+    for sink in list(_sinks):
+        sink(stats)
@@ -0,0 +1,216 @@
+from array import array
+
+# ===============================================================
+# 🧵 SIMULATION TRACES
+# ===============================================================
+# Traces store configurations compactly and replay the automaton for
+# anything they did not store:
+# - DFA traces keep one int state id per sampled position.
+# - NFA traces keep active sets as bitsets: a full keyframe every
+#   KEYFRAME_INTERVAL samples and, in between, only the ids that entered
+#   or left the active set (the XOR with the previous sample).
+# With every=k only positions 0, k, 2k, ... are sampled, so memory is
+# O(len(input) / k) and configuration_at(i) replays at most k - 1 steps.
+
+KEYFRAME_INTERVAL = 256
+
+
+class DFATrace:
+    """
+    🧵 State sequence of one DFA run
+
+    Attributes:
+        input_str: The simulated input
+        every: Sampling interval
+        accepted: Whether the input was accepted
+    """
+
+    def __init__(self, compiled, input_str, every=1):
+        """
+        🏃 Run `compiled` on `input_str` and record the state sequence
+
+        Args:
+            compiled: CompiledDFA to run
+            input_str: Input string
+            every: Record the state every `every` positions
+        """
+        if every < 1:
+            raise ValueError(f"Sampling interval must be at least 1, got {every}")
+        self.compiled = compiled
+        self.input_str = input_str
+        self.every = every
+        self.samples = array("i", [compiled.start])
+
+        table = compiled.table
+        width = len(compiled.symbols)
+        columns = compiled.symbol_index
+        state = compiled.start
+        # Number of positions with a live state (the run may fall off early)
+        self.length = len(input_str) + 1
+        for i, symbol in enumerate(input_str, 1):
+            column = columns.get(symbol)
+            state = table[state * width + column] if column is not None else -1
+            if state < 0:
+                self.length = i
+                break
+            if i % every == 0:
+                self.samples.append(state)
+        self.final_state = state
+        self.accepted = state >= 0 and compiled.accepting[state] == 1
+
+    def __len__(self):
+        """Number of positions (input length + 1)"""
+        return len(self.input_str) + 1
+
+    def state_id_at(self, i):
+        """
+        🔢 State id after reading the first `i` symbols
+
+        Args:
+            i: Position, 0 <= i <= len(input_str)
+
+        Returns:
+            int: State id, or -1 if the run had already fallen off
+        """
+        if not 0 <= i < len(self):
+            raise IndexError(f"Position {i} is outside the trace (0..{len(self) - 1})")
+        if i >= self.length:
+            return -1
+        base = i // self.every
+        return self.compiled.run(self.input_str[base * self.every:i], self.samples[base])
+
+    def state_at(self, i):
+        """
+        📍 State name after reading the first `i` symbols
+
+        Args:
+            i: Position, 0 <= i <= len(input_str)
+
+        Returns:
+            State name, or None if the run had already fallen off
+        """
+        state = self.state_id_at(i)
+        return self.compiled.names[state] if state >= 0 else None
+
+    def replay(self):
+        """
+        ▶️ Replay the run step by step
+
+        Yields:
+            tuple: (position, symbol read or None at position 0, state name or None)
+        """
+        compiled = self.compiled
+        state = compiled.start
+        yield 0, None, compiled.names[state]
+        for i, symbol in enumerate(self.input_str, 1):
+            state = compiled.step(state, symbol)
+            yield i, symbol, compiled.names[state] if state >= 0 else None
+
+
+class NFATrace:
+    """
+    🧵 Active-set sequence of one NFA run
+
+    Attributes:
+        input_str: The simulated input
+        every: Sampling interval
+        names: State names, index = bit position in the bitsets
+        accepted: Whether the input was accepted (set when the run ends)
+    """
+
+    def __init__(self, nfa, input_str, every=1):
+        """
+        🔧 Prepare an empty trace; NFA.simulate() fills it in
+
+        Args:
+            nfa: NFA being simulated
+            input_str: Input string
+            every: Record the active set every `every` positions
+        """
+        if every < 1:
+            raise ValueError(f"Sampling interval must be at least 1, got {every}")
+        self.nfa = nfa
+        self.input_str = input_str
+        self.every = every
+        # nfa.states may miss the start state or a transition endpoint
+        # (e.g. the NFA of the empty regex), but all of them can be active
+        states = set(nfa.states) | {nfa.start_state} | set(nfa.accept_states)
+        for src, edges in nfa.transitions.items():
+            states.add(src)
+            for destinations in edges.values():
+                states.update(destinations)
+        self.names = sorted(states, key=str)
+        self.ids = {state: i for i, state in enumerate(self.names)}
+        self.keyframes = []
+        # Smallest array type that can hold every state id
+        self.flips = array("B" if len(self.names) <= 0xFF else "H" if len(self.names) <= 0xFFFF else "i")
+        self.offsets = array("q", [0])
+        self.accepted = None
+        self._samples = 0
+        self._previous = set()
+
+    def record(self, position, active_states):
+        """
+        📝 Record the active set after reading `position` symbols
+
+        Args:
+            position: Number of symbols read so far
+            active_states: Set of active state names
+        """
+        if position % self.every:
+            return
+        current = {self.ids[state] for state in active_states}
+        if self._samples % KEYFRAME_INTERVAL == 0:
+            bits = 0
+            for state in current:
+                bits |= 1 << state
+            self.keyframes.append(bits)
+        else:
+            self.flips.extend(current ^ self._previous)
+        self.offsets.append(len(self.flips))
+        self._previous = current
+        self._samples += 1
+
+    def __len__(self):
+        """Number of positions (input length + 1)"""
+        return len(self.input_str) + 1
+
+    def _sample(self, index):
+        """Rebuild the set of active state ids for sample `index`"""
+        keyframe = index // KEYFRAME_INTERVAL
+        bits = self.keyframes[keyframe]
+        for j in range(keyframe * KEYFRAME_INTERVAL + 1, index + 1):
+            for state in self.flips[self.offsets[j]:self.offsets[j + 1]]:
+                bits ^= 1 << state
+        return {i for i in range(len(self.names)) if bits >> i & 1}
+
+    def configuration_at(self, i):
+        """
+        📍 Active states after reading the first `i` symbols
+
+        Args:
+            i: Position, 0 <= i <= len(input_str)
+
+        Returns:
+            frozenset: Active state names
+        """
+        if not 0 <= i < len(self):
+            raise IndexError(f"Position {i} is outside the trace (0..{len(self) - 1})")
+        base = i // self.every
+        active = {self.names[state] for state in self._sample(base)}
+        for symbol in self.input_str[base * self.every:i]:
+            active = self.nfa.step(active, symbol)
+        return frozenset(active)
+
+    def replay(self):
+        """
+        ▶️ Replay the run step by step
+
+        Yields:
+            tuple: (position, symbol read or None at position 0, frozenset of active states)
+        """
+        active = self.configuration_at(0)
+        yield 0, None, active
+        for i, symbol in enumerate(self.input_str, 1):
+            active = frozenset(self.nfa.step(active, symbol))
+            yield i, symbol, active
@@ -0,0 +1,11 @@
+"""
+🐛 Differential Fuzzing for Automata Theory Toolkit
+===================================================
+Generates random regexes and DFAs, runs the same inputs through every
+engine that should agree (Python's re, NFA simulation, subset-constructed
+DFAs, compiled tables and minimized automata) and shrinks any
+disagreement to a small reproducer.
+
+Run with:
+    python -m fuzz
+"""
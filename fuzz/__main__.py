@@ -0,0 +1,31 @@
+"""
+🐛 Command-line entry point: python -m fuzz
+"""
+
+import argparse
+import sys
+
+from fuzz import harness
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m fuzz",
+                                     description="Cross-check the automata engines on random inputs.")
+    parser.add_argument("-n", "--cases", type=int, default=200, help="Number of cases per kind (default: 200)")
+    parser.add_argument("--seed", type=int, default=0, help="First case seed (default: 0)")
+    parser.add_argument("--kind", choices=["regex", "dfa", "all"], default="all",
+                        help="Which generator to fuzz (default: all)")
+    parser.add_argument("--max-len", type=int, default=8, help="Longest input string (default: 8)")
+    parser.add_argument("--max-failures", type=int, default=10,
+                        help="Stop after this many failures (default: 10)")
+    args = parser.parse_args(argv)
+
+    kinds = ("regex", "dfa") if args.kind == "all" else (args.kind,)
+    failures, inputs, seconds = harness.run(args.cases, args.seed, kinds, args.max_len, args.max_failures)
+    print(f"{inputs} inputs checked in {seconds:.2f}s ({inputs / max(seconds, 1e-9):,.0f}/s), "
+          f"{len(failures)} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
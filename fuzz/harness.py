@@ -0,0 +1,603 @@
+"""
+🐛 Differential Fuzz Harness
+============================
+Every case is checked in batches: each engine evaluates the whole input
+list at once, so the compiled-table paths run at full speed and only the
+first disagreement is re-examined. Failing cases are shrunk greedily
+(shorter input, then smaller regex or fewer transitions) while the
+disagreement persists.
+"""
+
+import random
+import re
+import time
+
+from benchmarks import workloads
+from engines.CAPTURE import regex_to_program
+from engines.COUNTING import regex_to_counting_nfa
+from engines.COVERAGE import CoverageCorpus
+from engines.DFA import DFA
+from engines.LAZY import LazyDFA
+from engines.REGEX import REPETITION, parse_regex, regex_to_nfa
+
+REGEX_OPERATORS = set("()|*{},0123456789")
+
+# Python's re backtracks, so deeply nested stars such as (((a)*)*)* take
+# exponential time on rejected inputs; such patterns skip the "re" engine
+RE_MAX_STAR_DEPTH = 2
+
+
+# ===============================================================
+# ❌ FAILURES
+# ===============================================================
+class Failure:
+    """
+    ❌ A (shrunk) disagreement between engines
+
+    Attributes:
+        kind: "regex" or "dfa"
+        subject: The regex string or DFA that triggered it
+        input_str: Input on which the engines disagree (None for
+                   structural checks such as is_equivalent)
+        results: Dict mapping engine/check name to its result
+        seed: Seed of the case that first failed
+    """
+
+    def __init__(self, kind, subject, input_str, results, seed=None):
+        self.kind = kind
+        self.subject = subject
+        self.input_str = input_str
+        self.results = results
+        self.seed = seed
+
+    def __str__(self):
+        if self.kind == "regex":
+            subject = repr(self.subject)
+        else:
+            subject = (f"DFA(states={sorted(self.subject.states, key=str)}, "
+                       f"start={self.subject.start_state!r}, "
+                       f"accept={sorted(self.subject.accept_states, key=str)}, "
+                       f"transitions={self.subject.transitions})")
+        results = ", ".join(f"{name}={value}" for name, value in sorted(self.results.items()))
+        where = "" if self.input_str is None else f" on input {self.input_str!r}"
+        return f"[{self.kind} seed={self.seed}] {subject}{where}: {results}"
+
+
+# ===============================================================
+# ⚙️ ENGINES
+# ===============================================================
+def regex_engines(regex, nfa=None, dfa=None, program=None):
+    """
+    ⚙️ Build every acceptance path for a regex
+
+    The capture program's acceptance is left to span_engines() whenever
+    that compares spans (a span of None means rejected), so it is not
+    simulated twice.
+
+    Args:
+        regex: Regex in the syntax accepted by regex_to_nfa
+        nfa, dfa, program: Already built regex_to_nfa(regex), its to_dfa()
+                           and regex_to_program(regex), if the caller has them
+
+    Returns:
+        dict: Engine name -> function(list of strings) -> list of bools,
+              or None if Python's re rejects the pattern
+    """
+    try:
+        pattern = re.compile(regex)
+    except re.error:
+        return None
+    nfa = nfa or regex_to_nfa(regex)
+    dfa = dfa or nfa.to_dfa()
+    minimized = dfa.minimize()
+    compiled = dfa.compile()
+    compiled_minimized = minimized.compile()
+    compiled_nfa = nfa.compile()
+    reduced = nfa.reduce()
+    counting = regex_to_counting_nfa(regex)
+    program = program or regex_to_program(regex)
+    lazy = LazyDFA(compiled_nfa)
+    # Two-state cache with no flush allowance: every miss falls back to the NFA
+    thrashing = LazyDFA(compiled_nfa, max_states=2, max_flushes=0, min_symbols_per_state=1000)
+    engines = {
+        "nfa.simulate": lambda strings: [nfa.simulate(s) for s in strings],
+        "nfa.compiled": compiled_nfa.simulate_batch,
+        "nfa.reduced": lambda strings: [reduced.simulate(s) for s in strings],
+        "counting.simulate": lambda strings: [counting.simulate(s) for s in strings],
+        "lazy.simulate": lazy.simulate_batch,
+        "lazy.fallback": thrashing.simulate_batch,
+        "dfa.simulate": lambda strings: [dfa.simulate(s) for s in strings],
+        "dfa.compiled": compiled.simulate_batch,
+        "minimized.compiled": compiled_minimized.simulate_batch,
+    }
+    if not spans_checked(regex):
+        engines["capture.match"] = lambda strings: [program.match(s) is not None for s in strings]
+        engines["capture.pike"] = lambda strings: [program.pike_match(s) is not None for s in strings]
+    if star_depth(regex) <= RE_MAX_STAR_DEPTH:
+        engines["re"] = lambda strings: [pattern.fullmatch(s) is not None for s in strings]
+    return engines
+
+
+def spans_checked(regex):
+    """True if span_engines() compares this (re-valid) regex's spans with re"""
+    return star_depth(regex) <= RE_MAX_STAR_DEPTH and not nullable_loop(regex)
+
+
+def span_engines(regex, program=None):
+    """
+    🎯 Build the capture-span paths for a regex, with re as the reference
+
+    Regexes with a loop whose body can match empty are skipped: there the
+    Pike VM, like RE2, does not report re's final empty iteration (see
+    engines/CAPTURE.py). Their acceptance is still checked by the
+    capture engines of regex_engines().
+
+    Args:
+        regex: Regex in the syntax accepted by regex_to_nfa
+        program: Already built regex_to_program(regex), if any
+
+    Returns:
+        dict: Engine name -> function(list of strings) -> list of span
+              tuples (None for a rejected string), or None if re cannot
+              serve as the reference for this regex
+    """
+    try:
+        pattern = re.compile(regex)
+    except re.error:
+        return None
+    if not spans_checked(regex):
+        return None
+    program = program or regex_to_program(regex)
+
+    def spans(s):
+        match = pattern.fullmatch(s)
+        if match is None:
+            return None
+        return tuple(None if match.span(i) == (-1, -1) else match.span(i) for i in range(pattern.groups + 1))
+
+    return {
+        "capture.spans": lambda strings: [program.match(s) for s in strings],
+        "capture.pike.spans": lambda strings: [program.pike_match(s) for s in strings],
+        "re.spans": lambda strings: [spans(s) for s in strings],
+    }
+
+
+def nullable_loop(regex):
+    """
+    🔁 Whether a star or repetition can iterate over the empty string
+
+    Args:
+        regex: Regex string
+
+    Returns:
+        bool: True for e.g. (a*)*, (a|)* or (b*){2,3}
+    """
+    # Each fragment is (matches empty, contains a nullable loop)
+    builder = {
+        "empty": lambda: (True, False),
+        "char": lambda c: (False, False),
+        "union": lambda first, second: (first[0] or second[0], first[1] or second[1]),
+        "concat": lambda first, second: (first[0] and second[0], first[1] or second[1]),
+        "star": lambda body: (True, body[0] or body[1]),
+        "repeat": lambda body, low, high: (body[0] or low == 0, body[1] or (body[0] and high != 1)),
+    }
+    return parse_regex(regex, builder)[1]
+
+
+def star_depth(regex):
+    """
+    ⭐ Deepest nesting of starred subexpressions
+
+    Repetitions such as {2,3} count as stars: re backtracks on them too.
+
+    Args:
+        regex: Regex string
+
+    Returns:
+        int: 0 without stars, 1 for (ab)*, 2 for ((a)*b)*, ...
+    """
+    regex = REPETITION.sub("*", regex)
+    # stack[i] = deepest star nesting seen so far in the i-th open group
+    stack = [0]
+    previous = 0
+    for c in regex:
+        if c == "(":
+            stack.append(0)
+        elif c == ")" and len(stack) > 1:
+            previous = stack.pop()
+            stack[-1] = max(stack[-1], previous)
+            continue
+        elif c == "*":
+            stack[-1] = max(stack[-1], previous + 1)
+        previous = 0
+    return stack[0]
+
+
+def dfa_engines(dfa, minimized=None):
+    """
+    ⚙️ Build every acceptance path for a DFA
+
+    Args:
+        dfa: DFA instance
+        minimized: dfa.minimize(), if the caller has it
+
+    Returns:
+        dict: Engine name -> function(list of strings) -> list of bools
+    """
+    compiled = dfa.compile()
+    minimized = minimized or dfa.minimize()
+    compiled_minimized = minimized.compile()
+    round_trip = compiled.to_dfa()
+    return {
+        "dfa.simulate": lambda strings: [dfa.simulate(s) for s in strings],
+        "dfa.compiled": compiled.simulate_batch,
+        "compiled.to_dfa": lambda strings: [round_trip.simulate(s) for s in strings],
+        "minimized.simulate": lambda strings: [minimized.simulate(s) for s in strings],
+        "minimized.compiled": compiled_minimized.simulate_batch,
+    }
+
+
+def disagreement(engines, strings):
+    """
+    🔍 Find the first input on which the engines disagree
+
+    Args:
+        engines: Dict from regex_engines() or dfa_engines()
+        strings: List of inputs
+
+    Returns:
+        tuple: (input, {engine: result}) or None if all engines agree
+    """
+    columns = {name: run(strings) for name, run in engines.items()}
+    for i, s in enumerate(strings):
+        results = {name: column[i] for name, column in columns.items()}
+        if len(set(results.values())) > 1:
+            return s, results
+    return None
+
+
+def regex_checks(regex):
+    """
+    🧰 Build everything one regex case runs, each automaton only once
+
+    Args:
+        regex: Regex string
+
+    Returns:
+        tuple: (acceptance engines, span engines or None, DFA), or None
+               if Python's re rejects the pattern
+    """
+    try:
+        re.compile(regex)
+    except re.error:
+        return None
+    nfa = regex_to_nfa(regex)
+    dfa = nfa.to_dfa()
+    program = regex_to_program(regex)
+    return regex_engines(regex, nfa, dfa, program), span_engines(regex, program), dfa
+
+
+def regex_disagreement(checks, strings):
+    """
+    🔍 First disagreement on acceptance, then on capture spans
+
+    Args:
+        checks: Result of regex_checks() (None is allowed)
+        strings: List of inputs
+
+    Returns:
+        tuple: (input, {engine: result}) or None if all engines agree
+               (or re rejects the pattern)
+    """
+    if checks is None:
+        return None
+    engines, spans, _ = checks
+    found = disagreement(engines, strings)
+    if found is None and spans is not None:
+        found = disagreement(spans, strings)
+    return found
+
+
+def dfa_properties(dfa, minimized=None, corpus=None):
+    """
+    ⚖️ Structural checks that must hold for any DFA
+
+    Besides comparing the DFA with its minimized form, is_equivalent() is
+    checked against a mutant that differs in one transition: if either
+    coverage corpus tells them apart, they must not be reported equivalent.
+
+    Args:
+        dfa: DFA instance
+        minimized: dfa.minimize(), if the caller has it
+        corpus: CoverageCorpus.from_dfa(dfa), if the caller has it
+
+    Returns:
+        dict: Check name -> bool (all True when the engines are correct)
+    """
+    minimized = minimized or dfa.minimize()
+    corpus = corpus or CoverageCorpus.from_dfa(dfa)
+    other = mutant(dfa)
+    distinguishable = bool(corpus.run(other) or CoverageCorpus.from_dfa(other).run(dfa))
+    return {
+        "is_equivalent(self)": dfa.is_equivalent(dfa),
+        "is_equivalent(minimized)": dfa.is_equivalent(minimized),
+        "minimized.is_equivalent(self)": minimized.is_equivalent(dfa),
+        "coverage(minimized)": not corpus.run(minimized),
+        "is_equivalent(mutant)": not (distinguishable and dfa.is_equivalent(other)),
+        "mutant.is_equivalent(self)": not (distinguishable and other.is_equivalent(dfa)),
+    }
+
+
+def mutant(dfa):
+    """
+    🧬 Copy of a DFA with its last transition (in sorted order) removed
+
+    Args:
+        dfa: DFA instance
+
+    Returns:
+        DFA: The mutant, or an unchanged copy if there are no transitions
+    """
+    transitions = {state: dict(edges) for state, edges in dfa.transitions.items()}
+    edges = [(str(state), str(symbol), state, symbol)
+             for state, row in transitions.items() for symbol in row]
+    if edges:
+        _, _, state, symbol = max(edges)
+        del transitions[state][symbol]
+    return DFA(dfa.states, dfa.alphabet, dfa.start_state, dfa.accept_states, transitions)
+
+
+# ===============================================================
+# 🎯 INPUTS
+# ===============================================================
+def case_inputs(dfa, alphabet, rng, count, max_len, corpus=None):
+    """
+    🎯 Pick inputs for one case: random strings plus accepted strings
+    and the coverage corpus of `dfa`, so both outcomes are exercised
+
+    Args:
+        dfa: DFA used to find accepted and boundary strings
+        alphabet: Symbols for the random strings
+        rng: random.Random instance
+        count: Number of random strings
+        max_len: Longest random or enumerated string
+        corpus: CoverageCorpus.from_dfa(dfa), if the caller has it
+
+    Returns:
+        list: Distinct input strings
+    """
+    strings = {"".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+               for _ in range(count)}
+    strings.update(dfa.enumerate(max_len, limit=count))
+    strings.update((corpus or CoverageCorpus.from_dfa(dfa)).strings)
+    return sorted(strings, key=lambda s: (len(s), s))
+
+
+# ===============================================================
+# ✂️ SHRINKING
+# ===============================================================
+def shrink_string(fails, s):
+    """
+    ✂️ Shrink an input by deleting chunks while `fails` still holds
+
+    Args:
+        fails: Predicate on strings
+        s: Failing input
+
+    Returns:
+        str: A locally minimal failing input
+    """
+    chunk = max(1, len(s) // 2)
+    while chunk:
+        i = 0
+        while i < len(s):
+            candidate = s[:i] + s[i + chunk:]
+            if fails(candidate):
+                s = candidate
+            else:
+                i += chunk
+        chunk //= 2
+    return s
+
+
+def shrink_regex(fails, regex):
+    """
+    ✂️ Shrink a regex by deleting characters, operators and groups
+
+    Args:
+        fails: Predicate on regex strings (only called on valid patterns)
+        regex: Failing regex
+
+    Returns:
+        str: A locally minimal failing regex
+    """
+    progress = True
+    while progress:
+        progress = False
+        for candidate in _regex_candidates(regex):
+            if _valid_regex(candidate) and fails(candidate):
+                regex = candidate
+                progress = True
+                break
+    return regex
+
+
+def _regex_candidates(regex):
+    """Smaller variants: drop a group's parentheses, a group, or one character"""
+    stack = []
+    for i, c in enumerate(regex):
+        if c == "(":
+            stack.append(i)
+        elif c == ")" and stack:
+            start = stack.pop()
+            yield regex[:start] + regex[start + 1:i] + regex[i + 1:]
+            yield regex[:start] + regex[i + 1:]
+    for i in range(len(regex)):
+        yield regex[:i] + regex[i + 1:]
+
+
+def _valid_regex(regex):
+    """True if both Python's re and regex_to_nfa accept the pattern"""
+    if not regex or regex[0] == "*" or "(*" in regex or "|*" in regex or "**" in regex:
+        return False
+    try:
+        re.compile(regex)
+        regex_to_nfa(regex)
+    except (re.error, ValueError):
+        return False
+    return True
+
+
+def shrink_dfa(fails, dfa):
+    """
+    ✂️ Shrink a DFA by dropping transitions and accept states
+
+    Args:
+        fails: Predicate on DFAs
+        dfa: Failing DFA
+
+    Returns:
+        DFA: A locally minimal failing DFA
+    """
+    progress = True
+    while progress:
+        progress = False
+        for state in sorted(dfa.states, key=str):
+            for symbol in sorted(dfa.transitions.get(state, {}), key=str):
+                transitions = {s: dict(edges) for s, edges in dfa.transitions.items()}
+                del transitions[state][symbol]
+                candidate = DFA(dfa.states, dfa.alphabet, dfa.start_state, dfa.accept_states, transitions)
+                if fails(candidate):
+                    dfa, progress = candidate, True
+        for state in sorted(dfa.accept_states, key=str):
+            candidate = DFA(dfa.states, dfa.alphabet, dfa.start_state,
+                            dfa.accept_states - {state}, dfa.transitions)
+            if fails(candidate):
+                dfa, progress = candidate, True
+        # Drop states nothing points to any more
+        reachable = {s for s in dfa.states if s == dfa.start_state or
+                     any(s in edges.values() for edges in dfa.transitions.values())}
+        if reachable != dfa.states:
+            candidate = DFA(reachable, dfa.alphabet, dfa.start_state, dfa.accept_states & reachable,
+                            {s: edges for s, edges in dfa.transitions.items() if s in reachable})
+            if fails(candidate):
+                dfa, progress = candidate, True
+    return dfa
+
+
+# ===============================================================
+# 🏃 CASES
+# ===============================================================
+def check_regex(regex, rng, count=32, max_len=8, seed=None):
+    """
+    🔤 Fuzz one regex
+
+    Args:
+        regex: Regex to check
+        rng: random.Random instance for the inputs
+        count: Number of random inputs
+        max_len: Longest input
+        seed: Seed recorded in the failure
+
+    Returns:
+        tuple: (number of inputs checked, Failure or None)
+    """
+    checks = regex_checks(regex)
+    if checks is None:
+        return 0, None
+    alphabet = sorted(set(regex) - REGEX_OPERATORS) or ["a"]
+    strings = case_inputs(checks[2], alphabet, rng, count, max_len)
+    found = regex_disagreement(checks, strings)
+    if found is None:
+        return len(strings), None
+
+    def fails(candidate_regex, s):
+        return regex_disagreement(regex_checks(candidate_regex), [s]) is not None
+
+    s = shrink_string(lambda t: fails(regex, t), found[0])
+    regex = shrink_regex(lambda r: fails(r, s), regex)
+    s = shrink_string(lambda t: fails(regex, t), s)
+    _, results = regex_disagreement(regex_checks(regex), [s])
+    return len(strings), Failure("regex", regex, s, results, seed)
+
+
+def check_dfa(dfa, rng, count=32, max_len=8, seed=None):
+    """
+    🎲 Fuzz one DFA
+
+    Args:
+        dfa: DFA to check
+        rng: random.Random instance for the inputs
+        count: Number of random inputs
+        max_len: Longest input
+        seed: Seed recorded in the failure
+
+    Returns:
+        tuple: (number of inputs checked, Failure or None)
+    """
+    minimized = dfa.minimize()
+    corpus = CoverageCorpus.from_dfa(dfa)
+    properties = dfa_properties(dfa, minimized, corpus)
+    if not all(properties.values()):
+        def broken(candidate):
+            return not all(dfa_properties(candidate).values())
+        dfa = shrink_dfa(broken, dfa)
+        return 0, Failure("dfa", dfa, None, dfa_properties(dfa), seed)
+
+    alphabet = sorted(dfa.alphabet, key=str)
+    strings = case_inputs(dfa, alphabet, rng, count, max_len, corpus)
+    found = disagreement(dfa_engines(dfa, minimized), strings)
+    if found is None:
+        return len(strings), None
+
+    def fails(candidate, s):
+        return disagreement(dfa_engines(candidate), [s]) is not None
+
+    s = shrink_string(lambda t: fails(dfa, t), found[0])
+    dfa = shrink_dfa(lambda d: fails(d, s), dfa)
+    _, results = disagreement(dfa_engines(dfa), [s])
+    return len(strings), Failure("dfa", dfa, s, results, seed)
+
+
+def run(cases=200, seed=0, kinds=("regex", "dfa"), max_len=8, max_failures=10, report=print):
+    """
+    🏃 Run a fuzzing session
+
+    Case i uses seed + i, so any failure can be replayed on its own.
+
+    Args:
+        cases: Number of cases per kind
+        seed: First seed
+        kinds: Which generators to use ("regex" and/or "dfa")
+        max_len: Longest input string
+        max_failures: Stop after this many failures
+        report: Callback for progress lines (None to stay quiet)
+
+    Returns:
+        tuple: (list of Failure, number of inputs checked, seconds)
+    """
+    failures = []
+    inputs = 0
+    started = time.perf_counter()
+    for i in range(cases):
+        case_seed = seed + i
+        rng = random.Random(case_seed)
+        for kind in kinds:
+            if kind == "regex":
+                subject = workloads.random_regex(rng.randint(1, 12), rng.randint(1, 3), case_seed,
+                                                 max_repeat=2)
+                checked, failure = check_regex(subject, rng, max_len=max_len, seed=case_seed)
+            elif kind == "dfa":
+                subject = workloads.random_dfa(rng.randint(1, 10), rng.randint(1, 3), rng.random(),
+                                               rng.random(), case_seed)
+                checked, failure = check_dfa(subject, rng, max_len=max_len, seed=case_seed)
+            else:
+                raise ValueError(f"Unknown fuzz kind: {kind}")
+            inputs += checked
+            if failure is not None:
+                failures.append(failure)
+                if report:
+                    report(f"❌ {failure}")
+                if len(failures) >= max_failures:
+                    return failures, inputs, time.perf_counter() - started
+    return failures, inputs, time.perf_counter() - started
@@ -0,0 +1,241 @@
+"""
+🗺️ Graph Summaries for Large Automata
+=====================================
+Pure-Python helpers used by visualizeGraph.py: edge merging with compact
+range labels, and reduced views (SCC condensation, top-k hubs, the
+neighborhood of one state) for automata too large to draw in full.
+
+A "graph" here is a dict with keys states, start_state, accept_states
+and edges, where edges maps (src, dest) to a sorted list of symbols.
+"""
+
+from collections import deque
+
+EPSILON_LABEL = "ε"
+
+
+# ===================== EDGE MERGING =====================
+def merge_edges(transitions, nondeterministic=False):
+    """
+    🔗 Merge parallel transitions into one edge per (src, dest) pair
+
+    Args:
+        transitions: dict[src][symbol] = dest (DFA) or list of dests (NFA)
+        nondeterministic: True when the values are lists of destinations
+
+    Returns:
+        dict: (src, dest) -> sorted list of symbols ("" is epsilon)
+    """
+    edges = {}
+    for src, by_symbol in transitions.items():
+        for symbol, dests in by_symbol.items():
+            for dest in (dests if nondeterministic else [dests]):
+                edges.setdefault((src, dest), []).append(symbol)
+    for symbols in edges.values():
+        symbols.sort()
+    return edges
+
+
+def format_label(symbols):
+    """
+    🏷️ Format a symbol list as a compact label
+
+    Runs of three or more consecutive characters become ranges, e.g.
+    ["a", "b", "c", "d", "x"] -> "a-d,x"; epsilon is shown as ε.
+
+    Args:
+        symbols: Sorted list of symbols
+
+    Returns:
+        str: Edge label
+    """
+    parts = []
+    singles = [s for s in symbols if len(s) == 1]
+    others = [EPSILON_LABEL if s == "" else s for s in symbols if len(s) != 1]
+    i = 0
+    while i < len(singles):
+        j = i
+        while j + 1 < len(singles) and ord(singles[j + 1]) == ord(singles[j]) + 1:
+            j += 1
+        if j - i >= 2:
+            parts.append(f"{singles[i]}-{singles[j]}")
+        else:
+            parts.extend(singles[i:j + 1])
+        i = j + 1
+    return ",".join(others + parts)
+
+
+def build_graph(visual, nondeterministic=False):
+    """
+    🧱 Build a graph dict from get_visual_representation() output
+
+    Args:
+        visual: DFA or NFA visual representation
+        nondeterministic: True for NFA visuals
+
+    Returns:
+        dict: Graph with merged edges
+    """
+    return {
+        "states": list(visual["states"]),
+        "start_state": visual["start_state"],
+        "accept_states": set(visual["accept_states"]),
+        "edges": merge_edges(visual["transitions"], nondeterministic),
+    }
+
+
+# ===================== SUMMARIZED VIEWS =====================
+def strongly_connected_components(states, edges):
+    """
+    🔁 Tarjan's algorithm (iterative, safe for deep graphs)
+
+    Args:
+        states: Iterable of states
+        edges: Iterable of (src, dest) pairs
+
+    Returns:
+        list: Components as lists of states, in reverse topological order
+    """
+    successors = {state: [] for state in states}
+    for src, dest in edges:
+        successors.setdefault(src, []).append(dest)
+        successors.setdefault(dest, [])
+
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+
+    for root in successors:
+        if root in index:
+            continue
+        work = [(root, iter(successors[root]))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors[child])))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def condense(graph):
+    """
+    🧩 Collapse every strongly connected component into one node
+
+    Args:
+        graph: Graph dict
+
+    Returns:
+        dict: Graph whose states are component labels such as
+              "q3 +12" (a representative and the number of other members)
+    """
+    components = strongly_connected_components(graph["states"], graph["edges"])
+    owner = {}
+    names = []
+    for component in components:
+        representative = graph["start_state"] if graph["start_state"] in component else min(component, key=str)
+        name = str(representative) if len(component) == 1 else f"{representative} +{len(component) - 1}"
+        names.append(name)
+        for state in component:
+            owner[state] = name
+
+    edges = {}
+    for (src, dest), symbols in graph["edges"].items():
+        a, b = owner[src], owner[dest]
+        if a != b:
+            edges.setdefault((a, b), set()).update(symbols)
+    return {
+        "states": names,
+        "start_state": owner[graph["start_state"]],
+        "accept_states": {owner[s] for s in graph["accept_states"] if s in owner},
+        "edges": {pair: sorted(symbols) for pair, symbols in edges.items()},
+    }
+
+
+def _subgraph(graph, keep):
+    return {
+        "states": [s for s in graph["states"] if s in keep],
+        "start_state": graph["start_state"] if graph["start_state"] in keep else None,
+        "accept_states": {s for s in graph["accept_states"] if s in keep},
+        "edges": {(src, dest): symbols for (src, dest), symbols in graph["edges"].items()
+                  if src in keep and dest in keep},
+    }
+
+
+def top_hubs(graph, k=30):
+    """
+    🌟 Keep the k states with the highest in+out degree
+
+    Args:
+        graph: Graph dict
+        k: Number of states to keep (the start state is always kept)
+
+    Returns:
+        dict: Induced subgraph on the hubs
+    """
+    degree = {state: 0 for state in graph["states"]}
+    for (src, dest), symbols in graph["edges"].items():
+        degree[src] = degree.get(src, 0) + len(symbols)
+        degree[dest] = degree.get(dest, 0) + len(symbols)
+    hubs = set(sorted(degree, key=lambda s: (-degree[s], str(s)))[:k])
+    hubs.add(graph["start_state"])
+    return _subgraph(graph, hubs)
+
+
+def neighborhood(graph, center, radius=1):
+    """
+    🎯 Keep the states within `radius` edges of `center`, in either direction
+
+    Args:
+        graph: Graph dict
+        center: State to focus on
+        radius: Maximum distance
+
+    Returns:
+        dict: Induced subgraph around `center`
+    """
+    adjacent = {}
+    for src, dest in graph["edges"]:
+        adjacent.setdefault(src, set()).add(dest)
+        adjacent.setdefault(dest, set()).add(src)
+    distance = {center: 0}
+    queue = deque([center])
+    while queue:
+        state = queue.popleft()
+        if distance[state] == radius:
+            continue
+        for other in adjacent.get(state, ()):
+            if other not in distance:
+                distance[other] = distance[state] + 1
+                queue.append(other)
+    return _subgraph(graph, set(distance))
@@ -0,0 +1,286 @@
+"""
+🏭 Background Job Runner for Heavy Automata Operations
+======================================================
+Runs minimize / equivalence / regex compilation in a process pool so the
+Streamlit script thread never blocks on them. Finished results are kept
+in an LRU cache keyed by a hash of the job input (DFAs are hashed with
+DFA.canonical_hash(), so renamed copies share a job), and live progress
+is read from the engines' instrumentation counters. Workers go through
+engines.CACHE, whose disk tier (AUTOMATA_CACHE_DIR) they share.
+
+simulate_batch jobs never pickle their DFA: submit() publishes its
+compiled table once to shared memory (engines.SHARED, see share()) and
+the workers attach to that one read-only copy, so N workers hold a
+single table instead of N dict-of-dicts DFAs.
+
+This module does not import Streamlit; see helper/jobView.py for the
+page-side polling helper.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from engines import CACHE, SHARED, STATS
+from engines.DFA import DFA
+from engines.REGEX import regex_to_nfa
+from helper.limits import ui_budget
+
+PROGRESS_INTERVAL = 0.25  # seconds between progress updates from a worker
+MAX_CACHED_RESULTS = 128
+
+
+# ===============================================================
+# 🔑 JOB KEYS
+# ===============================================================
+def job_key(kind, *args):
+    """
+    🔑 Hash a job kind and its inputs
+
+    Args:
+        kind: Job kind ("minimize", "equivalent", "regex_to_nfa" or "simulate_batch")
+        *args: Job inputs (DFA instances or JSON-serializable values)
+
+    Returns:
+        str: Hex digest identifying the job
+    """
+    payload = [arg.canonical_hash() if isinstance(arg, DFA) else arg for arg in args]
+    text = json.dumps([kind, payload], sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _failed(future):
+    """True if a finished job raised or was cancelled"""
+    return future.done() and (future.cancelled() or future.exception() is not None)
+
+
+# ===============================================================
+# ⚙️ WORKER SIDE
+# ===============================================================
+def _minimize(dfa, stats):
+    return CACHE.minimize(dfa, stats=stats, budget=ui_budget())
+
+
+def _equivalent(dfa1, dfa2, stats):
+    return CACHE.is_equivalent(dfa1, dfa2, stats=stats, budget=ui_budget())
+
+
+def _regex_to_nfa(regex, stats):
+    return regex_to_nfa(regex, stats=stats, budget=ui_budget())
+
+
+def _simulate_batch(key, strings, stats):
+    # key is a SHARED key: submit() replaces the DFA argument with it
+    return SHARED.attach(key).simulate_batch(strings)
+
+
+JOB_KINDS = {
+    "minimize": _minimize,
+    "equivalent": _equivalent,
+    "regex_to_nfa": _regex_to_nfa,
+    "simulate_batch": _simulate_batch,
+}
+
+
+def _run(key, kind, args, progress):
+    """Worker entry point: run one job and stream its counters into `progress`"""
+    last = 0.0
+
+    def report(stats):
+        nonlocal last
+        now = time.monotonic()
+        if now - last >= PROGRESS_INTERVAL:
+            last = now
+            progress[key] = dict(stats.counters)
+
+    stats = STATS.Stats(on_update=report)
+    result = JOB_KINDS[kind](*args, stats)
+    return result, stats.as_dict()
+
+
+# ===============================================================
+# 🏭 JOB RUNNER
+# ===============================================================
+class JobStatus:
+    """
+    📋 Snapshot of a job
+
+    Attributes:
+        state: "running", "done" or "failed"
+        result: Operation result when done
+        error: Exception when failed
+        progress: Latest counters reported by the worker
+        stats: Final Stats.as_dict() when done
+    """
+
+    def __init__(self, state, result=None, error=None, progress=None, stats=None):
+        self.state = state
+        self.result = result
+        self.error = error
+        self.progress = progress or {}
+        self.stats = stats
+
+
+class JobRunner:
+    """
+    🏭 Submit heavy operations to a process pool and poll their status
+
+    Submitting the same input twice returns the same job, whether it is
+    still running or already finished, so page reruns never recompute.
+    Failed or cancelled jobs are not reused: submitting them again runs
+    them again (a time limit hit under load may well pass next time).
+    """
+
+    def __init__(self, max_workers=None, max_cached=MAX_CACHED_RESULTS):
+        """
+        🔧 Initialize the runner (processes are started lazily)
+
+        Args:
+            max_workers: Pool size (defaults to the number of CPUs)
+            max_cached: Number of finished jobs kept in the result cache
+        """
+        self.max_workers = max_workers
+        self.max_cached = max_cached
+        self._executor = None
+        self._manager = None
+        self._progress = None
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._shared = None
+        self._shared_keys = {}
+
+    def _start(self):
+        # "spawn" avoids forking a multi-threaded server process
+        context = multiprocessing.get_context("spawn")
+        self._manager = context.Manager()
+        self._progress = self._manager.dict()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+
+    def share(self, dfa):
+        """
+        🧷 Publish a DFA's compiled table to shared memory
+
+        The table stays published until shutdown(); sharing the same DFA
+        again just returns its key (without writing the file again).
+
+        Args:
+            dfa: DFA instance
+
+        Returns:
+            str: Shared key, e.g. for submit("simulate_batch", key, strings)
+        """
+        content = dfa.canonical_hash()
+        with self._lock:
+            if self._shared is None:
+                self._shared = SHARED.SharedRegistry()
+            key = self._shared_keys.get(content)
+            if key is None:
+                key = self._shared_keys[content] = self._shared.publish(dfa)
+            return key
+
+    def _restart(self):
+        """Replace a pool that lost a worker (BrokenProcessPool)"""
+        self._executor.shutdown(cancel_futures=True)
+        self._manager.shutdown()
+        self._start()
+
+    def submit(self, kind, *args):
+        """
+        📤 Submit a job unless an identical one is running or succeeded
+
+        Args:
+            kind: Key of JOB_KINDS
+            *args: Job inputs; for "simulate_batch", (DFA or shared key,
+                   list of strings)
+
+        Returns:
+            str: Job key to poll with status()
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        key = job_key(kind, *args)
+        if kind == "simulate_batch" and isinstance(args[0], DFA):
+            args = (self.share(args[0]),) + args[1:]
+        with self._lock:
+            future = self._jobs.get(key)
+            if future is not None and not _failed(future):
+                self._jobs.move_to_end(key)
+                return key
+            if self._executor is None:
+                self._start()
+            try:
+                future = self._executor.submit(_run, key, kind, args, self._progress)
+            except BrokenProcessPool:
+                self._restart()
+                future = self._executor.submit(_run, key, kind, args, self._progress)
+            self._jobs[key] = future
+            self._jobs.move_to_end(key)
+            self._evict()
+        return key
+
+    def _evict(self):
+        finished = [key for key, future in self._jobs.items() if future.done()]
+        for key in finished[:max(0, len(finished) - self.max_cached)]:
+            del self._jobs[key]
+
+    def status(self, key):
+        """
+        📋 Get the status of a submitted job
+
+        Args:
+            key: Key returned by submit()
+
+        Returns:
+            JobStatus or None: None if the key is unknown or was evicted
+        """
+        with self._lock:
+            future = self._jobs.get(key)
+        if future is None:
+            return None
+        if not future.done():
+            return JobStatus("running", progress=self._progress.get(key))
+        self._progress.pop(key, None)
+        if future.cancelled():
+            return JobStatus("failed", error=CancelledError("Job was cancelled"))
+        error = future.exception()
+        if error is not None:
+            return JobStatus("failed", error=error)
+        result, stats = future.result()
+        return JobStatus("done", result=result, progress=stats["counters"], stats=stats)
+
+    def wait(self, key, timeout=None):
+        """
+        ⏳ Block until a job finishes
+
+        Args:
+            key: Key returned by submit()
+            timeout: Maximum seconds to wait
+
+        Returns:
+            JobStatus or None: Final status (or "running" on timeout)
+        """
+        with self._lock:
+            future = self._jobs.get(key)
+        if future is None:
+            return None
+        try:
+            future.exception(timeout=timeout)
+        except TimeoutError:
+            pass
+        return self.status(key)
+
+    def shutdown(self):
+        """🛑 Stop the worker processes and release shared tables"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._manager.shutdown()
+            self._executor = self._manager = self._progress = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+            self._shared_keys = {}
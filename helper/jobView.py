@@ -0,0 +1,81 @@
+import time
+import streamlit as st
+from engines.BUDGET import BudgetExceeded
+from helper.jobRunner import JobRunner, job_key
+from helper.limits import describe
+
+POLL_INTERVAL = 0.5  # seconds between page reruns while a job is running
+
+
+@st.cache_resource
+def get_runner():
+    """🏭 One JobRunner shared by every session of this Streamlit server"""
+    return JobRunner()
+
+
+def track_job(name, message, kind, *args, start=False):
+    """
+    📡 Submit and poll a background job from a Streamlit page
+
+    The job key is remembered in st.session_state[name], so later reruns
+    keep showing the result for as long as the inputs are unchanged.
+    While the job runs, the page shows its progress counters and reruns
+    itself every POLL_INTERVAL seconds.
+
+    Args:
+        name: Session-state slot for this page's job
+        message: Spinner text while the job runs
+        kind: Job kind (see helper.jobRunner.JOB_KINDS)
+        *args: Job inputs
+        start: True when the user just asked to run the job
+
+    Returns:
+        Result of the job, or None if it is not started, running or failed
+    """
+    runner = get_runner()
+    key = job_key(kind, *args)
+    if start:
+        runner.submit(kind, *args)
+        st.session_state[name] = key
+    if st.session_state.get(name) != key:
+        return None
+
+    status = runner.status(key)
+    if status is None:
+        # Evicted from the result cache since it was started
+        runner.submit(kind, *args)
+        status = runner.status(key)
+
+    if status.state == "running":
+        with st.spinner(message):
+            if status.progress:
+                st.caption(" · ".join(f"{counter}: {value}" for counter, value in status.progress.items()))
+            time.sleep(POLL_INTERVAL)
+        st.rerun()
+
+    if status.state == "failed":
+        if isinstance(status.error, BudgetExceeded):
+            st.error(describe(status.error))
+        else:
+            st.error(f"❌ **Operation failed:** {status.error}")
+        return None
+    return status.result
+
+
+def is_new_result(name):
+    """
+    ✨ True the first time a finished job's result is shown in this session
+
+    Used to play one-off effects such as st.balloons() only once, not on
+    every rerun that redisplays a cached result.
+
+    Args:
+        name: Session-state slot passed to track_job()
+
+    Returns:
+        bool: Whether the current result has not been shown before
+    """
+    key = st.session_state.get(name)
+    seen = st.session_state.get(f"{name}_shown")
+    st.session_state[f"{name}_shown"] = key
+    return key is not None and key != seen
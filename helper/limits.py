@@ -0,0 +1,38 @@
+from engines.BUDGET import Budget
+
+# Limits applied to every heavy operation started from the web UI, so a
+# single pathological input cannot tie up a shared Streamlit worker.
+MAX_STATES = 20_000
+MAX_PAIRS = 2_000_000
+MAX_SECONDS = 30
+
+
+def ui_budget(token=None):
+    """
+    🛑 Create the budget used by the Streamlit tabs
+
+    Args:
+        token: Optional CancellationToken
+
+    Returns:
+        Budget: Fresh budget with the UI limits
+    """
+    return Budget(max_states=MAX_STATES, max_pairs=MAX_PAIRS,
+                  max_seconds=MAX_SECONDS, token=token)
+
+
+def describe(error):
+    """
+    📝 Format a BudgetExceeded error for display
+
+    Args:
+        error: BudgetExceeded instance
+
+    Returns:
+        str: Markdown message including the partial counters
+    """
+    message = f"⏱️ **Operation stopped:** {error}"
+    if error.stats is not None and error.stats.counters:
+        progress = ", ".join(f"{name}={value}" for name, value in error.stats.counters.items())
+        message += f"  \nProgress so far: {progress}"
+    return message
@@ -1,65 +1,115 @@
+import hashlib
+import os
 import streamlit as st
 import graphviz
+from engines.CACHE import ResultCache
+from helper.graphSummary import build_graph, condense, top_hubs, neighborhood, format_label
 
-def render_dfa(dfa_visual):
+# Automata with more states than this are shown as a summarized view
+MAX_RENDERED_STATES = int(os.environ.get("AUTOMATA_MAX_RENDERED_STATES", 150))
+
+# Server-side layouts (SVG) keyed on a hash of the DOT source
+_layout_cache = ResultCache(max_entries=64, directory=os.environ.get("AUTOMATA_LAYOUT_CACHE_DIR"))
+
+SUMMARY_VIEWS = ["🧩 SCC condensation", "🌟 Top hubs", "🎯 Neighborhood of a state"]
+
+
+def render_dfa(dfa_visual, key=None):
     """
-    Render DFA graph using Streamlit's graphviz_chart.
-    
+    Render DFA graph with Graphviz, merging parallel edges and
+    summarizing automata larger than MAX_RENDERED_STATES.
+
     Args:
         dfa_visual: Visual representation of DFA from get_visual_representation()
-        
+        key: Optional widget key prefix (needed when several graphs share a page)
+
     Displays:
-        A rendered graphviz chart in the Streamlit app.
+        A server-side rendered SVG (or a graphviz_chart if the Graphviz
+        binaries are missing) in the Streamlit app.
     """
-    dot = graphviz.Digraph()
-    dot.attr(rankdir='LR')
-
-    # Add states
-    for state in dfa_visual["states"]:
-        shape = 'doublecircle' if state in dfa_visual["accept_states"] else 'circle'
-        dot.node(state, shape=shape)
-    
-    # Add invisible start arrow
-    dot.node('start', shape='none', label='')
-    dot.edge('start', dfa_visual["start_state"])
-
-    # Add transitions
-    for src, edges in dfa_visual["transitions"].items():
-        for symbol, dest in edges.items():
-            dot.edge(src, dest, label=symbol)
-
-    # Display using Streamlit
-    st.graphviz_chart(dot)
+    _render_graph(build_graph(dfa_visual), key or "dfa")
 
 
-def render_nfa(nfa_visual):
+def render_nfa(nfa_visual, key=None):
     """
-    Render NFA graph using Streamlit's graphviz_chart.
-    
+    Render NFA graph with Graphviz, merging parallel edges and
+    summarizing automata larger than MAX_RENDERED_STATES.
+
     Args:
         nfa_visual: Visual representation of NFA from get_visual_representation()
-        
+        key: Optional widget key prefix (needed when several graphs share a page)
+
     Displays:
-        A rendered graphviz chart in the Streamlit app.
+        A server-side rendered SVG (or a graphviz_chart if the Graphviz
+        binaries are missing) in the Streamlit app.
     """
+    _render_graph(build_graph(nfa_visual, nondeterministic=True), key or "nfa")
+
+
+def _render_graph(graph, key):
+    """Draw a merged-edge graph, summarizing it first if it is too large"""
+    if len(graph["states"]) > MAX_RENDERED_STATES:
+        graph = _summarize(graph, key)
+    _show(_to_dot(graph))
+
+
+def _summarize(graph, key):
+    """Let the user pick a reduced view of a large automaton"""
+    st.info(f"ℹ️ This automaton has {len(graph['states'])} states; showing a summarized view "
+            f"(full graphs are drawn up to {MAX_RENDERED_STATES} states).")
+    view = st.radio("Summary view", SUMMARY_VIEWS, horizontal=True, key=f"{key}_summary_view")
+
+    if view == SUMMARY_VIEWS[0]:
+        summary = condense(graph)
+    elif view == SUMMARY_VIEWS[1]:
+        k = st.slider("Number of hubs", 5, MAX_RENDERED_STATES, min(30, MAX_RENDERED_STATES),
+                      key=f"{key}_hubs")
+        summary = top_hubs(graph, k)
+    else:
+        states = sorted(graph["states"], key=str)
+        center = st.selectbox("State", states, index=states.index(graph["start_state"]),
+                              key=f"{key}_center")
+        radius = st.slider("Radius", 1, 5, 1, key=f"{key}_radius")
+        summary = neighborhood(graph, center, radius)
+
+    if len(summary["states"]) > MAX_RENDERED_STATES:
+        st.caption(f"Summary still has {len(summary['states'])} nodes; "
+                   f"showing its {MAX_RENDERED_STATES} best-connected ones.")
+        summary = top_hubs(summary, MAX_RENDERED_STATES)
+    return summary
+
+
+def _to_dot(graph):
+    """Build a graphviz.Digraph with one edge per (src, dest) pair"""
     dot = graphviz.Digraph()
     dot.attr(rankdir='LR')
 
     # Add states
-    for state in nfa_visual["states"]:
-        shape = 'doublecircle' if state in nfa_visual["accept_states"] else 'circle'
-        dot.node(state, shape=shape)
+    for state in graph["states"]:
+        shape = 'doublecircle' if state in graph["accept_states"] else 'circle'
+        dot.node(str(state), shape=shape)
 
     # Add invisible start arrow
-    dot.node('start', shape='none', label='')
-    dot.edge('start', nfa_visual["start_state"])
-
-    # Add transitions
-    for src, transitions in nfa_visual["transitions"].items():
-        for symbol, dests in transitions.items():
-            symbol_display = 'ε' if symbol == "" else symbol
-            for dest in dests:
-                dot.edge(src, dest, label=symbol_display)
-
-    # Display using Streamlit
-    st.graphviz_chart(dot)
+    if graph["start_state"] is not None:
+        dot.node('start', shape='none', label='')
+        dot.edge('start', str(graph["start_state"]))
+
+    # Add transitions, one merged edge per pair of states
+    for (src, dest), symbols in graph["edges"].items():
+        dot.edge(str(src), str(dest), label=format_label(symbols))
+    return dot
+
+
+def _show(dot):
+    """Lay the graph out on the server once and reuse the SVG on reruns"""
+    key = hashlib.sha256(dot.source.encode("utf-8")).hexdigest()
+    svg = _layout_cache.get(key)
+    if svg is None:
+        try:
+            svg = dot.pipe(format="svg").decode("utf-8")
+        except graphviz.ExecutableNotFound:
+            # No Graphviz binaries on this host: let the browser lay it out
+            st.graphviz_chart(dot)
+            return
+        _layout_cache.put(key, svg)
+    st.image(svg, use_container_width=True)
@@ -1,21 +1,100 @@
+import math
+import numpy as np
+import pandas as pd
 import streamlit as st
 
-def render_table(dfa_visual):
-    table_header = ["State"] + sorted(dfa_visual["alphabet"]) + ["Accept State?"]
-    table_rows = []
-
-    for state in sorted(dfa_visual["states"]):
-        row = [f"**{state}**" + (" (start)" if state == dfa_visual["start_state"] else "")]
-        for symbol in sorted(dfa_visual["alphabet"]):
-            dest = dfa_visual["transitions"].get(state, {}).get(symbol, "∅")
-            row.append(dest)
-        row.append("✓" if state in dfa_visual["accept_states"] else "✗")
-        table_rows.append(row)
-
-    # Convert to markdown table
-    table_md = "| " + " | ".join(table_header) + " |\n"
-    table_md += "| " + " | ".join(["---"] * len(table_header)) + " |\n"
-    for row in table_rows:
-        table_md += "| " + " | ".join(map(str, row)) + " |\n"
-
-    st.markdown(table_md)
\ No newline at end of file
+PAGE_SIZE = 50
+EMPTY = "∅"
+
+
+def render_table(dfa, key="dfa_table"):
+    """
+    Render a DFA transition table as a paginated, filterable dataframe.
+
+    The table is built once per run from the compiled transition array;
+    state names are only materialized for the rows on the current page.
+
+    Args:
+        dfa: DFA instance
+        key: Widget key prefix (needed when several tables share a page)
+
+    Displays:
+        Filter widgets, a page selector and one page of the table.
+    """
+    compiled = dfa.compile()
+    names = [str(name) for name in compiled.names]
+    # -1 (missing transition) indexes the trailing "∅" entry
+    labels = np.array(names + [EMPTY], dtype=object)
+    codes = np.frombuffer(compiled.table, dtype=np.intc).reshape(compiled.num_states, len(compiled.symbols))
+
+    symbols, rows = _filters(names, compiled.symbols, key)
+    page = _paginate(rows, key)
+
+    frame = {"State": [names[i] + (" (start)" if i == compiled.start else "") for i in page]}
+    for symbol in symbols:
+        column = compiled.symbol_index[symbol]
+        frame[symbol] = labels[codes[page, column]]
+    frame["Accept State?"] = ["✓" if compiled.accepting[i] else "✗" for i in page]
+    st.dataframe(pd.DataFrame(frame), hide_index=True, use_container_width=True)
+
+
+def render_nfa_table(nfa_visual, key="nfa_table"):
+    """
+    Render an NFA transition table as a paginated, filterable dataframe.
+
+    Args:
+        nfa_visual: Visual representation of NFA from get_visual_representation()
+        key: Widget key prefix
+
+    Displays:
+        Filter widgets, a page selector and one page of the table.
+    """
+    names = [str(state) for state in nfa_visual["states"]]
+    states = list(nfa_visual["states"])
+    alphabet = sorted(nfa_visual["alphabet"]) + ["ε (epsilon)"]
+    accept_states = set(nfa_visual["accept_states"])
+
+    symbols, rows = _filters(names, alphabet, key)
+    page = _paginate(rows, key)
+
+    frame = {"State": [names[i] + (" (start)" if states[i] == nfa_visual["start_state"] else "")
+                       for i in page]}
+    for symbol in symbols:
+        raw = "" if symbol == "ε (epsilon)" else symbol
+        frame[symbol] = [
+            ", ".join(sorted(map(str, nfa_visual["transitions"].get(states[i], {}).get(raw, [])))) or EMPTY
+            for i in page
+        ]
+    frame["Accept State?"] = ["✓" if states[i] in accept_states else "✗" for i in page]
+    st.dataframe(pd.DataFrame(frame), hide_index=True, use_container_width=True)
+
+
+def _filters(names, symbols, key):
+    """State-name filter and symbol-column picker; returns (symbols, row ids)"""
+    col1, col2 = st.columns(2)
+    with col1:
+        query = st.text_input("🔍 Filter states", "", key=f"{key}_state_filter",
+                              placeholder="Part of a state name")
+    with col2:
+        chosen = st.multiselect("🔤 Symbols", symbols, default=symbols, key=f"{key}_symbols")
+
+    rows = sorted(range(len(names)), key=names.__getitem__)
+    if query:
+        rows = [i for i in rows if query in names[i]]
+    return chosen, np.array(rows, dtype=np.intp)
+
+
+def _paginate(rows, key):
+    """Page selector; returns the row ids on the selected page"""
+    pages = max(1, math.ceil(len(rows) / PAGE_SIZE))
+    page = 1
+    if pages > 1:
+        # Keep the remembered page valid when a filter shrinks the table
+        if st.session_state.get(f"{key}_page", 1) > pages:
+            st.session_state[f"{key}_page"] = pages
+        page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1,
+                               key=f"{key}_page")
+    start = (page - 1) * PAGE_SIZE
+    selected = rows[start:start + PAGE_SIZE]
+    st.caption(f"Showing {start + 1 if len(selected) else 0}–{start + len(selected)} of {len(rows)} states")
+    return selected
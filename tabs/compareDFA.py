@@ -2,6 +2,8 @@ import streamlit as st
 from helper.inputDFA import input_dfa
 from helper.visualizeTable import render_table
 from helper.visualizeGraph import render_dfa
+from engines.CACHE import visual_representation
+from helper.jobView import track_job, is_new_result
 
 def compare_dfa():
     st.markdown('<div class="logo-container">⚖️</div>', unsafe_allow_html=True)
@@ -20,12 +22,13 @@ def compare_dfa():
     with col2:
         compare_button = st.button("⚖️ Compare DFAs", type="primary", use_container_width=True)
 
-    if compare_button and dfa1 and dfa2:
-        with st.spinner('🔄 Comparing DFAs for equivalence...'):
-            equivalent = dfa1.is_equivalent(dfa2)
-
+    if dfa1 and dfa2:
+        equivalent = track_job("compare_job", '🔄 Comparing DFAs for equivalence...',
+                               "equivalent", dfa1, dfa2, start=compare_button)
+        if equivalent is not None:
             if equivalent:
-                st.balloons()
+                if is_new_result("compare_job"):
+                    st.balloons()
                 st.success("🎉 **EQUIVALENT!** Both DFAs accept the same language")
                 st.markdown("""
                 <div style="background: linear-gradient(135deg, #4ECDC4 0%, #44A08D 100%); padding: 20px; border-radius: 15px; color: white; text-align: center; margin: 20px 0;">
@@ -45,8 +48,8 @@ def compare_dfa():
             # --- Visualisasi kedua DFA ---
             st.markdown("### 🧭 Visual Comparison of Both DFAs")
 
-            vis1 = dfa1.get_visual_representation()
-            vis2 = dfa2.get_visual_representation()
+            vis1 = visual_representation(dfa1)
+            vis2 = visual_representation(dfa2)
 
             col_left, col_right = st.columns(2)
 
@@ -56,10 +59,10 @@ def compare_dfa():
                 st.metric("Accept States", len(vis1["accept_states"]))
                 st.metric("Complete DFA", "Yes" if vis1["is_complete"] else "No")
 
-                render_dfa(vis1)
+                render_dfa(vis1, key="compare_dfa1")
 
                 st.markdown("##### 🔄 Transition Table DFA 1")
-                render_table(vis1)
+                render_table(dfa1, key="compare_table1")
 
             with col_right:
                 st.markdown("#### 🅱️ DFA 2")
@@ -67,7 +70,7 @@ def compare_dfa():
                 st.metric("Accept States", len(vis2["accept_states"]))
                 st.metric("Complete DFA", "Yes" if vis2["is_complete"] else "No")
 
-                render_dfa(vis2)
+                render_dfa(vis2, key="compare_dfa2")
 
                 st.markdown("##### 🔄 Transition Table DFA 2")
-                render_table(vis2)
+                render_table(dfa2, key="compare_table2")
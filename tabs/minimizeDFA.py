@@ -1,6 +1,8 @@
 import streamlit as st
 from  helper.inputDFA import input_dfa
 from helper.visualizeGraph import render_dfa
+from engines.CACHE import visual_representation
+from helper.jobView import track_job
 
 def minimize_dfa():
     st.markdown('<div class="logo-container">🔽</div>', unsafe_allow_html=True)
@@ -20,13 +22,12 @@ def minimize_dfa():
         st.markdown("### ⚡ Actions")
         minimize_button = st.button("🔧 Minimize DFA", type="primary", use_container_width=True)
 
-    if minimize_button and dfa:
-        with st.spinner('🔄 Minimizing DFA...'):
-            minimized = dfa.minimize()
-
+    if dfa:
+        minimized = track_job("minimize_job", '🔄 Minimizing DFA...', "minimize", dfa, start=minimize_button)
+        if minimized is not None:
             st.markdown("## 🎯 Result Comparison")
-            vis1 = dfa.get_visual_representation()
-            vis2 = minimized.get_visual_representation()
+            vis1 = visual_representation(dfa)
+            vis2 = visual_representation(minimized)
 
             col1, col2 = st.columns(2)
 
@@ -34,13 +35,13 @@ def minimize_dfa():
                 st.markdown("### 🧾 Original DFA")
                 st.metric("States", len(dfa.states))
                 st.metric("Accept States", len(dfa.accept_states))
-                render_dfa(vis1)
+                render_dfa(vis1, key="minimize_original")
 
             with col2:
                 st.markdown("### ✨ Minimized DFA")
                 st.metric("States", len(minimized.states))
                 st.metric("Accept States", len(minimized.accept_states))
-                render_dfa(vis2)
+                render_dfa(vis2, key="minimize_result")
                 st.json({
                     "states": list(minimized.states),
                     "start_state": minimized.start_state,
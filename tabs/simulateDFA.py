@@ -1,7 +1,9 @@
 import streamlit as st
 from helper.inputDFA import input_dfa
 from helper.visualizeGraph import render_dfa
+from engines.CACHE import visual_representation
 from helper.visualizeTable import render_table 
+from helper.jobView import track_job
 
 
 # ===================== TAB FUNCTIONS =====================
@@ -27,7 +29,7 @@ def simulate_dfa():
         st.markdown("### 🔍 **DFA Structure Visualization**")
         
         # Get DFA visual representation
-        dfa_visual = dfa.get_visual_representation()
+        dfa_visual = visual_representation(dfa)
         
         # Display DFA statistics
         col1, col2, col3 = st.columns(3)
@@ -46,7 +48,7 @@ def simulate_dfa():
             
             # Display transition table
             st.markdown("#### Transition Table")
-            render_table(dfa_visual)
+            render_table(dfa)
     
     if test_button and dfa and test_string is not None:
         with st.spinner('🔄 Running DFA simulation...'):
@@ -57,3 +59,18 @@ def simulate_dfa():
             else:
                 st.error(f"❌ **REJECTED!** String '{test_string}' is not accepted by the DFA")
 
+    # Many strings at once run as a background job; the workers read the
+    # DFA's compiled table from shared memory instead of a pickled copy
+    st.markdown("---")
+    with st.expander("📋 **Test Many Strings**"):
+        batch_text = st.text_area("🔤 One string per line", "", key="batch_strings")
+        batch_button = st.button("🚀 Run Batch Simulation", key="batch_button")
+    if dfa:
+        strings = batch_text.splitlines()
+        results = track_job("batch_job", '🔄 Running batch simulation...', "simulate_batch",
+                            dfa, strings, start=batch_button and bool(strings))
+        if results is not None:
+            accepted = sum(results)
+            st.info(f"✅ {accepted} accepted · ❌ {len(results) - accepted} rejected")
+            st.dataframe({"String": strings, "Result": ["ACCEPTED" if r else "REJECTED" for r in results]},
+                         use_container_width=True)
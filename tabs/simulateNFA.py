@@ -1,6 +1,7 @@
 import streamlit as st
-from engines.REGEX import regex_to_nfa
 from helper.visualizeGraph import render_nfa
+from helper.visualizeTable import render_nfa_table
+from helper.jobView import track_job, is_new_result
 
 def simulate_nfa():
     st.markdown('<div class="logo-container">🔤</div>', unsafe_allow_html=True)
@@ -28,10 +29,13 @@ def simulate_nfa():
         st.markdown("<br><br>", unsafe_allow_html=True)
         convert_button = st.button("🔄 Convert & Test", type="primary", use_container_width=True)
 
-    if convert_button and regex:
+    nfa = None
+    if regex:
+        nfa = track_job("regex_job", '🔄 Converting regex to NFA...', "regex_to_nfa", regex, start=convert_button)
+
+    if nfa is not None:
         try:
-            with st.spinner('🔄 Converting regex to NFA and testing...'):
-                nfa = regex_to_nfa(regex)
+            with st.spinner('🔄 Testing string against the NFA...'):
                 result = nfa.simulate(test_string)
                 
                 col1, col2 = st.columns(2)
@@ -42,7 +46,8 @@ def simulate_nfa():
                 with col2:
                     st.markdown("### 🧪 **Test Result**")
                     if result:
-                        st.balloons()
+                        if is_new_result("regex_job"):
+                            st.balloons()
                         st.success(f"🎉 **ACCEPTED!** String '{test_string}' matches the regex")
                     else:
                         st.error(f"❌ **REJECTED!** String '{test_string}' does not match the regex")
@@ -71,40 +76,7 @@ def simulate_nfa():
 
                     # Display transition table
                     st.markdown("#### Transition Table")
-                    
-                    # Create a table of transitions
-                    alphabet_with_epsilon = list(nfa_visual["alphabet"]) + ["ε (epsilon)"]
-                    
-                    # Create header row
-                    table_header = ["State"] + alphabet_with_epsilon + ["Accept State?"]
-                    table_rows = []
-                    
-                    # Create rows for each state
-                    for state in sorted(nfa_visual["states"]):
-                        row = [f"**{state}**" + (" (start)" if state == nfa_visual["start_state"] else "")]
-                        
-                        # Add columns for each alphabet symbol
-                        for symbol in nfa_visual["alphabet"]:
-                            destinations = nfa_visual["transitions"].get(state, {}).get(symbol, [])
-                            row.append(", ".join(sorted(destinations)) if destinations else "∅")
-                        
-                        # Add epsilon transitions
-                        epsilon_destinations = nfa_visual["transitions"].get(state, {}).get("", [])
-                        row.append(", ".join(sorted(epsilon_destinations)) if epsilon_destinations else "∅")
-                        
-                        # Is it an accept state?
-                        row.append("✓" if state in nfa_visual["accept_states"] else "✗")
-                        
-                        table_rows.append(row)
-                    
-                    # Convert to markdown table
-                    table_md = "| " + " | ".join(table_header) + " |\n"
-                    table_md += "| " + " | ".join(["---"] * len(table_header)) + " |\n"
-                    
-                    for row in table_rows:
-                        table_md += "| " + " | ".join(map(str, row)) + " |\n"
-                    
-                    st.markdown(table_md)
+                    render_nfa_table(nfa_visual)
                     
                     # Visualize state transitions in text format
                     st.markdown("#### Transition Details")
@@ -127,5 +99,5 @@ def simulate_nfa():
                     st.json(nfa_visual)
                         
         except Exception as e:
-            st.error(f"❌ **Regex parsing failed:** {e}")
+            st.error(f"❌ **NFA simulation failed:** {e}")
             st.exception(e)
\ No newline at end of file